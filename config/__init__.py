@@ -15,6 +15,7 @@ from config.settings import (
     INFLUENCE_STRENGTHS,
     IMPACT_LEVELS,
     NEO4J_DEFAULTS,
+    NEO4J_DRIVER_SETTINGS,
     GRAPH_DEFAULTS,
     ANALYSIS_CACHE_TIMEOUT,
     # New schema-related exports
@@ -50,6 +51,7 @@ __all__ = [
     "INFLUENCE_STRENGTHS",
     "IMPACT_LEVELS",
     "NEO4J_DEFAULTS",
+    "NEO4J_DRIVER_SETTINGS",
     "NEO4J_DEFAULT_URI",
     "NEO4J_DEFAULT_USER",
     "NEO4J_DEFAULT_PASSWORD",
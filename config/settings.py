@@ -382,6 +382,16 @@ NEO4J_DEFAULTS = {
     "password": ""
 }
 
+# Driver tuning. Set RIM_NEO4J_DATABASE to name the database explicitly,
+# which saves the server a home-database resolution round-trip on every
+# session; unset (None), sessions use the user's home database.
+NEO4J_DRIVER_SETTINGS = {
+    "database": os.environ.get("RIM_NEO4J_DATABASE") or None,
+    "max_connection_pool_size": int(os.environ.get("RIM_NEO4J_POOL_SIZE", "50")),
+    "connection_acquisition_timeout": float(os.environ.get("RIM_NEO4J_ACQUISITION_TIMEOUT", "30")),
+    "max_connection_lifetime": 3600,
+}
+
 # Convenience exports for backward compatibility
 NEO4J_DEFAULT_URI = NEO4J_DEFAULTS["uri"]
 NEO4J_DEFAULT_USER = NEO4J_DEFAULTS["username"]
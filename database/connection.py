@@ -6,8 +6,70 @@ Provides connection handling, session management, and query execution.
 
 from typing import Optional, List, Dict, Any
 from contextlib import contextmanager
-from neo4j import GraphDatabase, Driver, Session
+from neo4j import GraphDatabase, Driver, Session, READ_ACCESS, WRITE_ACCESS
 from neo4j.exceptions import ServiceUnavailable, AuthError
+from config.settings import NEO4J_DRIVER_SETTINGS
+
+
+# Id lists above this size are split before being sent as ``IN`` parameters.
+ID_LIST_CHUNK_THRESHOLD = 10_000
+ID_LIST_CHUNK_SIZE = 5_000
+
+
+def normalize_ids(ids: List[str]) -> List[str]:
+    """
+    Deduplicate and sort an id list for use as an ``IN`` parameter.
+    
+    Sorting makes equivalent calls send identical parameters.
+    
+    Args:
+        ids: Ids, possibly with duplicates
+    
+    Returns:
+        Sorted list of unique ids
+    """
+    return sorted(set(ids))
+
+
+def chunk_ids(ids: List[str]) -> List[List[str]]:
+    """
+    Split a normalized id list into query-sized batches.
+    
+    Lists up to ID_LIST_CHUNK_THRESHOLD are returned as a single batch.
+    
+    Args:
+        ids: Normalized id list
+    
+    Returns:
+        List of id batches
+    """
+    if len(ids) <= ID_LIST_CHUNK_THRESHOLD:
+        return [ids]
+    return [ids[i:i + ID_LIST_CHUNK_SIZE] for i in range(0, len(ids), ID_LIST_CHUNK_SIZE)]
+
+
+class DatabaseBoundDriver:
+    """
+    View of a Neo4j driver whose sessions default to one database.
+
+    Query modules that take a driver (generic entities and relationships)
+    receive this instead of the raw driver, so their sessions target the
+    same database as ``Neo4jConnection.session()``.
+    """
+
+    __slots__ = ("_driver", "database")
+
+    def __init__(self, driver: Driver, database: Optional[str]):
+        self._driver = driver
+        self.database = database
+
+    def session(self, **config: Any) -> Session:
+        """Open a driver session, bound to ``database`` unless one is given."""
+        config.setdefault("database", self.database)
+        return self._driver.session(**config)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._driver, name)
 
 
 class Neo4jConnection:
@@ -18,7 +80,15 @@ class Neo4jConnection:
     and transaction handling.
     """
     
-    def __init__(self, uri: str, username: str, password: str):
+    def __init__(
+        self,
+        uri: str,
+        username: str,
+        password: str,
+        database: Optional[str] = None,
+        max_connection_pool_size: Optional[int] = None,
+        connection_acquisition_timeout: Optional[float] = None
+    ):
         """
         Initialize connection parameters.
         
@@ -26,10 +96,22 @@ class Neo4jConnection:
             uri: Neo4j connection URI (e.g., "bolt://localhost:7687")
             username: Database username
             password: Database password
+            database: Target database name (defaults to NEO4J_DRIVER_SETTINGS)
+            max_connection_pool_size: Driver pool size (defaults to NEO4J_DRIVER_SETTINGS)
+            connection_acquisition_timeout: Seconds to wait for a pooled
+                connection (defaults to NEO4J_DRIVER_SETTINGS)
         """
         self.uri = uri
         self.username = username
         self.password = password
+        self.database = database or NEO4J_DRIVER_SETTINGS["database"]
+        self.max_connection_pool_size = (
+            max_connection_pool_size or NEO4J_DRIVER_SETTINGS["max_connection_pool_size"]
+        )
+        self.connection_acquisition_timeout = (
+            connection_acquisition_timeout
+            or NEO4J_DRIVER_SETTINGS["connection_acquisition_timeout"]
+        )
         self._driver: Optional[Driver] = None
     
     @property
@@ -37,6 +119,13 @@ class Neo4jConnection:
         """Check if connection is active."""
         return self._driver is not None
     
+    @property
+    def driver(self) -> Optional[DatabaseBoundDriver]:
+        """The driver, with sessions bound to ``self.database`` (None if not connected)."""
+        if not self._driver:
+            return None
+        return DatabaseBoundDriver(self._driver, self.database)
+    
     def connect(self) -> bool:
         """
         Establish connection to Neo4j database.
@@ -50,7 +139,10 @@ class Neo4jConnection:
         try:
             self._driver = GraphDatabase.driver(
                 self.uri,
-                auth=(self.username, self.password)
+                auth=(self.username, self.password),
+                max_connection_pool_size=self.max_connection_pool_size,
+                connection_acquisition_timeout=self.connection_acquisition_timeout,
+                max_connection_lifetime=NEO4J_DRIVER_SETTINGS["max_connection_lifetime"]
             )
             # Verify connectivity
             self._driver.verify_connectivity()
@@ -78,10 +170,17 @@ class Neo4jConnection:
         self.close()
     
     @contextmanager
-    def session(self) -> Session:
+    def session(self, access_mode: str = WRITE_ACCESS) -> Session:
         """
         Get a database session as context manager.
         
+        The session is bound to ``self.database`` (the home database when
+        None), like the sessions of ``self.driver``.
+        
+        Args:
+            access_mode: READ_ACCESS or WRITE_ACCESS (routes reads to
+                followers on a cluster)
+        
         Yields:
             Neo4j Session object
         
@@ -91,19 +190,29 @@ class Neo4jConnection:
         if not self._driver:
             raise RuntimeError("Not connected to database. Call connect() first.")
         
-        session = self._driver.session()
+        session = self._driver.session(
+            database=self.database,
+            default_access_mode=access_mode
+        )
         try:
             yield session
         finally:
             session.close()
     
-    def execute_query(self, query: str, parameters: Optional[Dict[str, Any]] = None) -> List[Dict]:
+    def execute_query(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        **kwparameters: Any
+    ) -> List[Dict]:
         """
         Execute a Cypher query and return results as list of dictionaries.
         
         Args:
             query: Cypher query string
             parameters: Query parameters
+            **kwparameters: Query parameters passed as keywords; handed to
+                the driver as-is so single-value lookups need no dict
         
         Returns:
             List of result records as dictionaries
@@ -116,43 +225,55 @@ class Neo4jConnection:
             raise RuntimeError("Not connected to database. Call connect() first.")
         
         with self.session() as session:
-            result = session.run(query, parameters or {})
+            result = session.run(query, parameters, **kwparameters)
             return [dict(record) for record in result]
     
-    def execute_write(self, query: str, parameters: Optional[Dict[str, Any]] = None) -> List[Dict]:
+    def execute_write(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        **kwparameters: Any
+    ) -> List[Dict]:
         """
         Execute a write query within a transaction.
         
         Args:
             query: Cypher query string
             parameters: Query parameters
+            **kwparameters: Query parameters as keywords
         
         Returns:
             List of result records as dictionaries
         """
         def _execute(tx):
-            result = tx.run(query, parameters or {})
+            result = tx.run(query, parameters, **kwparameters)
             return [dict(record) for record in result]
         
         with self.session() as session:
             return session.execute_write(_execute)
     
-    def execute_read(self, query: str, parameters: Optional[Dict[str, Any]] = None) -> List[Dict]:
+    def execute_read(
+        self,
+        query: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        **kwparameters: Any
+    ) -> List[Dict]:
         """
         Execute a read query within a transaction.
         
         Args:
             query: Cypher query string
             parameters: Query parameters
+            **kwparameters: Query parameters as keywords
         
         Returns:
             List of result records as dictionaries
         """
         def _execute(tx):
-            result = tx.run(query, parameters or {})
+            result = tx.run(query, parameters, **kwparameters)
             return [dict(record) for record in result]
         
-        with self.session() as session:
+        with self.session(READ_ACCESS) as session:
             return session.execute_read(_execute)
 
 
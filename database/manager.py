@@ -5,9 +5,10 @@ Provides a unified interface for all database operations,
 maintaining backward compatibility with the existing application.
 """
 
+import functools
 from typing import List, Dict, Any, Optional
 from database.connection import Neo4jConnection
-from database.queries import risks, mitigations, influences, analysis, generic_entity, generic_relationship
+from database.queries import risks, mitigations, influences, analysis, generic_entity, generic_relationship, indexes
 
 
 class RiskGraphManager:
@@ -37,7 +38,7 @@ class RiskGraphManager:
     def driver(self):
         """Backward compatibility property for driver access."""
         if self._connection:
-            return self._connection._driver
+            return self._connection.driver
         return None
     
     def connect(self) -> bool:
@@ -50,6 +51,16 @@ class RiskGraphManager:
         try:
             self._connection = Neo4jConnection(self.uri, self.user, self.password)
             self._connection.connect()
+            # Idempotent — turns id / node_type lookups into index seeks
+            index_failures = indexes.ensure_indexes(self._connection)
+            if index_failures:
+                import streamlit as st
+                st.warning(
+                    "Some lookup indexes could not be created (queries still work, "
+                    "but slower): " + "; ".join(
+                        f"{name}: {error}" for name, error in index_failures.items()
+                    )
+                )
             return True
         except Exception as e:
             import streamlit as st
@@ -198,6 +209,10 @@ class RiskGraphManager:
             self._connection, source_id, target_id, strength, description, confidence
         )
         return result is not None
+
+    def create_influences_bulk(self, rows: list) -> list:
+        """Create many influence relationships in a single round-trip."""
+        return influences.create_influences_bulk(self._connection, rows)
     
     def get_all_influences(self) -> list:
         """Retrieve all influence relationships."""
@@ -377,6 +392,10 @@ class RiskGraphManager:
     ) -> bool:
         """Alias for create_mitigates_link."""
         return self.create_mitigates_link(mitigation_id, risk_id, effectiveness, description)
+
+    def create_mitigates_relationships_bulk(self, rows: list) -> list:
+        """Create many MITIGATES relationships in a single round-trip."""
+        return mitigations.create_mitigates_relationships_bulk(self._connection, rows)
     
     def delete_mitigates_relationship(self, relationship_id: str) -> bool:
         """Alias for delete_mitigates_link."""
@@ -402,13 +421,23 @@ class RiskGraphManager:
         """Get generic entities of a specific type."""
         return generic_entity.get_all_entities(self.driver, entity_type, filters)
         
+    def get_generic_entities_columnar(self, entity_type, properties: list,
+                                      filters: dict = None, categorical: list = None) -> dict:
+        """Get generic entities of a type as property columns (for analytics)."""
+        return generic_entity.get_entities_columnar(
+            self.driver, entity_type, properties, filters, categorical
+        )
+        
     def get_generic_entity_by_id(self, entity_type, entity_id: str) -> Optional[dict]:
         """Get a generic entity by ID."""
         return generic_entity.get_entity_by_id(self.driver, entity_type, entity_id)
         
-    def update_generic_entity(self, entity_type, entity_id: str, data: dict) -> Optional[dict]:
-        """Update a generic entity."""
-        return generic_entity.update_entity(self.driver, entity_type, entity_id, data)
+    def update_generic_entity(self, entity_type, entity_id: str, data: dict,
+                              return_previous: bool = False) -> Optional[dict]:
+        """Update a generic entity (optionally returning its previous state)."""
+        return generic_entity.update_entity(
+            self.driver, entity_type, entity_id, data, return_previous
+        )
         
     def delete_generic_entity(self, entity_type, entity_id: str, cascade: bool = True) -> bool:
         """Delete a generic entity."""
@@ -424,18 +453,36 @@ class RiskGraphManager:
         return generic_relationship.create_relationship(
             self.driver, rel_type, source_id, target_id, source_type, target_type, data
         )
-        
+
+    def create_generic_relationships_bulk(self, rel_type, rows: list,
+                                          source_type, target_type) -> list:
+        """Create many generic relationships of one type in a single round-trip."""
+        return generic_relationship.create_relationships_bulk(
+            self.driver, rel_type, rows, source_type, target_type
+        )
+
     def get_generic_relationships(self, rel_type, filters: dict = None) -> list:
         """Get generic relationships of a specific type."""
         return generic_relationship.get_all_relationships(self.driver, rel_type, filters)
         
+    def get_generic_relationships_to(self, rel_type, entity_id: str,
+                                     order_by_source: str = None,
+                                     limit: int = None) -> list:
+        """Get relationships pointing to an entity, optionally top-K by a source property."""
+        return generic_relationship.get_relationships_to_entity(
+            self.driver, rel_type, entity_id, order_by_source, limit
+        )
+        
     def get_generic_relationship_by_id(self, rel_type, rel_id: str) -> Optional[dict]:
         """Get a generic relationship by ID."""
         return generic_relationship.get_relationship_by_id(self.driver, rel_type, rel_id)
         
-    def update_generic_relationship(self, rel_type, rel_id: str, data: dict) -> Optional[dict]:
-        """Update a generic relationship."""
-        return generic_relationship.update_relationship(self.driver, rel_type, rel_id, data)
+    def update_generic_relationship(self, rel_type, rel_id: str, data: dict,
+                                    return_previous: bool = False) -> Optional[dict]:
+        """Update a generic relationship (optionally returning its previous state)."""
+        return generic_relationship.update_relationship(
+            self.driver, rel_type, rel_id, data, return_previous
+        )
         
     def delete_generic_relationship(self, rel_type, rel_id: str) -> bool:
         """Delete a generic relationship."""
@@ -1313,14 +1360,21 @@ class RiskGraphManager:
             create_mitigates_fn=self.create_mitigates_relationship,
             get_all_risks_fn=self.get_all_risks,
             get_all_mitigations_fn=self.get_all_mitigations,
-            # Context data callbacks
-            create_generic_entity_fn=self.create_entity,
+            # Context data callbacks. Context nodes are created on a worker
+            # thread, so validation errors are raised into the import result
+            # rather than reported with st.error
+            create_generic_entity_fn=functools.partial(
+                self.create_entity, raise_validation_errors=True
+            ),
             get_generic_entities_fn=self.get_entities,
             create_generic_relationship_fn=self.create_relationship,
             registry=registry,
             # Deduplication callbacks
             get_all_influences_fn=self.get_all_influences,
             get_all_mitigates_fn=self.get_all_mitigates_relationships,
+            # Batched relationship creation
+            create_influences_bulk_fn=self.create_influences_bulk,
+            create_mitigates_bulk_fn=self.create_mitigates_relationships_bulk,
         )
 
         result = importer.import_from_excel(filepath)
@@ -1455,7 +1509,8 @@ class RiskGraphManager:
             risks=risks,
             influences=influences,
             mitigations=mitigations,
-            mitigates_relationships=mitigates_rels
+            mitigates_relationships=mitigates_rels,
+            cached=True
         )
         
         return result.to_dict()
@@ -1464,13 +1519,21 @@ class RiskGraphManager:
     # GENERIC ENTITY OPERATIONS (Schema-Driven)
     # =========================================================================
     
-    def create_entity(self, entity_type_id: str, data: Dict[str, Any]) -> Optional[Dict]:
+    def create_entity(
+        self,
+        entity_type_id: str,
+        data: Dict[str, Any],
+        raise_validation_errors: bool = False,
+    ) -> Optional[Dict]:
         """
         Create any entity type using schema registry.
         
         Args:
             entity_type_id: Entity type ID from schema (e.g., "risk", "mitigation", "tpo")
             data: Entity data dictionary
+            raise_validation_errors: Raise EntityValidationError instead of
+                reporting it with st.error (for callers off the Streamlit
+                script thread, where st.* output is dropped)
             
         Returns:
             Created entity or None
@@ -1488,8 +1551,10 @@ class RiskGraphManager:
             raise RuntimeError("Not connected to database")
         
         try:
-            return create_entity(self._connection._driver, entity_type, data)
+            return create_entity(self._connection.driver, entity_type, data)
         except EntityValidationError as e:
+            if raise_validation_errors:
+                raise
             import streamlit as st
             st.error(str(e))
             return None
@@ -1519,7 +1584,7 @@ class RiskGraphManager:
         if not self._connection:
             return []
         
-        return get_all_entities(self._connection._driver, entity_type, filters)
+        return get_all_entities(self._connection.driver, entity_type, filters)
     
     def get_entity_by_id(
         self, entity_type_id: str, entity_id: str
@@ -1543,10 +1608,11 @@ class RiskGraphManager:
         if not entity_type or not self._connection:
             return None
         
-        return get_entity_by_id(self._connection._driver, entity_type, entity_id)
+        return get_entity_by_id(self._connection.driver, entity_type, entity_id)
     
     def update_entity(
-        self, entity_type_id: str, entity_id: str, data: Dict[str, Any]
+        self, entity_type_id: str, entity_id: str, data: Dict[str, Any],
+        return_previous: bool = False
     ) -> Optional[Dict]:
         """
         Update an entity.
@@ -1555,6 +1621,8 @@ class RiskGraphManager:
             entity_type_id: Entity type ID from schema
             entity_id: Entity ID
             data: Updated data
+            return_previous: If True, the result carries the pre-update
+                properties under ``_previous`` (same round-trip)
             
         Returns:
             Updated entity or None
@@ -1569,7 +1637,9 @@ class RiskGraphManager:
             return None
         
         try:
-            return update_entity(self._connection._driver, entity_type, entity_id, data)
+            return update_entity(
+                self._connection.driver, entity_type, entity_id, data, return_previous
+            )
         except EntityValidationError as e:
             import streamlit as st
             st.error(str(e))
@@ -1595,7 +1665,7 @@ class RiskGraphManager:
         if not entity_type or not self._connection:
             return False
         
-        return delete_entity(self._connection._driver, entity_type, entity_id)
+        return delete_entity(self._connection.driver, entity_type, entity_id)
     
     # =========================================================================
     # GENERIC RELATIONSHIP OPERATIONS (Schema-Driven)
@@ -1626,7 +1696,7 @@ class RiskGraphManager:
         """
         from core import get_registry
         from database.queries.generic_relationship import (
-            create_relationship, ConstraintViolationError, RelationshipValidationError
+            ConstraintViolationError, RelationshipValidationError
         )
         
         registry = get_registry()
@@ -1641,8 +1711,7 @@ class RiskGraphManager:
             return None
         
         try:
-            return create_relationship(
-                self._connection._driver,
+            return self.create_generic_relationship(
                 rel_type,
                 source_id,
                 target_id,
@@ -1677,7 +1746,7 @@ class RiskGraphManager:
         if not rel_type or not self._connection:
             return []
         
-        return get_all_relationships(self._connection._driver, rel_type, filters)
+        return get_all_relationships(self._connection.driver, rel_type, filters)
     
     def delete_relationship(self, rel_type_id: str, rel_id: str) -> bool:
         """
@@ -1691,7 +1760,6 @@ class RiskGraphManager:
             True if deleted
         """
         from core import get_registry
-        from database.queries.generic_relationship import delete_relationship
         
         registry = get_registry()
         rel_type = registry.get_relationship_type(rel_type_id)
@@ -1699,7 +1767,7 @@ class RiskGraphManager:
         if not rel_type or not self._connection:
             return False
         
-        return delete_relationship(self._connection._driver, rel_type, rel_id)
+        return self.delete_generic_relationship(rel_type, rel_id)
 
     # =========================================================================
     # UNIFIED UI ROUTERS (Schema-Agnostic CRUD)
@@ -1802,7 +1870,9 @@ class RiskGraphManager:
             )
             return self.get_mitigation_by_id(id) if success else None
         else:
-            return self.update_generic_entity(entity_type_id, id, data)
+            # Resolve the type definition; the updated node comes back from
+            # the same query, so no follow-up read is needed.
+            return self.update_entity(entity_type_id, id, data)
 
     def delete_unified_entity(self, entity_type_id: str, id: str) -> bool:
         """Universal entity deleter."""
@@ -10,6 +10,7 @@ from database.queries import influences
 from database.queries import analysis
 from database.queries import generic_entity
 from database.queries import generic_relationship
+from database.queries import indexes
 
 __all__ = [
     "risks",
@@ -18,4 +19,5 @@ __all__ = [
     "analysis",
     "generic_entity",
     "generic_relationship",
+    "indexes",
 ]
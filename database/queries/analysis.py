@@ -4,6 +4,7 @@ Analysis database queries.
 Contains queries for statistics, graph data retrieval, and analysis support.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 from database.connection import Neo4jConnection
 from database.queries import risks, mitigations, influences
@@ -94,7 +95,7 @@ def get_graph_data(
                 if f"{entity_id}_{group_name}" in filters:
                     entity_filters[group_name] = filters[f"{entity_id}_{group_name}"]
             
-            entities = generic_entity.get_all_entities(conn._driver, entity_type, entity_filters)
+            entities = generic_entity.get_all_entities(conn.driver, entity_type, entity_filters)
             
             for node in entities:
                 node["node_type"] = entity_id
@@ -145,7 +146,7 @@ def get_graph_data(
                 if f"{rel_id}_{group_name}" in filters:
                     rel_filters[group_name] = filters[f"{rel_id}_{group_name}"]
             
-            rels = generic_relationship.get_all_relationships(conn._driver, rel_type, rel_filters)
+            rels = generic_relationship.get_all_relationships(conn.driver, rel_type, rel_filters)
             for r in rels:
                 edge = dict(r)
                 edge["source"] = r["source_id"]
@@ -263,7 +264,9 @@ def get_all_edges_scored(conn: Neo4jConnection) -> List[Dict[str, Any]]:
     from database.queries import generic_relationship
     from core import get_registry
     impacts_tpo_type = get_registry().get_relationship_type("impacts_tpo")
-    all_tpo_impacts = generic_relationship.get_all_relationships(conn._driver, impacts_tpo_type) if impacts_tpo_type else []
+    all_tpo_impacts = generic_relationship.get_relationship_edges(
+        conn.driver, impacts_tpo_type, ["impact_level", "description"]
+    ) if impacts_tpo_type else []
     # Map generic generic relation ids to specific ones expected here
     for impact in all_tpo_impacts:
         impact["risk_id"] = impact.get("source_id")
@@ -279,7 +282,7 @@ def get_all_edges_scored(conn: Neo4jConnection) -> List[Dict[str, Any]]:
             "edge_type": "IMPACTS_TPO",
             "impact_level": impact["impact_level"],
             "score": score,
-            "description": impact.get("description", "")
+            "description": impact.get("description") or ""
         })
     
     # Sort by score descending
@@ -292,6 +295,29 @@ def get_all_edges_scored(conn: Neo4jConnection) -> List[Dict[str, Any]]:
 # STATISTICS
 # =============================================================================
 
+def _get_tpos_and_impacts(conn: Neo4jConnection, tpo_type, impacts_tpo_type) -> tuple:
+    """
+    Load TPOs and their IMPACTS_TPO edges for statistics.
+    
+    Returns:
+        Tuple of (tpos, impacts); impacts carry risk_id / tpo_id keys
+    """
+    from database.queries import generic_entity, generic_relationship
+    
+    if tpo_type and impacts_tpo_type:
+        # TPOs and their impacts in one aggregated query
+        all_tpos = generic_relationship.get_targets_with_incoming(conn.driver, impacts_tpo_type, tpo_type)
+        all_tpo_impacts = [imp for t in all_tpos for imp in t.pop("_incoming")]
+        # Rename field maps to match old `tpo_id` usage for internal arrays
+        for imp in all_tpo_impacts:
+            imp["risk_id"] = imp.get("source_id")
+            imp["tpo_id"] = imp.get("target_id")
+        return all_tpos, all_tpo_impacts
+    if tpo_type:
+        return generic_entity.get_all_entities(conn.driver, tpo_type), []
+    return [], []
+
+
 def get_statistics(conn: Neo4jConnection, active_scopes: list = None) -> Dict[str, Any]:
     """
     Get comprehensive graph statistics, optionally filtered by active scopes.
@@ -322,32 +348,25 @@ def get_statistics(conn: Neo4jConnection, active_scopes: list = None) -> Dict[st
         "mitigations_by_status": {}
     }
     
-    # Risk counts
-    all_risks = risks.get_all_risks(conn)
-    all_mitigations = mitigations.get_all_mitigations(conn)
-    
-    # Influence counts
-    all_influences = influences.get_all_influences(conn)
-    
-    # Generic context data (TPOs)
-    from database.queries import generic_entity, generic_relationship
     from core import get_registry
     registry = get_registry()
     tpo_type = registry.get_entity_type("tpo")
-    if tpo_type:
-        all_tpos = generic_entity.get_all_entities(conn._driver, tpo_type)
-        impacts_tpo_type = registry.get_relationship_type("impacts_tpo")
-        all_tpo_impacts = generic_relationship.get_all_relationships(conn._driver, impacts_tpo_type) if impacts_tpo_type else []
-        # Rename field maps to match old `tpo_id` usage for internal arrays
-        for imp in all_tpo_impacts:
-            imp["risk_id"] = imp.get("source_id")
-            imp["tpo_id"] = imp.get("target_id")
-    else:
-        all_tpos = []
-        all_tpo_impacts = []
-    
-    # Mitigation counts
-    all_mitigates = mitigations.get_all_mitigates_relationships(conn)
+    impacts_tpo_type = registry.get_relationship_type("impacts_tpo")
+    
+    # The five reads are independent: issue them concurrently so the wait is
+    # the slowest query rather than the sum. Each call opens its own session.
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        risks_future = executor.submit(risks.get_all_risks, conn)
+        mitigations_future = executor.submit(mitigations.get_all_mitigations, conn)
+        influences_future = executor.submit(influences.get_all_influences, conn)
+        tpos_future = executor.submit(_get_tpos_and_impacts, conn, tpo_type, impacts_tpo_type)
+        mitigates_future = executor.submit(mitigations.get_all_mitigates_relationships, conn)
+    
+    all_risks = risks_future.result()
+    all_mitigations = mitigations_future.result()
+    all_influences = influences_future.result()
+    all_tpos, all_tpo_impacts = tpos_future.result()
+    all_mitigates = mitigates_future.result()
     
     # Process scope filtering if active scopes are provided
     if active_scopes:
@@ -471,10 +490,14 @@ def get_all_nodes_for_selection(conn: Neo4jConnection, active_scopes: list = Non
     from core import get_registry
     registry = get_registry()
     tpo_type = registry.get_entity_type("tpo")
-    if tpo_type:
-        all_tpos = generic_entity.get_all_entities(conn._driver, tpo_type)
-        impacts_tpo_type = registry.get_relationship_type("impacts_tpo")
-        all_tpo_impacts = generic_relationship.get_all_relationships(conn._driver, impacts_tpo_type) if impacts_tpo_type else []
+    impacts_tpo_type = registry.get_relationship_type("impacts_tpo")
+    if tpo_type and impacts_tpo_type:
+        # TPOs and their impacts in one aggregated query
+        all_tpos = generic_relationship.get_targets_with_incoming(conn.driver, impacts_tpo_type, tpo_type)
+        all_tpo_impacts = [imp for t in all_tpos for imp in t.pop("_incoming")]
+    elif tpo_type:
+        all_tpos = generic_entity.get_all_entities(conn.driver, tpo_type)
+        all_tpo_impacts = []
     else:
         all_tpos = []
         all_tpo_impacts = []
@@ -571,7 +594,7 @@ def get_influence_network(
         from core import get_registry
         tpo_type = get_registry().get_entity_type("tpo")
         if tpo_type:
-            tpo_data = generic_entity.get_entity_by_id(conn._driver, tpo_type, node_id)
+            tpo_data = generic_entity.get_entity_by_id(conn.driver, tpo_type, node_id)
     
     if risk_data:
         selected_node_info = {
@@ -634,40 +657,32 @@ def get_influence_network(
     if include_tpos:
         risk_node_ids = [nid for nid, n in nodes_set.items() if n.get("node_type") == "Risk"]
         if risk_node_ids:
-            # Get all TPOs impacted by these risks
-            from database.queries import generic_entity, generic_relationship
+            # TPOs impacted by these risks, with their impact edges, in one query
+            from database.queries import generic_relationship
             from core import get_registry
             registry = get_registry()
             tpo_type = registry.get_entity_type("tpo")
-            all_tpo_list = []
-            if tpo_type:
-                all_tpo_list = generic_entity.get_all_entities(conn._driver, tpo_type)
-            tpo_ids = [t["id"] for t in all_tpo_list]
-            
-            if tpo_ids:
-                impacts_tpo_type = registry.get_relationship_type("impacts_tpo")
-                if impacts_tpo_type:
-                    all_rels = generic_relationship.get_all_relationships(conn._driver, impacts_tpo_type)
-                    for rel in all_rels:
-                        if rel["source_id"] in risk_node_ids and rel["target_id"] in tpo_ids:
-                            tpo_edges.append({
-                                "source": rel["source_id"],
-                                "target": rel["target_id"],
-                                "edge_type": impacts_tpo_type.neo4j_type,
-                                "impact_level": rel.get("impact_level", "Medium")
-                            })
-                
-                # Only include TPOs that have connections
-                connected_tpo_ids = set(e["target"] for e in tpo_edges)
-                for t in all_tpo_list:
-                    if t["id"] in connected_tpo_ids:
-                        tpo_nodes.append({
-                            "id": t["id"],
-                            "reference": t["reference"],
-                            "name": t["name"],
-                            "cluster": t["cluster"],
-                            "node_type": "TPO"
+            impacts_tpo_type = registry.get_relationship_type("impacts_tpo")
+            if tpo_type and impacts_tpo_type:
+                impacted_tpos = generic_relationship.get_targets_with_incoming(
+                    conn.driver, impacts_tpo_type, tpo_type,
+                    source_ids=risk_node_ids, properties=["impact_level"]
+                )
+                for t in impacted_tpos:
+                    for rel in t["_incoming"]:
+                        tpo_edges.append({
+                            "source": rel["source_id"],
+                            "target": rel["target_id"],
+                            "edge_type": impacts_tpo_type.neo4j_type,
+                            "impact_level": rel.get("impact_level") or "Medium"
                         })
+                    tpo_nodes.append({
+                        "id": t["id"],
+                        "reference": t.get("reference"),
+                        "name": t["name"],
+                        "cluster": t.get("cluster"),
+                        "node_type": "TPO"
+                    })
     
     nodes_list = list(nodes_set.values())
     nodes_list.extend(tpo_nodes)
@@ -5,8 +5,8 @@ Works with any entity type defined in the schema registry,
 providing type-agnostic CRUD operations while respecting schema constraints.
 """
 
-from typing import Any, Dict, List, Optional
-from neo4j import Driver
+from typing import Any, Dict, List, Optional, Tuple
+from neo4j import Driver, READ_ACCESS
 from core import EntityTypeDefinition, get_registry
 
 
@@ -76,36 +76,20 @@ def create_entity(
     return prepared
 
 
-def get_all_entities(
-    driver: Driver,
+def _build_entity_where(
     entity_type: EntityTypeDefinition,
     filters: Optional[Dict[str, Any]] = None
-) -> List[Dict[str, Any]]:
+) -> Tuple[str, Dict[str, Any]]:
     """
-    Retrieve all entities of a type.
+    Build the WHERE clause and parameters for listing entities of a type.
     
     Args:
-        driver: Neo4j driver
         entity_type: Entity type definition
         filters: Optional filters (attribute_name -> value or list of values)
         
     Returns:
-        List of entity dictionaries
+        Tuple of (where clause or "", parameters)
     """
-    label = entity_type.neo4j_label
-    
-    # Fast existence guard — avoids Neo4j warnings when querying a label
-    # that exists in the schema but has no data in the database yet.
-    with driver.session() as session:
-        result = session.run(
-            "CALL db.labels() YIELD label RETURN collect(label) AS labels"
-        )
-        record = result.single()
-        existing_labels = record["labels"] if record else []
-    
-    if label not in existing_labels:
-        return []
-
     where_clauses = []
     params = {}
 
@@ -134,6 +118,40 @@ def get_all_entities(
     where_str = ""
     if where_clauses:
         where_str = "WHERE " + " AND ".join(where_clauses)
+    return where_str, params
+
+
+def get_all_entities(
+    driver: Driver,
+    entity_type: EntityTypeDefinition,
+    filters: Optional[Dict[str, Any]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Retrieve all entities of a type.
+    
+    Args:
+        driver: Neo4j driver
+        entity_type: Entity type definition
+        filters: Optional filters (attribute_name -> value or list of values)
+        
+    Returns:
+        List of entity dictionaries
+    """
+    label = entity_type.neo4j_label
+    
+    # Fast existence guard — avoids Neo4j warnings when querying a label
+    # that exists in the schema but has no data in the database yet.
+    with driver.session(default_access_mode=READ_ACCESS) as session:
+        result = session.run(
+            "CALL db.labels() YIELD label RETURN collect(label) AS labels"
+        )
+        record = result.single()
+        existing_labels = record["labels"] if record else []
+    
+    if label not in existing_labels:
+        return []
+
+    where_str, params = _build_entity_where(entity_type, filters)
     
     query = f"""
     MATCH (n:{label})
@@ -143,7 +161,7 @@ def get_all_entities(
     """
     
     entities = []
-    with driver.session() as session:
+    with driver.session(default_access_mode=READ_ACCESS) as session:
         result = session.run(query, params)
         for record in result:
             entity = dict(record["n"])
@@ -153,6 +171,63 @@ def get_all_entities(
     return entities
 
 
+def get_entities_columnar(
+    driver: Driver,
+    entity_type: EntityTypeDefinition,
+    properties: List[str],
+    filters: Optional[Dict[str, Any]] = None,
+    categorical: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """
+    Retrieve entities of a type as columns instead of one dict per row.
+    
+    The server packs every row into a single list, so the client builds one
+    array per property rather than thousands of small dicts. Intended for
+    analytics and pandas consumers; CRUD paths keep using get_all_entities.
+    
+    Args:
+        driver: Neo4j driver
+        entity_type: Entity type definition
+        properties: Properties to return, one column each (same order)
+        filters: Optional filters (attribute_name -> value or list of values)
+        categorical: Low-cardinality properties (e.g. "cluster") to return
+            as pandas.Categorical instead of an object array
+        
+    Returns:
+        Dict of property name -> numpy object array / pandas.Categorical,
+        rows ordered by name. Missing values are None.
+    """
+    import numpy as np
+    import pandas as pd
+    
+    label = entity_type.neo4j_label
+    where_str, params = _build_entity_where(entity_type, filters)
+    row_expr = ", ".join(f"n.{prop}" for prop in properties)
+    
+    query = f"""
+    MATCH (n:{label})
+    {where_str}
+    WITH n ORDER BY n.name
+    RETURN collect([{row_expr}]) AS rows
+    """
+    
+    with driver.session(default_access_mode=READ_ACCESS) as session:
+        record = session.run(query, params).single()
+        rows = record["rows"] if record else []
+    
+    categorical = set(categorical or ())
+    columns = list(zip(*rows)) if rows else [()] * len(properties)
+    result = {}
+    for prop, values in zip(properties, columns):
+        if prop in categorical:
+            result[prop] = pd.Categorical(values)
+        else:
+            column = np.empty(len(values), dtype=object)
+            column[:] = values
+            result[prop] = column
+    return result
+
+
 
 def get_entity_by_id(
     driver: Driver,
@@ -177,7 +252,7 @@ def get_entity_by_id(
     RETURN n, elementId(n) as nodeId
     """
     
-    with driver.session() as session:
+    with driver.session(default_access_mode=READ_ACCESS) as session:
         result = session.run(query, {"id": entity_id})
         record = result.single()
         if record:
@@ -192,7 +267,8 @@ def update_entity(
     driver: Driver,
     entity_type: EntityTypeDefinition,
     entity_id: str,
-    data: Dict[str, Any]
+    data: Dict[str, Any],
+    return_previous: bool = False
 ) -> Optional[Dict[str, Any]]:
     """
     Update an entity.
@@ -202,6 +278,8 @@ def update_entity(
         entity_type: Entity type definition
         entity_id: Entity ID
         data: Updated data
+        return_previous: If True, attach the pre-update properties under
+            ``_previous`` (captured in the same query, no extra read)
         
     Returns:
         Updated entity or None if not found
@@ -223,8 +301,9 @@ def update_entity(
     
     query = f"""
     MATCH (n:{label} {{id: $id}})
+    WITH n, properties(n) AS before
     SET {set_clause}
-    RETURN n, elementId(n) as nodeId
+    RETURN n, before, elementId(n) as nodeId
     """
     
     with driver.session() as session:
@@ -233,6 +312,8 @@ def update_entity(
         if record:
             entity = dict(record["n"])
             entity["_element_id"] = record["nodeId"]
+            if return_previous:
+                entity["_previous"] = dict(record["before"])
             return entity
     
     return None
@@ -294,26 +375,8 @@ def count_entities(
         Count of matching entities
     """
     label = entity_type.neo4j_label
-    
-    where_clauses = []
-    params = {}
-    
-    if filters:
-        for key, value in filters.items():
-            if value is None:
-                continue
-            param_name = f"filter_{key}"
-            if isinstance(value, list):
-                if value:
-                    where_clauses.append(f"n.{key} IN ${param_name}")
-                    params[param_name] = value
-            else:
-                where_clauses.append(f"n.{key} = ${param_name}")
-                params[param_name] = value
-    
-    where_str = ""
-    if where_clauses:
-        where_str = "WHERE " + " AND ".join(where_clauses)
+    # Scoped to the type's node_type for ContextNodes, like get_all_entities
+    where_str, params = _build_entity_where(entity_type, filters)
     
     query = f"""
     MATCH (n:{label})
@@ -321,7 +384,7 @@ def count_entities(
     RETURN count(n) as cnt
     """
     
-    with driver.session() as session:
+    with driver.session(default_access_mode=READ_ACCESS) as session:
         result = session.run(query, params)
         record = result.single()
         return record["cnt"] if record else 0
@@ -365,7 +428,7 @@ def search_entities(
     """
     
     entities = []
-    with driver.session() as session:
+    with driver.session(default_access_mode=READ_ACCESS) as session:
         result = session.run(query, {"search_term": search_term})
         for record in result:
             entity = dict(record["n"])
@@ -6,7 +6,7 @@ providing type-agnostic CRUD while enforcing from_entity/to_entity constraints.
 """
 
 from typing import Any, Dict, List, Optional
-from neo4j import Driver
+from neo4j import Driver, READ_ACCESS
 from core import RelationshipTypeDefinition, EntityTypeDefinition, get_registry
 
 
@@ -102,6 +102,88 @@ def create_relationship(
     return data
 
 
+def create_relationships_bulk(
+    driver: Driver,
+    rel_type: RelationshipTypeDefinition,
+    rows: List[Dict[str, Any]],
+    source_entity_type: EntityTypeDefinition,
+    target_entity_type: EntityTypeDefinition
+) -> List[Dict[str, Any]]:
+    """
+    Create many relationships of one type in a single round-trip.
+
+    Each row carries ``source_id`` and ``target_id`` plus the relationship
+    properties. All rows are sent as one ``UNWIND`` batch, so a whole import
+    costs one transaction instead of one per edge.
+
+    Args:
+        driver: Neo4j driver
+        rel_type: Relationship type definition from registry
+        rows: List of dicts with source_id, target_id and edge properties
+        source_entity_type: Entity type of every source
+        target_entity_type: Entity type of every target
+
+    Returns:
+        List of created relationships. Rows whose endpoints could not be
+        matched are absent — compare with ``len(rows)`` to detect them.
+
+    Raises:
+        ConstraintViolationError: If entity types not allowed
+        RelationshipValidationError: If any row fails validation
+    """
+    if not rows:
+        return []
+
+    # Enforce constraints once for the whole batch
+    if not rel_type.can_connect(source_entity_type.id, target_entity_type.id):
+        raise ConstraintViolationError(
+            f"Relationship '{rel_type.id}' cannot connect "
+            f"'{source_entity_type.id}' to '{target_entity_type.id}'. "
+            f"Expected from: {rel_type.from_entity_types}, to: {rel_type.to_entity_types}"
+        )
+
+    import uuid
+    batch = []
+    for index, row in enumerate(rows):
+        data = {k: v for k, v in row.items() if k not in ("source_id", "target_id")}
+        is_valid, errors = rel_type.validate(data)
+        if not is_valid:
+            raise RelationshipValidationError(
+                f"Validation failed for row {index}: {'; '.join(errors)}"
+            )
+        data.setdefault("id", str(uuid.uuid4()))
+        batch.append({
+            "source_id": row.get("source_id"),
+            "target_id": row.get("target_id"),
+            "props": data,
+        })
+
+    source_label = source_entity_type.neo4j_label
+    target_label = target_entity_type.neo4j_label
+    neo4j_type = rel_type.neo4j_type
+
+    query = f"""
+    UNWIND $rows AS row
+    MATCH (a:{source_label} {{id: row.source_id}})
+    MATCH (b:{target_label} {{id: row.target_id}})
+    CREATE (a)-[r:{neo4j_type}]->(b)
+    SET r = row.props
+    RETURN r, elementId(r) as relId, row.source_id as source_id, row.target_id as target_id
+    """
+
+    relationships = []
+    with driver.session() as session:
+        result = session.run(query, {"rows": batch})
+        for record in result:
+            rel = dict(record["r"])
+            rel["_element_id"] = record["relId"]
+            rel["source_id"] = record["source_id"]
+            rel["target_id"] = record["target_id"]
+            relationships.append(rel)
+
+    return relationships
+
+
 def get_all_relationships(
     driver: Driver,
     rel_type: RelationshipTypeDefinition,
@@ -122,7 +204,7 @@ def get_all_relationships(
     
     # Fast existence guard — avoid Neo4j 01N51 warning for schema-defined types
     # that have not yet been persisted to the database.
-    with driver.session() as session:
+    with driver.session(default_access_mode=READ_ACCESS) as session:
         result = session.run(
             "CALL db.relationshipTypes() YIELD relationshipType RETURN collect(relationshipType) AS types"
         )
@@ -159,7 +241,7 @@ def get_all_relationships(
     """
     
     relationships = []
-    with driver.session() as session:
+    with driver.session(default_access_mode=READ_ACCESS) as session:
         result = session.run(query, params)
         for record in result:
             rel = dict(record["r"])
@@ -173,6 +255,68 @@ def get_all_relationships(
     return relationships
 
 
+def get_relationship_edges(
+    driver: Driver,
+    rel_type: RelationshipTypeDefinition,
+    properties: Optional[List[str]] = None,
+    limit: Optional[int] = None,
+    after_id: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    Get a thin projection of all relationships of a type.
+
+    Unlike get_all_relationships, no node bodies or full property maps are
+    transferred — only endpoint IDs, the relationship ID and the requested
+    properties. Use this for graph edges, counts and scope filtering.
+
+    Args:
+        driver: Neo4j driver
+        rel_type: Relationship type definition
+        properties: Relationship properties to include (None = none)
+        limit: Page size for keyset pagination (None = everything)
+        after_id: Return only relationships with an ID greater than this
+            (pass the last ``id`` of the previous page)
+
+    Returns:
+        List of dicts with id, source_id, target_id and requested properties
+    """
+    neo4j_type = rel_type.neo4j_type
+
+    # Same existence guard as get_all_relationships
+    with driver.session(default_access_mode=READ_ACCESS) as session:
+        result = session.run(
+            "CALL db.relationshipTypes() YIELD relationshipType RETURN collect(relationshipType) AS types"
+        )
+        record = result.single()
+        existing_types = record["types"] if record else []
+
+    if neo4j_type not in existing_types:
+        return []
+
+    properties = properties or []
+    projections = "".join(f", r.{p} as {p}" for p in properties if p != "id")
+    params: Dict[str, Any] = {}
+
+    where_str = ""
+    page_str = ""
+    if after_id is not None:
+        where_str = "WHERE r.id > $after_id"
+        params["after_id"] = after_id
+    if limit is not None:
+        page_str = "ORDER BY r.id LIMIT $limit"
+        params["limit"] = limit
+
+    query = f"""
+    MATCH (a)-[r:{neo4j_type}]->(b)
+    {where_str}
+    RETURN r.id as id, a.id as source_id, b.id as target_id{projections}
+    {page_str}
+    """
+
+    with driver.session(default_access_mode=READ_ACCESS) as session:
+        result = session.run(query, params)
+        return [dict(record) for record in result]
+
 
 def get_relationship_by_id(
     driver: Driver,
@@ -197,7 +341,7 @@ def get_relationship_by_id(
     RETURN r, a, b, elementId(r) as relId, a.id as source_id, b.id as target_id
     """
     
-    with driver.session() as session:
+    with driver.session(default_access_mode=READ_ACCESS) as session:
         result = session.run(query, {"id": rel_id})
         record = result.single()
         if record:
@@ -236,7 +380,7 @@ def get_relationships_from_entity(
     """
     
     relationships = []
-    with driver.session() as session:
+    with driver.session(default_access_mode=READ_ACCESS) as session:
         result = session.run(query, {"entity_id": entity_id})
         for record in result:
             rel = dict(record["r"])
@@ -253,29 +397,48 @@ def get_relationships_from_entity(
 def get_relationships_to_entity(
     driver: Driver,
     rel_type: RelationshipTypeDefinition,
-    entity_id: str
+    entity_id: str,
+    order_by_source: Optional[str] = None,
+    limit: Optional[int] = None
 ) -> List[Dict[str, Any]]:
     """
     Get relationships pointing to an entity.
     
+    Ordering and limiting happen server-side, so a top-K request (e.g. the
+    ten highest-exposure risks impacting a TPO) lets the planner stop early
+    instead of returning every incoming edge.
+    
     Args:
         driver: Neo4j driver
         rel_type: Relationship type definition
         entity_id: Target entity ID
+        order_by_source: Optional source-node property to sort by, descending
+        limit: Optional maximum number of relationships to return
         
     Returns:
         List of incoming relationships
+        
+    Raises:
+        ValueError: If order_by_source is not a valid property name
     """
     neo4j_type = rel_type.neo4j_type
+    params = {"entity_id": entity_id}
     
     query = f"""
     MATCH (a)-[r:{neo4j_type}]->(b {{id: $entity_id}})
     RETURN r, a, b, elementId(r) as relId, a.id as source_id, b.id as target_id
     """
+    if order_by_source:
+        if not order_by_source.isidentifier():
+            raise ValueError(f"Invalid property name for ordering: {order_by_source!r}")
+        query += f"ORDER BY a.{order_by_source} DESC\n"
+    if limit is not None:
+        query += "LIMIT $limit\n"
+        params["limit"] = limit
     
     relationships = []
-    with driver.session() as session:
-        result = session.run(query, {"entity_id": entity_id})
+    with driver.session(default_access_mode=READ_ACCESS) as session:
+        result = session.run(query, params)
         for record in result:
             rel = dict(record["r"])
             rel["_element_id"] = record["relId"]
@@ -288,11 +451,81 @@ def get_relationships_to_entity(
     return relationships
 
 
+def get_targets_with_incoming(
+    driver: Driver,
+    rel_type: RelationshipTypeDefinition,
+    target_entity_type: EntityTypeDefinition,
+    source_ids: Optional[List[str]] = None,
+    properties: Optional[List[str]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Get target entities together with their incoming relationships.
+
+    Replaces the "list targets, then list relationships per target" pattern
+    (e.g. TPOs and the risks impacting them) with one aggregated query.
+
+    Args:
+        driver: Neo4j driver
+        rel_type: Relationship type definition
+        target_entity_type: Entity type of the targets
+        source_ids: If given, only relationships from these sources are
+            collected and targets without any of them are omitted.
+            If None, every target is returned (possibly with no incoming).
+        properties: Relationship properties to include per incoming edge
+
+    Returns:
+        List of target entity dicts, each with an ``_incoming`` list of
+        ``{id, source_id, target_id, <properties>}`` dicts
+    """
+    label = target_entity_type.neo4j_label
+    neo4j_type = rel_type.neo4j_type
+
+    where_clauses = []
+    params: Dict[str, Any] = {}
+    if target_entity_type.is_context_node:
+        where_clauses.append("b.node_type = $__node_type")
+        params["__node_type"] = target_entity_type.id
+    where_str = "WHERE " + " AND ".join(where_clauses) if where_clauses else ""
+
+    if source_ids is not None:
+        if not source_ids:
+            return []
+        match_str = f"MATCH (a)-[r:{neo4j_type}]->(b) WHERE a.id IN $source_ids"
+        params["source_ids"] = source_ids
+    else:
+        match_str = f"OPTIONAL MATCH (a)-[r:{neo4j_type}]->(b)"
+
+    properties = properties or []
+    projections = "".join(f", {p}: r.{p}" for p in properties if p != "id")
+
+    query = f"""
+    MATCH (b:{label})
+    {where_str}
+    {match_str}
+    WITH b, collect(CASE WHEN r IS NULL THEN NULL
+                         ELSE {{id: r.id, source_id: a.id, target_id: b.id{projections}}} END) AS incoming
+    RETURN b, elementId(b) as nodeId, incoming
+    ORDER BY b.name
+    """
+
+    entities = []
+    with driver.session(default_access_mode=READ_ACCESS) as session:
+        result = session.run(query, params)
+        for record in result:
+            entity = dict(record["b"])
+            entity["_element_id"] = record["nodeId"]
+            entity["_incoming"] = [dict(rel) for rel in record["incoming"]]
+            entities.append(entity)
+
+    return entities
+
+
 def update_relationship(
     driver: Driver,
     rel_type: RelationshipTypeDefinition,
     rel_id: str,
-    data: Dict[str, Any]
+    data: Dict[str, Any],
+    return_previous: bool = False
 ) -> Optional[Dict[str, Any]]:
     """
     Update a relationship's properties.
@@ -302,6 +535,8 @@ def update_relationship(
         rel_type: Relationship type definition
         rel_id: Relationship ID
         data: Updated properties
+        return_previous: If True, attach the pre-update properties under
+            ``_previous`` (captured in the same query, no extra read)
         
     Returns:
         Updated relationship or None if not found
@@ -323,8 +558,9 @@ def update_relationship(
     
     query = f"""
     MATCH (a)-[r:{neo4j_type} {{id: $id}}]->(b)
+    WITH a, r, b, properties(r) AS before
     SET {set_clause}
-    RETURN r, a, b, elementId(r) as relId, a.id as source_id, b.id as target_id
+    RETURN r, before, a, b, elementId(r) as relId, a.id as source_id, b.id as target_id
     """
     
     with driver.session() as session:
@@ -335,6 +571,8 @@ def update_relationship(
             rel["_element_id"] = record["relId"]
             rel["source_id"] = record["source_id"]
             rel["target_id"] = record["target_id"]
+            if return_previous:
+                rel["_previous"] = dict(record["before"])
             return rel
     
     return None
@@ -414,7 +652,7 @@ def count_relationships(
     RETURN count(r) as cnt
     """
     
-    with driver.session() as session:
+    with driver.session(default_access_mode=READ_ACCESS) as session:
         result = session.run(query, params)
         record = result.single()
         return record["cnt"] if record else 0
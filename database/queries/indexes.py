@@ -0,0 +1,95 @@
+"""
+Index management queries.
+
+Derives the lookup indexes every query module relies on from the schema
+registry and creates them idempotently at connection time.
+"""
+
+from typing import Dict, List, Tuple
+from database.connection import Neo4jConnection
+from core import get_registry
+
+
+def _index_name(*parts: str) -> str:
+    """Build a stable, Cypher-safe index name."""
+    return "rim_" + "_".join(p.lower() for p in parts)
+
+
+def get_index_statements() -> List[Tuple[str, str]]:
+    """
+    Build the index DDL for the active schema.
+
+    Covers every ``MATCH (n:Label {id: $id})`` lookup (one id index per
+    node label and per relationship type), the ContextNode ``node_type``
+    discriminator used by every context-node query, and the Risk ``level``
+    filter.
+
+    Returns:
+        List of (index_name, statement) tuples
+    """
+    registry = get_registry()
+    statements = []
+    seen_labels = set()
+
+    for entity_type in registry.entity_types.values():
+        label = entity_type.neo4j_label
+        if label in seen_labels:
+            continue
+        seen_labels.add(label)
+        name = _index_name(label, "id")
+        statements.append((
+            name,
+            f"CREATE INDEX {name} IF NOT EXISTS FOR (n:{label}) ON (n.id)"
+        ))
+        if entity_type.is_context_node:
+            name = _index_name(label, "node_type")
+            statements.append((
+                name,
+                f"CREATE INDEX {name} IF NOT EXISTS FOR (n:{label}) ON (n.node_type)"
+            ))
+
+    risk_type = registry.get_entity_type("risk")
+    if risk_type:
+        risk_label = risk_type.neo4j_label
+        name = _index_name(risk_label, "level")
+        statements.append((
+            name,
+            f"CREATE INDEX {name} IF NOT EXISTS FOR (n:{risk_label}) ON (n.level)"
+        ))
+
+    seen_types = set()
+    for rel_type in registry.relationship_types.values():
+        neo4j_type = rel_type.neo4j_type
+        if neo4j_type in seen_types:
+            continue
+        seen_types.add(neo4j_type)
+        name = _index_name(neo4j_type, "id")
+        statements.append((
+            name,
+            f"CREATE INDEX {name} IF NOT EXISTS FOR ()-[r:{neo4j_type}]-() ON (r.id)"
+        ))
+
+    return statements
+
+
+def ensure_indexes(conn: Neo4jConnection) -> Dict[str, str]:
+    """
+    Create all schema-derived indexes that do not exist yet.
+
+    Safe to call on every startup: each statement is ``IF NOT EXISTS`` and a
+    failing statement (e.g. missing privileges) does not stop the others.
+
+    Args:
+        conn: Database connection
+
+    Returns:
+        Indexes that could not be created, as {index_name: error message}
+        (empty when all are in place)
+    """
+    failures = {}
+    for name, statement in get_index_statements():
+        try:
+            conn.execute_query(statement)
+        except Exception as e:
+            failures[name] = str(e)
+    return failures
@@ -5,7 +5,7 @@ Contains all Cypher queries for INFLUENCES relationship operations.
 """
 
 from typing import List, Dict, Any, Optional
-from database.connection import Neo4jConnection
+from database.connection import Neo4jConnection, normalize_ids, chunk_ids
 
 
 # =============================================================================
@@ -79,6 +79,59 @@ def create_influence(
     return result[0]["id"] if result else None
 
 
+def create_influences_bulk(
+    conn: Neo4jConnection,
+    rows: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """
+    Create many INFLUENCES relationships in a single round-trip.
+
+    Same semantics as ``create_influence`` (auto-determined type, no
+    duplicate edge between the same two risks), but all rows are sent as
+    one ``UNWIND`` batch.
+
+    Args:
+        conn: Database connection
+        rows: List of dicts with source_id, target_id, strength,
+            description and confidence
+
+    Returns:
+        List of {id, source_id, target_id} for the created influences.
+        Rows whose risks were not found or which already existed are absent.
+    """
+    if not rows:
+        return []
+
+    query = """
+    UNWIND $rows AS row
+    MATCH (source:Risk {id: row.source_id})
+    MATCH (target:Risk {id: row.target_id})
+
+    WITH row, source, target,
+         CASE
+            WHEN source.level = 'Operational' AND target.level = 'Business' THEN 'Level1_Op_to_Bus'
+            WHEN source.level = 'Business' AND target.level = 'Business' THEN 'Level2_Bus_to_Bus'
+            WHEN source.level = 'Operational' AND target.level = 'Operational' THEN 'Level3_Op_to_Op'
+            ELSE 'Unknown'
+         END as determined_type
+
+    WHERE NOT EXISTS((source)-[:INFLUENCES]->(target))
+
+    CREATE (source)-[i:INFLUENCES {
+        id: randomUUID(),
+        influence_type: determined_type,
+        strength: row.strength,
+        description: row.description,
+        confidence: row.confidence,
+        created_at: datetime(),
+        last_validated: datetime()
+    }]->(target)
+    RETURN i.id as id, source.id as source_id, target.id as target_id
+    """
+
+    return conn.execute_query(query, {"rows": rows})
+
+
 # =============================================================================
 # INFLUENCE READ OPERATIONS
 # =============================================================================
@@ -103,7 +156,7 @@ def get_all_influences(conn: Neo4jConnection) -> List[Dict[str, Any]]:
     ORDER BY i.strength DESC
     """
     
-    return conn.execute_query(query)
+    return conn.execute_read(query)
 
 
 def get_influence_by_id(conn: Neo4jConnection, influence_id: str) -> Optional[Dict[str, Any]]:
@@ -126,7 +179,7 @@ def get_influence_by_id(conn: Neo4jConnection, influence_id: str) -> Optional[Di
            i.description as description, i.confidence as confidence
     """
     
-    result = conn.execute_query(query, {"id": influence_id})
+    result = conn.execute_read(query, id=influence_id)
     return result[0] if result else None
 
 
@@ -150,7 +203,7 @@ def get_influences_from_risk(conn: Neo4jConnection, risk_id: str) -> List[Dict[s
     ORDER BY i.strength DESC
     """
     
-    return conn.execute_query(query, {"risk_id": risk_id})
+    return conn.execute_read(query, risk_id=risk_id)
 
 
 def get_influences_to_risk(conn: Neo4jConnection, risk_id: str) -> List[Dict[str, Any]]:
@@ -173,7 +226,7 @@ def get_influences_to_risk(conn: Neo4jConnection, risk_id: str) -> List[Dict[str
     ORDER BY i.strength DESC
     """
     
-    return conn.execute_query(query, {"risk_id": risk_id})
+    return conn.execute_read(query, risk_id=risk_id)
 
 
 def get_influence_edges(
@@ -193,15 +246,33 @@ def get_influence_edges(
     if not node_ids:
         return []
     
+    node_ids = normalize_ids(node_ids)
+    batches = chunk_ids(node_ids)
+    if len(batches) == 1:
+        query = """
+        MATCH (source:Risk)-[i:INFLUENCES]->(target:Risk)
+        WHERE source.id IN $node_ids AND target.id IN $node_ids
+        RETURN source.id as source, target.id as target,
+               i.influence_type as influence_type, i.strength as strength,
+               'INFLUENCES' as edge_type
+        """
+        return conn.execute_read(query, node_ids=node_ids)
+    
+    # Large selections: pair every source batch with every target batch
     query = """
     MATCH (source:Risk)-[i:INFLUENCES]->(target:Risk)
-    WHERE source.id IN $node_ids AND target.id IN $node_ids
+    WHERE source.id IN $source_ids AND target.id IN $target_ids
     RETURN source.id as source, target.id as target,
            i.influence_type as influence_type, i.strength as strength,
            'INFLUENCES' as edge_type
     """
-    
-    return conn.execute_query(query, {"node_ids": node_ids})
+    edges = []
+    for source_ids in batches:
+        for target_ids in batches:
+            edges.extend(conn.execute_read(
+                query, {"source_ids": source_ids, "target_ids": target_ids}
+            ))
+    return edges
 
 
 def get_influences_by_type(conn: Neo4jConnection, influence_type: str) -> List[Dict[str, Any]]:
@@ -224,7 +295,7 @@ def get_influences_by_type(conn: Neo4jConnection, influence_type: str) -> List[D
     ORDER BY i.strength DESC
     """
     
-    return conn.execute_query(query, {"influence_type": influence_type})
+    return conn.execute_read(query, influence_type=influence_type)
 
 
 # =============================================================================
@@ -291,7 +362,7 @@ def delete_influence(conn: Neo4jConnection, influence_id: str) -> bool:
     DELETE i
     """
     
-    conn.execute_query(query, {"id": influence_id})
+    conn.execute_query(query, id=influence_id)
     return True
 
 
@@ -327,7 +398,7 @@ def get_downstream_risks(
     ORDER BY depth, downstream.exposure DESC
     """ % max_depth
     
-    return conn.execute_query(query, {"risk_id": risk_id})
+    return conn.execute_read(query, risk_id=risk_id)
 
 
 def get_upstream_risks(
@@ -358,7 +429,7 @@ def get_upstream_risks(
     ORDER BY depth, upstream.exposure DESC
     """ % max_depth
     
-    return conn.execute_query(query, {"risk_id": risk_id})
+    return conn.execute_read(query, risk_id=risk_id)
 
 
 def get_influence_path(
@@ -393,7 +464,7 @@ def get_influence_path(
     RETURN path_nodes
     """ % max_depth
     
-    result = conn.execute_query(query, {"source_id": source_id, "target_id": target_id})
+    result = conn.execute_read(query, {"source_id": source_id, "target_id": target_id})
     return [r["path_nodes"] for r in result]
 
 
@@ -404,7 +475,7 @@ def get_influence_path(
 def get_influence_count(conn: Neo4jConnection) -> int:
     """Get total number of influences."""
     query = "MATCH ()-[i:INFLUENCES]->() RETURN count(i) as count"
-    result = conn.execute_query(query)
+    result = conn.execute_read(query)
     return result[0]["count"] if result else 0
 
 
@@ -415,7 +486,7 @@ def get_influence_count_by_type(conn: Neo4jConnection) -> Dict[str, int]:
     RETURN i.influence_type as type, count(i) as count
     ORDER BY count DESC
     """
-    result = conn.execute_query(query)
+    result = conn.execute_read(query)
     return {r["type"]: r["count"] for r in result if r["type"]}
 
 
@@ -426,7 +497,7 @@ def get_influence_count_by_strength(conn: Neo4jConnection) -> Dict[str, int]:
     RETURN i.strength as strength, count(i) as count
     ORDER BY count DESC
     """
-    result = conn.execute_query(query)
+    result = conn.execute_read(query)
     return {r["strength"]: r["count"] for r in result if r["strength"]}
 
 
@@ -450,7 +521,7 @@ def get_most_influential_risks(conn: Neo4jConnection, limit: int = 10) -> List[D
            r.exposure as exposure, influence_count
     """
     
-    return conn.execute_query(query, {"limit": limit})
+    return conn.execute_read(query, limit=limit)
 
 
 def get_most_influenced_risks(conn: Neo4jConnection, limit: int = 10) -> List[Dict[str, Any]]:
@@ -473,4 +544,4 @@ def get_most_influenced_risks(conn: Neo4jConnection, limit: int = 10) -> List[Di
            r.exposure as exposure, influenced_by_count
     """
     
-    return conn.execute_query(query, {"limit": limit})
+    return conn.execute_read(query, limit=limit)
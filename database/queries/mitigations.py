@@ -6,7 +6,7 @@ and MITIGATES relationship management.
 """
 
 from typing import List, Dict, Any, Optional
-from database.connection import Neo4jConnection
+from database.connection import Neo4jConnection, normalize_ids, chunk_ids
 
 
 # =============================================================================
@@ -80,6 +80,17 @@ def create_mitigation(
 # MITIGATION READ OPERATIONS
 # =============================================================================
 
+_ALL_MITIGATIONS_QUERY = """
+MATCH (m:Mitigation)
+WHERE ($types IS NULL OR m.type IN $types)
+  AND ($statuses IS NULL OR m.status IN $statuses)
+RETURN m.id as id, m.name as name, m.type as type,
+       m.status as status, m.description as description,
+       m.owner as owner, m.source_entity as source_entity
+ORDER BY m.name
+"""
+
+
 def get_all_mitigations(
     conn: Neo4jConnection,
     type_filter: Optional[List[str]] = None,
@@ -96,29 +107,12 @@ def get_all_mitigations(
     Returns:
         List of mitigation dictionaries
     """
-    conditions = []
-    params = {}
-    
-    if type_filter and len(type_filter) > 0:
-        conditions.append("m.type IN $types")
-        params["types"] = type_filter
-    
-    if status_filter and len(status_filter) > 0:
-        conditions.append("m.status IN $statuses")
-        params["statuses"] = status_filter
-    
-    where_clause = "WHERE " + " AND ".join(conditions) if conditions else ""
-    
-    query = f"""
-    MATCH (m:Mitigation)
-    {where_clause}
-    RETURN m.id as id, m.name as name, m.type as type,
-           m.status as status, m.description as description,
-           m.owner as owner, m.source_entity as source_entity
-    ORDER BY m.name
-    """
-    
-    return conn.execute_query(query, params)
+    # Empty filters bind as null so both cases share one cached query plan
+    return conn.execute_read(
+        _ALL_MITIGATIONS_QUERY,
+        types=type_filter or None,
+        statuses=status_filter or None
+    )
 
 
 def get_mitigation_by_id(conn: Neo4jConnection, mitigation_id: str) -> Optional[Dict[str, Any]]:
@@ -139,7 +133,7 @@ def get_mitigation_by_id(conn: Neo4jConnection, mitigation_id: str) -> Optional[
            m.owner as owner, m.source_entity as source_entity
     """
     
-    result = conn.execute_query(query, {"id": mitigation_id})
+    result = conn.execute_read(query, id=mitigation_id)
     return result[0] if result else None
 
 
@@ -161,7 +155,7 @@ def get_mitigation_by_name(conn: Neo4jConnection, name: str) -> Optional[Dict[st
            m.owner as owner, m.source_entity as source_entity
     """
     
-    result = conn.execute_query(query, {"name": name})
+    result = conn.execute_read(query, name=name)
     return result[0] if result else None
 
 
@@ -205,7 +199,7 @@ def get_mitigations_for_graph(
     ORDER BY m.name
     """
     
-    return conn.execute_query(query, params)
+    return conn.execute_read(query, params)
 
 
 # =============================================================================
@@ -295,7 +289,7 @@ def delete_mitigation(conn: Neo4jConnection, mitigation_id: str) -> bool:
     DETACH DELETE m
     """
     
-    conn.execute_query(query, {"id": mitigation_id})
+    conn.execute_query(query, id=mitigation_id)
     return True
 
 
@@ -350,6 +344,49 @@ def create_mitigates_relationship(
     return result[0]["id"] if result else None
 
 
+def create_mitigates_relationships_bulk(
+    conn: Neo4jConnection,
+    rows: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """
+    Create many MITIGATES relationships in a single round-trip.
+
+    Same semantics as ``create_mitigates_relationship`` (no duplicate edge
+    between a mitigation and a risk), but all rows are sent as one
+    ``UNWIND`` batch.
+
+    Args:
+        conn: Database connection
+        rows: List of dicts with mitigation_id, risk_id, effectiveness
+            and description
+
+    Returns:
+        List of {id, mitigation_id, risk_id} for the created relationships.
+        Rows whose endpoints were not found or which already existed are absent.
+    """
+    if not rows:
+        return []
+
+    query = """
+    UNWIND $rows AS row
+    MATCH (m:Mitigation {id: row.mitigation_id})
+    MATCH (r:Risk {id: row.risk_id})
+
+    WITH row, m, r
+    WHERE NOT EXISTS((m)-[:MITIGATES]->(r))
+
+    CREATE (m)-[rel:MITIGATES {
+        id: randomUUID(),
+        effectiveness: row.effectiveness,
+        description: row.description,
+        created_at: datetime()
+    }]->(r)
+    RETURN rel.id as id, m.id as mitigation_id, r.id as risk_id
+    """
+
+    return conn.execute_query(query, {"rows": rows})
+
+
 def get_all_mitigates_relationships(conn: Neo4jConnection) -> List[Dict[str, Any]]:
     """
     Retrieve all MITIGATES relationships.
@@ -369,7 +406,7 @@ def get_all_mitigates_relationships(conn: Neo4jConnection) -> List[Dict[str, Any
     ORDER BY m.name, r.name
     """
     
-    return conn.execute_query(query)
+    return conn.execute_read(query)
 
 
 def get_mitigations_for_risk(conn: Neo4jConnection, risk_id: str) -> List[Dict[str, Any]]:
@@ -391,7 +428,7 @@ def get_mitigations_for_risk(conn: Neo4jConnection, risk_id: str) -> List[Dict[s
     ORDER BY rel.effectiveness DESC
     """
     
-    return conn.execute_query(query, {"risk_id": risk_id})
+    return conn.execute_read(query, risk_id=risk_id)
 
 
 def get_risks_for_mitigation(conn: Neo4jConnection, mitigation_id: str) -> List[Dict[str, Any]]:
@@ -413,7 +450,7 @@ def get_risks_for_mitigation(conn: Neo4jConnection, mitigation_id: str) -> List[
     ORDER BY r.exposure DESC
     """
     
-    return conn.execute_query(query, {"mitigation_id": mitigation_id})
+    return conn.execute_read(query, mitigation_id=mitigation_id)
 
 
 def get_mitigates_edges(
@@ -443,7 +480,13 @@ def get_mitigates_edges(
            'MITIGATES' as edge_type
     """
     
-    return conn.execute_query(query, {"mit_ids": mitigation_ids, "risk_ids": risk_ids})
+    edges = []
+    for mit_batch in chunk_ids(normalize_ids(mitigation_ids)):
+        for risk_batch in chunk_ids(normalize_ids(risk_ids)):
+            edges.extend(conn.execute_read(
+                query, {"mit_ids": mit_batch, "risk_ids": risk_batch}
+            ))
+    return edges
 
 
 def update_mitigates_relationship(
@@ -497,7 +540,7 @@ def delete_mitigates_relationship(conn: Neo4jConnection, relationship_id: str) -
     DELETE rel
     """
     
-    conn.execute_query(query, {"id": relationship_id})
+    conn.execute_query(query, id=relationship_id)
     return True
 
 
@@ -508,14 +551,14 @@ def delete_mitigates_relationship(conn: Neo4jConnection, relationship_id: str) -
 def get_mitigation_count(conn: Neo4jConnection) -> int:
     """Get total number of mitigations."""
     query = "MATCH (m:Mitigation) RETURN count(m) as count"
-    result = conn.execute_query(query)
+    result = conn.execute_read(query)
     return result[0]["count"] if result else 0
 
 
 def get_mitigates_count(conn: Neo4jConnection) -> int:
     """Get total number of MITIGATES relationships."""
     query = "MATCH ()-[rel:MITIGATES]->() RETURN count(rel) as count"
-    result = conn.execute_query(query)
+    result = conn.execute_read(query)
     return result[0]["count"] if result else 0
 
 
@@ -526,7 +569,7 @@ def get_mitigation_count_by_type(conn: Neo4jConnection) -> Dict[str, int]:
     RETURN m.type as type, count(m) as count
     ORDER BY count DESC
     """
-    result = conn.execute_query(query)
+    result = conn.execute_read(query)
     return {r["type"]: r["count"] for r in result if r["type"]}
 
 
@@ -537,7 +580,7 @@ def get_mitigation_count_by_status(conn: Neo4jConnection) -> Dict[str, int]:
     RETURN m.status as status, count(m) as count
     ORDER BY count DESC
     """
-    result = conn.execute_query(query)
+    result = conn.execute_read(query)
     return {r["status"]: r["count"] for r in result if r["status"]}
 
 
@@ -560,7 +603,7 @@ def get_unmitigated_risks(conn: Neo4jConnection) -> List[Dict[str, Any]]:
     ORDER BY r.exposure DESC
     """
     
-    return conn.execute_query(query)
+    return conn.execute_read(query)
 
 
 def get_risk_mitigation_summary(conn: Neo4jConnection) -> List[Dict[str, Any]]:
@@ -591,4 +634,4 @@ def get_risk_mitigation_summary(conn: Neo4jConnection) -> List[Dict[str, Any]]:
     ORDER BY mitigation_count ASC, r.exposure DESC
     """
     
-    return conn.execute_query(query)
+    return conn.execute_read(query)
@@ -226,7 +226,7 @@ def get_all_risks(
     ORDER BY r.exposure DESC
     """
     
-    results = conn.execute_query(query, params)
+    results = conn.execute_read(query, params)
     # Post-process: extract subtype and ext_* keys from all_props into each result
     processed = []
     for row in results:
@@ -276,7 +276,7 @@ def get_risk_by_id(conn: Neo4jConnection, risk_id: str) -> Optional[Dict[str, An
            CASE WHEN computed_distance = -1 THEN true ELSE false END as is_orphan
     """
 
-    result = conn.execute_query(query, {"id": risk_id})
+    result = conn.execute_read(query, id=risk_id)
     if not result:
         return None
     # Post-process: extract subtype and ext_* keys from all_props
@@ -318,7 +318,7 @@ def get_risk_by_name(conn: Neo4jConnection, name: str) -> Optional[Dict[str, Any
            CASE WHEN computed_distance = -1 THEN true ELSE false END as is_orphan
     """
     
-    result = conn.execute_query(query, {"name": name})
+    result = conn.execute_read(query, name=name)
     return result[0] if result else None
 
 
@@ -410,7 +410,7 @@ def get_risks_with_filters(
     ORDER BY r.exposure DESC
     """
     
-    results = conn.execute_query(query, params)
+    results = conn.execute_read(query, params)
     # Post-process: extract subtype from all_props (avoids Neo4j warning)
     processed = []
     for row in results:
@@ -568,7 +568,7 @@ def delete_risk(conn: Neo4jConnection, risk_id: str) -> bool:
     DETACH DELETE r
     """
     
-    conn.execute_query(query, {"id": risk_id})
+    conn.execute_query(query, id=risk_id)
     return True
 
 
@@ -579,28 +579,28 @@ def delete_risk(conn: Neo4jConnection, risk_id: str) -> bool:
 def get_risk_count(conn: Neo4jConnection) -> int:
     """Get total number of risks."""
     query = "MATCH (r:Risk) RETURN count(r) as count"
-    result = conn.execute_query(query)
+    result = conn.execute_read(query)
     return result[0]["count"] if result else 0
 
 
 def get_risk_count_by_level(conn: Neo4jConnection, level: str) -> int:
     """Get number of risks by level."""
     query = "MATCH (r:Risk {level: $level}) RETURN count(r) as count"
-    result = conn.execute_query(query, {"level": level})
+    result = conn.execute_read(query, level=level)
     return result[0]["count"] if result else 0
 
 
 def get_risk_count_by_status(conn: Neo4jConnection, status: str) -> int:
     """Get number of risks by status."""
     query = "MATCH (r:Risk {status: $status}) RETURN count(r) as count"
-    result = conn.execute_query(query, {"status": status})
+    result = conn.execute_read(query, status=status)
     return result[0]["count"] if result else 0
 
 
 def get_risk_count_by_origin(conn: Neo4jConnection, origin: str) -> int:
     """Get number of risks by origin."""
     query = "MATCH (r:Risk {origin: $origin}) RETURN count(r) as count"
-    result = conn.execute_query(query, {"origin": origin})
+    result = conn.execute_read(query, origin=origin)
     return result[0]["count"] if result else 0
 
 
@@ -611,7 +611,7 @@ def get_average_exposure(conn: Neo4jConnection) -> float:
     WHERE r.exposure IS NOT NULL 
     RETURN avg(r.exposure) as avg
     """
-    result = conn.execute_query(query)
+    result = conn.execute_read(query)
     return round(result[0]["avg"] or 0, 2) if result else 0
 
 
@@ -623,7 +623,7 @@ def get_risk_count_by_category(conn: Neo4jConnection) -> Dict[str, int]:
     RETURN category, count(r) as count
     ORDER BY count DESC
     """
-    result = conn.execute_query(query)
+    result = conn.execute_read(query)
     return {r["category"]: r["count"] for r in result}
 
 
@@ -681,7 +681,7 @@ def get_archive_candidates(
     ORDER BY r.acceptance_date ASC
     """
 
-    result = conn.execute_query(query, params)
+    result = conn.execute_read(query, params)
     return [dict(row) for row in result]
 
 
@@ -708,7 +708,7 @@ def get_all_templates(conn: Neo4jConnection) -> List[Dict[str, Any]]:
            properties(r) as all_props
     ORDER BY r.name ASC
     """
-    results = conn.execute_query(query)
+    results = conn.execute_read(query)
     processed = []
     for row in results:
         row_dict = dict(row)
@@ -770,7 +770,7 @@ def get_instances_of_template(
            i.severity as severity, i.exposure as exposure
     ORDER BY i.name ASC
     """
-    result = conn.execute_query(query, {"template_id": template_id})
+    result = conn.execute_read(query, template_id=template_id)
     return [dict(row) for row in result]
 
 
@@ -795,5 +795,5 @@ def get_template_of_instance(
            t.severity as severity, t.is_template as is_template
     LIMIT 1
     """
-    result = conn.execute_query(query, {"instance_id": instance_id})
+    result = conn.execute_read(query, instance_id=instance_id)
     return dict(result[0]) if result else None
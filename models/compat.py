@@ -0,0 +1,9 @@
+"""
+Interpreter compatibility helpers for dataclasses.
+"""
+
+import sys
+
+# Keyword arguments for ``@dataclass(**DATACLASS_SLOTS)``: classes that are
+# created in bulk get __slots__ where dataclasses support it (Python 3.10+)
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
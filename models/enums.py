@@ -23,6 +23,12 @@ They may be removed in a future version.
 from enum import Enum
 
 
+def _bind_member_attr(enum_cls, attr: str, values: dict, default) -> None:
+    """Attach a constant per-member attribute so properties avoid rebuilding lookup dicts."""
+    for member in enum_cls:
+        setattr(member, attr, values.get(member, default))
+
+
 class RiskLevel(str, Enum):
     """Risk hierarchy levels."""
     BUSINESS = "Business"
@@ -58,16 +64,18 @@ class RiskStatus(str, Enum):
     @property
     def icon(self) -> str:
         """Return emoji icon for the status."""
-        icons = {
-            RiskStatus.ACTIVE: "✅",
-            RiskStatus.CONTINGENT: "⚠️",
-            RiskStatus.ARCHIVED: "📦",
-            RiskStatus.ACCEPTED: "✔️",
-            RiskStatus.WATCHING: "👁️",
-            RiskStatus.SUPPRESSED: "💤",
-            RiskStatus.CLOSED: "🔒",
-        }
-        return icons.get(self, "⚪")
+        return self._icon
+
+
+_bind_member_attr(RiskStatus, "_icon", {
+    RiskStatus.ACTIVE: "✅",
+    RiskStatus.CONTINGENT: "⚠️",
+    RiskStatus.ARCHIVED: "📦",
+    RiskStatus.ACCEPTED: "✔️",
+    RiskStatus.WATCHING: "👁️",
+    RiskStatus.SUPPRESSED: "💤",
+    RiskStatus.CLOSED: "🔒",
+}, "⚪")
 
 
 LIFECYCLE_INACTIVE_STATUSES: frozenset = frozenset({
@@ -129,22 +137,24 @@ class MitigationType(str, Enum):
     @property
     def icon(self) -> str:
         """Return emoji icon for the type."""
-        icons = {
-            MitigationType.DEDICATED: "🟢",
-            MitigationType.INHERITED: "🔵",
-            MitigationType.BASELINE: "🟣"
-        }
-        return icons.get(self, "⚪")
+        return self._icon
     
     @property
     def color(self) -> str:
         """Return color code for the type."""
-        colors = {
-            MitigationType.DEDICATED: "#27ae60",
-            MitigationType.INHERITED: "#3498db",
-            MitigationType.BASELINE: "#9b59b6"
-        }
-        return colors.get(self, "#27ae60")
+        return self._color
+
+
+_bind_member_attr(MitigationType, "_icon", {
+    MitigationType.DEDICATED: "🟢",
+    MitigationType.INHERITED: "🔵",
+    MitigationType.BASELINE: "🟣",
+}, "⚪")
+_bind_member_attr(MitigationType, "_color", {
+    MitigationType.DEDICATED: "#27ae60",
+    MitigationType.INHERITED: "#3498db",
+    MitigationType.BASELINE: "#9b59b6",
+}, "#27ae60")
 
 
 class MitigationStatus(str, Enum):
@@ -160,13 +170,15 @@ class MitigationStatus(str, Enum):
     @property
     def icon(self) -> str:
         """Return emoji icon for the status."""
-        icons = {
-            MitigationStatus.PROPOSED: "📋",
-            MitigationStatus.IN_PROGRESS: "🔄",
-            MitigationStatus.IMPLEMENTED: "✅",
-            MitigationStatus.DEFERRED: "⏸️"
-        }
-        return icons.get(self, "⚪")
+        return self._icon
+
+
+_bind_member_attr(MitigationStatus, "_icon", {
+    MitigationStatus.PROPOSED: "📋",
+    MitigationStatus.IN_PROGRESS: "🔄",
+    MitigationStatus.IMPLEMENTED: "✅",
+    MitigationStatus.DEFERRED: "⏸️",
+}, "⚪")
 
 
 class Effectiveness(str, Enum):
@@ -182,24 +194,26 @@ class Effectiveness(str, Enum):
     @property
     def value_score(self) -> int:
         """Return numeric score for the effectiveness."""
-        scores = {
-            Effectiveness.LOW: 1,
-            Effectiveness.MEDIUM: 2,
-            Effectiveness.HIGH: 3,
-            Effectiveness.CRITICAL: 4
-        }
-        return scores.get(self, 2)
+        return self._value_score
     
     @property
     def icon(self) -> str:
         """Return emoji icon for the effectiveness."""
-        icons = {
-            Effectiveness.LOW: "🟢",
-            Effectiveness.MEDIUM: "🟡",
-            Effectiveness.HIGH: "🟠",
-            Effectiveness.CRITICAL: "🔴"
-        }
-        return icons.get(self, "⚪")
+        return self._icon
+
+
+_bind_member_attr(Effectiveness, "_value_score", {
+    Effectiveness.LOW: 1,
+    Effectiveness.MEDIUM: 2,
+    Effectiveness.HIGH: 3,
+    Effectiveness.CRITICAL: 4,
+}, 2)
+_bind_member_attr(Effectiveness, "_icon", {
+    Effectiveness.LOW: "🟢",
+    Effectiveness.MEDIUM: "🟡",
+    Effectiveness.HIGH: "🟠",
+    Effectiveness.CRITICAL: "🔴",
+}, "⚪")
 
 
 class InfluenceStrength(str, Enum):
@@ -215,13 +229,15 @@ class InfluenceStrength(str, Enum):
     @property
     def value_score(self) -> int:
         """Return numeric score for the strength."""
-        scores = {
-            InfluenceStrength.WEAK: 1,
-            InfluenceStrength.MODERATE: 2,
-            InfluenceStrength.STRONG: 3,
-            InfluenceStrength.CRITICAL: 4
-        }
-        return scores.get(self, 2)
+        return self._value_score
+
+
+_bind_member_attr(InfluenceStrength, "_value_score", {
+    InfluenceStrength.WEAK: 1,
+    InfluenceStrength.MODERATE: 2,
+    InfluenceStrength.STRONG: 3,
+    InfluenceStrength.CRITICAL: 4,
+}, 2)
 
 
 class ImpactLevel(str, Enum):
@@ -237,24 +253,26 @@ class ImpactLevel(str, Enum):
     @property
     def value_score(self) -> int:
         """Return numeric score for the impact."""
-        scores = {
-            ImpactLevel.LOW: 1,
-            ImpactLevel.MEDIUM: 2,
-            ImpactLevel.HIGH: 3,
-            ImpactLevel.CRITICAL: 4
-        }
-        return scores.get(self, 2)
+        return self._value_score
     
     @property
     def icon(self) -> str:
         """Return emoji icon for the impact level."""
-        icons = {
-            ImpactLevel.LOW: "🟢",
-            ImpactLevel.MEDIUM: "🟡",
-            ImpactLevel.HIGH: "🟠",
-            ImpactLevel.CRITICAL: "🔴"
-        }
-        return icons.get(self, "⚪")
+        return self._icon
+
+
+_bind_member_attr(ImpactLevel, "_value_score", {
+    ImpactLevel.LOW: 1,
+    ImpactLevel.MEDIUM: 2,
+    ImpactLevel.HIGH: 3,
+    ImpactLevel.CRITICAL: 4,
+}, 2)
+_bind_member_attr(ImpactLevel, "_icon", {
+    ImpactLevel.LOW: "🟢",
+    ImpactLevel.MEDIUM: "🟡",
+    ImpactLevel.HIGH: "🟠",
+    ImpactLevel.CRITICAL: "🔴",
+}, "⚪")
 
 
 class InfluenceType(str, Enum):
@@ -270,24 +288,12 @@ class InfluenceType(str, Enum):
     @property
     def icon(self) -> str:
         """Return emoji icon for the influence type."""
-        icons = {
-            InfluenceType.LEVEL1_OP_TO_BUS: "🔴",
-            InfluenceType.LEVEL2_BUS_TO_BUS: "🟣",
-            InfluenceType.LEVEL3_OP_TO_OP: "🔵",
-            InfluenceType.UNKNOWN: "⚪"
-        }
-        return icons.get(self, "⚪")
+        return self._icon
     
     @property
     def color(self) -> str:
         """Return color code for the influence type."""
-        colors = {
-            InfluenceType.LEVEL1_OP_TO_BUS: "#e74c3c",
-            InfluenceType.LEVEL2_BUS_TO_BUS: "#9b59b6",
-            InfluenceType.LEVEL3_OP_TO_OP: "#3498db",
-            InfluenceType.UNKNOWN: "#95a5a6"
-        }
-        return colors.get(self, "#95a5a6")
+        return self._color
     
     @classmethod
     def from_levels(cls, source_level: RiskLevel, target_level: RiskLevel) -> "InfluenceType":
@@ -302,6 +308,20 @@ class InfluenceType(str, Enum):
             return cls.UNKNOWN
 
 
+_bind_member_attr(InfluenceType, "_icon", {
+    InfluenceType.LEVEL1_OP_TO_BUS: "🔴",
+    InfluenceType.LEVEL2_BUS_TO_BUS: "🟣",
+    InfluenceType.LEVEL3_OP_TO_OP: "🔵",
+    InfluenceType.UNKNOWN: "⚪",
+}, "⚪")
+_bind_member_attr(InfluenceType, "_color", {
+    InfluenceType.LEVEL1_OP_TO_BUS: "#e74c3c",
+    InfluenceType.LEVEL2_BUS_TO_BUS: "#9b59b6",
+    InfluenceType.LEVEL3_OP_TO_OP: "#3498db",
+    InfluenceType.UNKNOWN: "#95a5a6",
+}, "#95a5a6")
+
+
 class CoverageStatus(str, Enum):
     """Risk mitigation coverage status."""
     UNMITIGATED = "unmitigated"
@@ -315,21 +335,23 @@ class CoverageStatus(str, Enum):
     @property
     def icon(self) -> str:
         """Return emoji icon for the coverage status."""
-        icons = {
-            CoverageStatus.UNMITIGATED: "⚠️",
-            CoverageStatus.PROPOSED_ONLY: "📋",
-            CoverageStatus.PARTIALLY_COVERED: "🔶",
-            CoverageStatus.WELL_COVERED: "✅"
-        }
-        return icons.get(self, "⚪")
+        return self._icon
     
     @property
     def label(self) -> str:
         """Return human-readable label."""
-        labels = {
-            CoverageStatus.UNMITIGATED: "No Mitigations",
-            CoverageStatus.PROPOSED_ONLY: "Only Proposed",
-            CoverageStatus.PARTIALLY_COVERED: "Partially Covered",
-            CoverageStatus.WELL_COVERED: "Well Covered"
-        }
-        return labels.get(self, "Unknown")
+        return self._label
+
+
+_bind_member_attr(CoverageStatus, "_icon", {
+    CoverageStatus.UNMITIGATED: "⚠️",
+    CoverageStatus.PROPOSED_ONLY: "📋",
+    CoverageStatus.PARTIALLY_COVERED: "🔶",
+    CoverageStatus.WELL_COVERED: "✅",
+}, "⚪")
+_bind_member_attr(CoverageStatus, "_label", {
+    CoverageStatus.UNMITIGATED: "No Mitigations",
+    CoverageStatus.PROPOSED_ONLY: "Only Proposed",
+    CoverageStatus.PARTIALLY_COVERED: "Partially Covered",
+    CoverageStatus.WELL_COVERED: "Well Covered",
+}, "Unknown")
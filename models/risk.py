@@ -6,10 +6,26 @@ Represents a risk entity in the Risk Influence Map system.
 
 from dataclasses import dataclass, field
 from datetime import datetime
+from operator import attrgetter
 from typing import List, Optional
 from models.enums import RiskLevel, RiskStatus, RiskOrigin
 
 
+# Fields serialized by Risk.to_dict, in output order
+_RISK_DICT_FIELDS = (
+    "id", "name", "level", "origin", "categories", "status", "description",
+    "owner", "probability", "severity", "exposure", "trigger_condition",
+    "acceptance_date", "acceptance_owner", "archive_date", "is_template",
+    "current_score_type",
+)
+_get_risk_dict_values = attrgetter(*_RISK_DICT_FIELDS)
+
+# Stored string -> enum member, used for enum coercion on construction
+_LEVEL_MAP = {m.value: m for m in RiskLevel}
+_STATUS_MAP = {m.value: m for m in RiskStatus}
+_ORIGIN_MAP = {m.value: m for m in RiskOrigin}
+
+
 @dataclass
 class Risk:
     """
@@ -63,17 +79,17 @@ class Risk:
 
     def __post_init__(self):
         """Post-initialization processing."""
-        # Convert string level to enum if needed
+        # Convert string level/status/origin to enums if needed. The value
+        # maps are plain dict lookups; the enum call is only reached for
+        # unknown values, so invalid input still raises ValueError.
         if isinstance(self.level, str):
-            self.level = RiskLevel(self.level)
+            self.level = _LEVEL_MAP.get(self.level) or RiskLevel(self.level)
 
-        # Convert string status to enum if needed
         if isinstance(self.status, str):
-            self.status = RiskStatus(self.status)
+            self.status = _STATUS_MAP.get(self.status) or RiskStatus(self.status)
 
-        # Convert string origin to enum if needed
         if isinstance(self.origin, str):
-            self.origin = RiskOrigin(self.origin)
+            self.origin = _ORIGIN_MAP.get(self.origin) or RiskOrigin(self.origin)
 
         # Calculate exposure if not provided
         if self.exposure is None and self.probability and self.severity:
@@ -136,25 +152,11 @@ class Risk:
 
     def to_dict(self) -> dict:
         """Convert to dictionary representation."""
-        return {
-            "id": self.id,
-            "name": self.name,
-            "level": str(self.level),
-            "origin": str(self.origin),
-            "categories": self.categories,
-            "status": str(self.status),
-            "description": self.description,
-            "owner": self.owner,
-            "probability": self.probability,
-            "severity": self.severity,
-            "exposure": self.exposure,
-            "trigger_condition": self.trigger_condition,
-            "acceptance_date": self.acceptance_date,
-            "acceptance_owner": self.acceptance_owner,
-            "archive_date": self.archive_date,
-            "is_template": self.is_template,
-            "current_score_type": self.current_score_type,
-        }
+        data = dict(zip(_RISK_DICT_FIELDS, _get_risk_dict_values(self)))
+        data["level"] = str(self.level)
+        data["origin"] = str(self.origin)
+        data["status"] = str(self.status)
+        return data
 
     @classmethod
     def from_dict(cls, data: dict) -> "Risk":
@@ -184,3 +186,50 @@ class Risk:
     def from_neo4j_record(cls, record: dict) -> "Risk":
         """Create Risk instance from Neo4j query result."""
         return cls.from_dict(dict(record))
+
+    @classmethod
+    def from_neo4j_record_fast(cls, record) -> "Risk":
+        """
+        Create Risk instance from a trusted Neo4j record.
+
+        Equivalent to from_neo4j_record but skips the intermediate dict copy,
+        the from_dict call and __post_init__: enum fields are resolved through
+        precomputed value maps and fields are assigned directly. Unknown enum
+        values still raise ValueError, as with the regular constructor.
+
+        Args:
+            record: Neo4j record or mapping with risk properties
+
+        Returns:
+            Risk instance
+        """
+        get = record.get
+        obj = object.__new__(cls)
+        level = get("level") or "Business"
+        status = get("status") or "Active"
+        origin = get("origin") or "New"
+        obj.id = get("id") or ""
+        obj.name = get("name") or ""
+        obj.level = _LEVEL_MAP.get(level) or RiskLevel(level)
+        obj.categories = get("categories") or []
+        obj.status = _STATUS_MAP.get(status) or RiskStatus(status)
+        obj.origin = _ORIGIN_MAP.get(origin) or RiskOrigin(origin)
+        obj.description = get("description") or ""
+        obj.owner = get("owner") or ""
+        obj.probability = probability = get("probability")
+        obj.severity = severity = get("severity")
+        exposure = get("exposure")
+        if exposure is None and probability and severity:
+            exposure = probability * severity
+        obj.exposure = exposure
+        obj.trigger_condition = get("trigger_condition") or get("activation_condition")
+        obj.acceptance_date = get("acceptance_date") or get("activation_decision_date")
+        obj.acceptance_owner = get("acceptance_owner")
+        obj.archive_date = get("archive_date")
+        obj.is_template = bool(get("is_template", False))
+        obj.current_score_type = get("current_score_type") or "None"
+        obj.created_at = None
+        obj.updated_at = None
+        obj.last_review_date = None
+        obj.next_review_date = None
+        return obj
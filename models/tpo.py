@@ -6,10 +6,18 @@ Represents a program objective that risks may impact.
 
 from dataclasses import dataclass
 from datetime import datetime
+from operator import attrgetter
 from typing import Optional
 from models.enums import TPOCluster
 
 
+_VALID_TPO_CLUSTERS = frozenset(c.value for c in TPOCluster)
+
+# Fields serialized by TPO.to_dict, in output order
+_TPO_DICT_FIELDS = ("id", "reference", "name", "cluster", "description")
+_get_tpo_dict_values = attrgetter(*_TPO_DICT_FIELDS)
+
+
 @dataclass
 class TPO:
     """
@@ -36,8 +44,7 @@ class TPO:
     def __post_init__(self):
         """Post-initialization processing."""
         # Validate cluster if it's a known value
-        valid_clusters = [e.value for e in TPOCluster]
-        if self.cluster and self.cluster not in valid_clusters:
+        if self.cluster and self.cluster not in _VALID_TPO_CLUSTERS:
             # Keep the value but could log a warning
             pass
     
@@ -63,13 +70,7 @@ class TPO:
     
     def to_dict(self) -> dict:
         """Convert to dictionary representation."""
-        return {
-            "id": self.id,
-            "reference": self.reference,
-            "name": self.name,
-            "cluster": self.cluster,
-            "description": self.description,
-        }
+        return dict(zip(_TPO_DICT_FIELDS, _get_tpo_dict_values(self)))
     
     @classmethod
     def from_dict(cls, data: dict) -> "TPO":
@@ -24,6 +24,8 @@ from services.mitigation_analysis import (
 from services.export_service import (
     export_to_excel,
     export_to_excel_bytes,
+    export_to_parquet,
+    export_to_csv_zip,
     export_analysis_report,
 )
 
@@ -56,6 +58,8 @@ __all__ = [
     # Export
     "export_to_excel",
     "export_to_excel_bytes",
+    "export_to_parquet",
+    "export_to_csv_zip",
     "export_analysis_report",
     # Import
     "ExcelImporter",
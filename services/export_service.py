@@ -51,51 +51,134 @@ def _coerce_value(v):
     return v
 
 
-def _coerce_records(records):
+# Excel's limit on cell contents
+_EXCEL_MAX_CELL_CHARS = 32767
+
+
+def _excel_cell(v):
     """
-    Apply _coerce_value to every field in every record dict.
+    Convert a coerced record value to something every writer accepts.
 
-    Call this before building any DataFrame that will be written to Excel.
+    Mirrors what pandas' Excel writers do: numbers, bools, strings and
+    dates pass through, NaN becomes an empty cell, timedeltas become a
+    fraction of days and anything else (lists, dicts, ...) is stringified.
     """
-    return [{k: _coerce_value(val) for k, val in dict(r).items()} for r in records]
+    import datetime as _dt_mod
 
+    if v is None or isinstance(v, (str, bool, int, _dt_mod.date)):
+        pass
+    elif isinstance(v, float):
+        if v != v:
+            return None
+    elif isinstance(v, _dt_mod.timedelta):
+        return v.total_seconds() / 86400
+    else:
+        v = str(v)
+    if isinstance(v, str) and len(v) > _EXCEL_MAX_CELL_CHARS:
+        v = v[:_EXCEL_MAX_CELL_CHARS]
+    return v
 
-def _strip_tz(df):
-    """
-    Last-resort pass: strip tz from any pandas DatetimeTZDtype columns.
 
-    _coerce_records() handles the common case (Neo4j object columns).
-    This catches any remaining tz-aware datetime64[ns, tz] columns.
-    """
-    import pandas as pd
+# =============================================================================
+# RECORD-LEVEL SHEET PLANNING (no DataFrame)
+# =============================================================================
 
-    for col in df.columns:
-        if pd.api.types.is_datetime64_any_dtype(df[col]):
-            if getattr(df[col].dt, "tz", None) is not None:
-                df[col] = df[col].dt.tz_localize(None)
-    return df
+def _is_null(v) -> bool:
+    """True for None and float NaN (what DataFrame.dropna treats as missing)."""
+    return v is None or (isinstance(v, float) and v != v)
 
 
-def _clean_risk_df(df):
-    """Clean risk DataFrame for export: remove internal columns, reorder, drop all-null ext_ columns."""
-    # Drop internal columns
-    for col in ["all_props", "is_orphan", "computed_distance"]:
-        if col in df.columns:
-            df = df.drop(columns=[col])
-    
-    # Drop ext_* columns that are entirely null
-    ext_cols = [c for c in df.columns if c.startswith("ext_")]
-    for col in ext_cols:
-        if df[col].isna().all():
-            df = df.drop(columns=[col])
-    
-    # Reorder: standard columns first, then subtype, then ext_* columns
-    standard_cols = [c for c in df.columns if not c.startswith("ext_") and c != "subtype"]
-    subtype_col = ["subtype"] if "subtype" in df.columns else []
-    remaining_ext = [c for c in df.columns if c.startswith("ext_")]
-    df = df[standard_cols + subtype_col + remaining_ext]
-    
-    return df
+def _union_columns(records: List[Dict[str, Any]]) -> List[str]:
+    """Ordered union of record keys, in first-seen order (as pandas does)."""
+    seen = {}
+    for r in records:
+        for k in r.keys():
+            if k not in seen:
+                seen[k] = None
+    return list(seen)
+
+
+def _non_null_columns(records: List[Dict[str, Any]], columns: List[str]) -> List[str]:
+    """Keep only columns with at least one non-null value."""
+    return [c for c in columns if any(not _is_null(r.get(c)) for r in records)]
+
+
+def _risk_sheet_columns(records: List[Dict[str, Any]]) -> List[str]:
+    """Risk columns: internal columns removed, all-null ext_* dropped, ext_* last."""
+    columns = [
+        c for c in _union_columns(records)
+        if c not in ("all_props", "is_orphan", "computed_distance")
+    ]
+    ext_cols = _non_null_columns(records, [c for c in columns if c.startswith("ext_")])
+    standard_cols = [c for c in columns if not c.startswith("ext_") and c != "subtype"]
+    subtype_col = ["subtype"] if "subtype" in columns else []
+    return standard_cols + subtype_col + ext_cols
+
+
+def _sheet_rows(
+    records: List[Dict[str, Any]], columns: List[str], to_cell=_excel_cell
+) -> List[Dict[str, Any]]:
+    """Rows with one canonical key order, values converted by ``to_cell``."""
+    return [{c: to_cell(_coerce_value(r.get(c))) for c in columns} for r in records]
+
+
+def _context_node_sheet(
+    type_id: str, entities: List[Dict[str, Any]], to_cell=_excel_cell
+) -> tuple:
+    """Plan a CN_{type_id} sheet: internal ids and all-null columns dropped."""
+    columns = [c for c in _union_columns(entities) if c not in ("id", "element_id")]
+    columns = _non_null_columns(entities, columns)
+    return f"CN_{type_id}", columns, _sheet_rows(entities, columns, to_cell)
+
+
+def _context_edge_sheet(
+    rel_type_id: str, edges: List[Dict[str, Any]], to_cell=_excel_cell
+) -> tuple:
+    """Plan a CE_{rel_type_id} sheet: ids dropped, source/target names first."""
+    columns = [
+        c for c in _union_columns(edges)
+        if c not in ("id", "element_id", "source_id", "target_id")
+    ]
+    columns = _non_null_columns(edges, columns)
+    priority = [c for c in ["source_name", "target_name"] if c in columns]
+    columns = priority + [c for c in columns if c not in priority]
+    return f"CE_{rel_type_id}", columns, _sheet_rows(edges, columns, to_cell)
+
+
+def _plan_export_sheets(
+    risks: List[Dict[str, Any]],
+    influences: List[Dict[str, Any]],
+    mitigations: List[Dict[str, Any]],
+    mitigates_relationships: List[Dict[str, Any]],
+    context_nodes_data: Optional[Dict[str, List[Dict[str, Any]]]],
+    context_edges_data: Optional[Dict[str, List[Dict[str, Any]]]],
+    to_cell=_excel_cell,
+) -> List[tuple]:
+    """
+    Build (sheet_name, columns, rows) for every non-empty export sheet.
+
+    Sheets whose columns were all dropped are omitted. ``to_cell`` converts
+    each value; the default makes it safe for any Excel writer.
+    """
+    sheets = []
+    if risks:
+        columns = _risk_sheet_columns(risks)
+        sheets.append(("Risks", columns, _sheet_rows(risks, columns, to_cell)))
+    for sheet_name, records in (
+        ("Influences", influences),
+        ("Mitigations", mitigations),
+        ("Mitigates", mitigates_relationships),
+    ):
+        if records:
+            columns = _union_columns(records)
+            sheets.append((sheet_name, columns, _sheet_rows(records, columns, to_cell)))
+    for type_id, entities in (context_nodes_data or {}).items():
+        if entities:
+            sheets.append(_context_node_sheet(type_id, entities, to_cell))
+    for rel_type_id, edges in (context_edges_data or {}).items():
+        if edges:
+            sheets.append(_context_edge_sheet(rel_type_id, edges, to_cell))
+    return [sheet for sheet in sheets if sheet[1]]
 
 
 def _get_context_node_sheets(
@@ -119,15 +202,8 @@ def _get_context_node_sheets(
     for type_id, entities in context_nodes_data.items():
         if not entities:
             continue
-        sheet_name = f"CN_{type_id}"
-        df = pd.DataFrame(_coerce_records(entities))
-        # Drop internal Neo4j ID columns that should not round-trip
-        for col in ["id", "element_id"]:
-            if col in df.columns:
-                df = df.drop(columns=[col])
-        # Drop all-null columns
-        df = df.dropna(axis=1, how="all")
-        sheets[sheet_name] = df
+        sheet_name, columns, rows = _context_node_sheet(type_id, entities)
+        sheets[sheet_name] = pd.DataFrame(rows, columns=columns)
     return sheets
 
 
@@ -152,22 +228,123 @@ def _get_context_edge_sheets(
     for rel_type_id, edges in context_edges_data.items():
         if not edges:
             continue
-        sheet_name = f"CE_{rel_type_id}"
-        df = pd.DataFrame(_coerce_records(edges))
-        # Drop internal ID columns
-        for col in ["id", "element_id", "source_id", "target_id"]:
-            if col in df.columns:
-                df = df.drop(columns=[col])
-        # Drop all-null columns
-        df = df.dropna(axis=1, how="all")
-        # Ensure source_name / target_name appear first if present
-        priority = [c for c in ["source_name", "target_name"] if c in df.columns]
-        rest = [c for c in df.columns if c not in priority]
-        df = df[priority + rest]
-        sheets[sheet_name] = df
+        sheet_name, columns, rows = _context_edge_sheet(rel_type_id, edges)
+        sheets[sheet_name] = pd.DataFrame(rows, columns=columns)
     return sheets
 
 
+# =============================================================================
+# WORKBOOK WRITERS
+# =============================================================================
+
+# Options for xlsxwriter: rows are flushed to disk as they are written
+# instead of being held as cell objects.
+_XLSXWRITER_OPTIONS = {
+    "constant_memory": True,
+    "strings_to_formulas": False,
+    "strings_to_urls": False,
+    "default_date_format": "yyyy-mm-dd hh:mm:ss",
+}
+
+_EMPTY_EXPORT_SHEET = ("Info", ["info"], [{"info": "RIM Export — no data"}])
+
+
+def _open_excel_writer(target, fast: bool = True):
+    """
+    Open a pandas ExcelWriter on a path or buffer.
+
+    With ``fast`` set and xlsxwriter installed, uses the xlsxwriter
+    engine; otherwise falls back to openpyxl.
+    """
+    import pandas as pd
+
+    if fast:
+        try:
+            import xlsxwriter  # noqa: F401
+        except ImportError:
+            pass
+        else:
+            # pandas writes body cells column by column, which
+            # constant_memory (row-at-a-time) would silently drop
+            options = dict(_XLSXWRITER_OPTIONS, constant_memory=False)
+            return pd.ExcelWriter(
+                target, engine="xlsxwriter", engine_kwargs={"options": options}
+            )
+    return pd.ExcelWriter(target, engine="openpyxl")
+
+
+def _write_fast_excel(target, sheets: List[tuple]) -> bool:
+    """Write sheets with the Rust-backed rustpy_xlsxwriter, if installed."""
+    try:
+        from rustpy_xlsxwriter import FastExcel
+    except ImportError:
+        return False
+    # FastExcel infers the format from the file extension; exports are always xlsx
+    workbook = FastExcel(target, output_format="xlsx", autofit=False)
+    for sheet_name, _columns, rows in sheets:
+        workbook.sheet(sheet_name, rows)
+    workbook.save()
+    return True
+
+
+def _write_xlsxwriter(target, sheets: List[tuple]) -> bool:
+    """Stream sheets row by row with xlsxwriter in constant_memory mode, if installed."""
+    try:
+        import xlsxwriter
+    except ImportError:
+        return False
+    workbook = xlsxwriter.Workbook(target, dict(_XLSXWRITER_OPTIONS))
+    for sheet_name, columns, rows in sheets:
+        worksheet = workbook.add_worksheet(sheet_name)
+        worksheet.write_row(0, 0, columns)
+        for row_idx, row in enumerate(rows, start=1):
+            worksheet.write_row(row_idx, 0, list(row.values()))
+    workbook.close()
+    return True
+
+
+def _write_openpyxl(target, sheets: List[tuple]) -> None:
+    """Write sheets with an openpyxl write-only workbook (no per-cell objects kept)."""
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    for sheet_name, columns, rows in sheets:
+        worksheet = workbook.create_sheet(sheet_name)
+        worksheet.append(columns)
+        for row in rows:
+            worksheet.append(list(row.values()))
+    workbook.save(target)
+
+
+def _write_export_workbook(
+    target,
+    risks: List[Dict[str, Any]],
+    influences: List[Dict[str, Any]],
+    mitigations: List[Dict[str, Any]],
+    mitigates_relationships: List[Dict[str, Any]],
+    context_nodes_data: Optional[Dict[str, List[Dict[str, Any]]]],
+    context_edges_data: Optional[Dict[str, List[Dict[str, Any]]]],
+    fast: bool,
+) -> None:
+    """
+    Write the core + context sheets of a RIM export to ``target``.
+
+    Shared by export_to_excel() and export_to_excel_bytes(). Sheets are
+    planned once from the record lists (no DataFrames) and handed to the
+    fastest available writer: rustpy_xlsxwriter, then xlsxwriter (only
+    with ``fast``), then an openpyxl write-only workbook. Always writes at
+    least one sheet, since an empty workbook cannot be saved.
+    """
+    sheets = _plan_export_sheets(
+        risks, influences, mitigations, mitigates_relationships,
+        context_nodes_data, context_edges_data
+    ) or [_EMPTY_EXPORT_SHEET]
+
+    if fast and (_write_fast_excel(target, sheets) or _write_xlsxwriter(target, sheets)):
+        return
+    _write_openpyxl(target, sheets)
+
+
 def export_to_excel(
     filepath: str,
     risks: List[Dict[str, Any]],
@@ -176,6 +353,7 @@ def export_to_excel(
     mitigates_relationships: List[Dict[str, Any]],
     context_nodes_data: Optional[Dict[str, List[Dict[str, Any]]]] = None,
     context_edges_data: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    fast: bool = True,
 ) -> bool:
     """
     Export all RIM data to an Excel file.
@@ -195,41 +373,16 @@ def export_to_excel(
         mitigates_relationships: List of MITIGATES relationship dictionaries
         context_nodes_data: Optional mapping of type_id → entity list
         context_edges_data: Optional mapping of rel_type_id → edge list
+        fast: Prefer the rustpy_xlsxwriter / xlsxwriter writers when installed
 
     Returns:
         True if export successful, False otherwise
     """
     try:
-        import pandas as pd
-
-        # Convert core data to DataFrames — _coerce_records strips tz-aware
-        # datetimes (including neo4j.time.DateTime) before pandas sees them.
-        df_risks = pd.DataFrame(_coerce_records(risks)) if risks else pd.DataFrame()
-        df_influences = pd.DataFrame(_coerce_records(influences)) if influences else pd.DataFrame()
-        df_mitigations = pd.DataFrame(_coerce_records(mitigations)) if mitigations else pd.DataFrame()
-        df_mitigates = pd.DataFrame(_coerce_records(mitigates_relationships)) if mitigates_relationships else pd.DataFrame()
-
-        # Build context sheets
-        cn_sheets = _get_context_node_sheets(context_nodes_data or {})
-        ce_sheets = _get_context_edge_sheets(context_edges_data or {})
-
-        # Write to Excel (_strip_tz is a last-resort guard for datetime64[ns,tz] columns)
-        with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
-            if not df_risks.empty:
-                df_risks = _strip_tz(_clean_risk_df(df_risks))
-                df_risks.to_excel(writer, sheet_name='Risks', index=False)
-            if not df_influences.empty:
-                _strip_tz(df_influences).to_excel(writer, sheet_name='Influences', index=False)
-            if not df_mitigations.empty:
-                _strip_tz(df_mitigations).to_excel(writer, sheet_name='Mitigations', index=False)
-            if not df_mitigates.empty:
-                _strip_tz(df_mitigates).to_excel(writer, sheet_name='Mitigates', index=False)
-            # Context sheets — one per ContextNode/ContextEdge type
-            for sheet_name, df in cn_sheets.items():
-                _strip_tz(df).to_excel(writer, sheet_name=sheet_name, index=False)
-            for sheet_name, df in ce_sheets.items():
-                _strip_tz(df).to_excel(writer, sheet_name=sheet_name, index=False)
-
+        _write_export_workbook(
+            filepath, risks, influences, mitigations, mitigates_relationships,
+            context_nodes_data, context_edges_data, fast
+        )
         return True
 
     except Exception as e:
@@ -243,6 +396,7 @@ def export_to_excel_bytes(
     mitigates_relationships: List[Dict[str, Any]],
     context_nodes_data: Optional[Dict[str, List[Dict[str, Any]]]] = None,
     context_edges_data: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    fast: bool = True,
 ) -> Optional[bytes]:
     """
     Export all RIM data to Excel format and return as bytes.
@@ -257,48 +411,21 @@ def export_to_excel_bytes(
         mitigates_relationships: List of MITIGATES relationship dictionaries
         context_nodes_data: Optional mapping of type_id → entity list
         context_edges_data: Optional mapping of rel_type_id → edge list
+        fast: Prefer the rustpy_xlsxwriter / xlsxwriter writers when installed
 
     Returns:
         Excel file content as bytes, or None if export failed
     """
     try:
-        import pandas as pd
-
-        # Convert core data to DataFrames — _coerce_records strips tz-aware
-        # datetimes (including neo4j.time.DateTime) before pandas sees them.
-        df_risks = pd.DataFrame(_coerce_records(risks)) if risks else pd.DataFrame()
-        df_influences = pd.DataFrame(_coerce_records(influences)) if influences else pd.DataFrame()
-        df_mitigations = pd.DataFrame(_coerce_records(mitigations)) if mitigations else pd.DataFrame()
-        df_mitigates = pd.DataFrame(_coerce_records(mitigates_relationships)) if mitigates_relationships else pd.DataFrame()
-
-        # Build context sheets
-        cn_sheets = _get_context_node_sheets(context_nodes_data or {})
-        ce_sheets = _get_context_edge_sheets(context_edges_data or {})
-
         # Write to BytesIO buffer
         buffer = io.BytesIO()
-        with pd.ExcelWriter(buffer, engine='openpyxl') as writer:
-            if not df_risks.empty:
-                df_risks = _strip_tz(_clean_risk_df(df_risks))
-                df_risks.to_excel(writer, sheet_name='Risks', index=False)
-            if not df_influences.empty:
-                _strip_tz(df_influences).to_excel(writer, sheet_name='Influences', index=False)
-            if not df_mitigations.empty:
-                _strip_tz(df_mitigations).to_excel(writer, sheet_name='Mitigations', index=False)
-            if not df_mitigates.empty:
-                _strip_tz(df_mitigates).to_excel(writer, sheet_name='Mitigates', index=False)
-            # Context sheets
-            for sheet_name, df in cn_sheets.items():
-                _strip_tz(df).to_excel(writer, sheet_name=sheet_name, index=False)
-            for sheet_name, df in ce_sheets.items():
-                _strip_tz(df).to_excel(writer, sheet_name=sheet_name, index=False)
-            # Ensure the workbook is never empty (openpyxl requires ≥1 sheet)
-            if not writer.sheets:
-                pd.DataFrame([{"info": "RIM Export — no data"}]).to_excel(
-                    writer, sheet_name="Info", index=False
-                )
-
-        buffer.seek(0)
+        _write_export_workbook(
+            buffer, risks, influences, mitigations, mitigates_relationships,
+            context_nodes_data, context_edges_data, fast
+        )
+
+        # getvalue() reads from offset 0 regardless of position and hands
+        # over the internal buffer without copying it
         return buffer.getvalue()
 
     except Exception as e:
@@ -307,6 +434,137 @@ def export_to_excel_bytes(
         raise  # Re-raise so caller can surface the real error
 
 
+# =============================================================================
+# MACHINE-READABLE EXPORTS (no Excel)
+# =============================================================================
+
+def _parquet_cell(v):
+    """Keep native values (lists included) for Arrow; NaN becomes null."""
+    return None if _is_null(v) else v
+
+
+def _arrow_table(pa, columns: List[str], rows: List[Dict[str, Any]]):
+    """
+    Build an Arrow table column by column.
+
+    A column whose values Arrow cannot unify into one type (e.g. ints and
+    strings in an ext_* field) is written as strings instead of failing
+    the whole export.
+    """
+    arrays = []
+    for c in columns:
+        values = [row[c] for row in rows]
+        try:
+            arrays.append(pa.array(values))
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            arrays.append(pa.array([None if v is None else str(v) for v in values]))
+    return pa.Table.from_arrays(arrays, names=columns)
+
+
+def export_to_parquet(
+    dirpath: str,
+    risks: List[Dict[str, Any]],
+    influences: List[Dict[str, Any]],
+    mitigations: List[Dict[str, Any]],
+    mitigates_relationships: List[Dict[str, Any]],
+    context_nodes_data: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    context_edges_data: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    compression: str = "zstd",
+) -> bool:
+    """
+    Export all RIM data as one Parquet file per sheet in a directory.
+
+    Files are named after the Excel sheets (``Risks.parquet``,
+    ``CN_{type_id}.parquet``, ...) and hold the same columns. Intended for
+    analysis pipelines; requires pyarrow.
+
+    Args:
+        dirpath: Directory to write into (created if missing)
+        risks: List of risk dictionaries
+        influences: List of influence relationship dictionaries
+        mitigations: List of mitigation dictionaries
+        mitigates_relationships: List of MITIGATES relationship dictionaries
+        context_nodes_data: Optional mapping of type_id → entity list
+        context_edges_data: Optional mapping of rel_type_id → edge list
+        compression: Parquet compression codec
+
+    Returns:
+        True if export successful, False otherwise
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        sheets = _plan_export_sheets(
+            risks, influences, mitigations, mitigates_relationships,
+            context_nodes_data, context_edges_data, to_cell=_parquet_cell
+        )
+        directory = Path(dirpath)
+        directory.mkdir(parents=True, exist_ok=True)
+        for sheet_name, columns, rows in sheets:
+            pq.write_table(
+                _arrow_table(pa, columns, rows),
+                directory / f"{sheet_name}.parquet",
+                compression=compression,
+            )
+        return True
+
+    except Exception as e:
+        print(f"Export error: {e}")
+        return False
+
+
+def export_to_csv_zip(
+    target,
+    risks: List[Dict[str, Any]],
+    influences: List[Dict[str, Any]],
+    mitigations: List[Dict[str, Any]],
+    mitigates_relationships: List[Dict[str, Any]],
+    context_nodes_data: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+    context_edges_data: Optional[Dict[str, List[Dict[str, Any]]]] = None,
+) -> bool:
+    """
+    Export all RIM data as a ZIP archive with one CSV file per sheet.
+
+    Members are named after the Excel sheets (``Risks.csv``, ...) and hold
+    the same columns and cell values, written straight into the archive.
+
+    Args:
+        target: Path or binary file-like object for the archive
+        risks: List of risk dictionaries
+        influences: List of influence relationship dictionaries
+        mitigations: List of mitigation dictionaries
+        mitigates_relationships: List of MITIGATES relationship dictionaries
+        context_nodes_data: Optional mapping of type_id → entity list
+        context_edges_data: Optional mapping of rel_type_id → edge list
+
+    Returns:
+        True if export successful, False otherwise
+    """
+    import csv
+    import zipfile
+
+    try:
+        sheets = _plan_export_sheets(
+            risks, influences, mitigations, mitigates_relationships,
+            context_nodes_data, context_edges_data
+        )
+        with zipfile.ZipFile(target, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            for sheet_name, columns, rows in sheets:
+                with archive.open(f"{sheet_name}.csv", "w") as member:
+                    stream = io.TextIOWrapper(member, encoding="utf-8", newline="")
+                    writer = csv.DictWriter(stream, fieldnames=columns)
+                    writer.writeheader()
+                    writer.writerows(rows)
+                    stream.flush()
+                    stream.detach()
+        return True
+
+    except Exception as e:
+        print(f"Export error: {e}")
+        return False
+
+
 def export_analysis_report(
     filepath: str,
     influence_analysis: Dict[str, Any],
@@ -337,62 +595,42 @@ def export_analysis_report(
     try:
         import pandas as pd
         
-        with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
-            # Top Propagators
-            if influence_analysis.get("top_propagators"):
-                df = pd.DataFrame(influence_analysis["top_propagators"])
-                df.to_excel(writer, sheet_name='Top Propagators', index=False)
-            
-            # Convergence Points
-            if influence_analysis.get("convergence_points"):
-                df = pd.DataFrame(influence_analysis["convergence_points"])
-                df.to_excel(writer, sheet_name='Convergence Points', index=False)
-            
-            # Critical Paths
-            if influence_analysis.get("critical_paths"):
-                paths = []
-                for p in influence_analysis["critical_paths"]:
-                    path_names = " → ".join(n["name"] for n in p["path"])
-                    paths.append({
-                        "path": path_names,
-                        "strength": p["strength"],
-                        "length": p["length"]
-                    })
-                df = pd.DataFrame(paths)
-                df.to_excel(writer, sheet_name='Critical Paths', index=False)
-            
-            # Bottlenecks
-            if influence_analysis.get("bottlenecks"):
-                df = pd.DataFrame(influence_analysis["bottlenecks"])
-                df.to_excel(writer, sheet_name='Bottlenecks', index=False)
-            
-            # Coverage Statistics
-            if mitigation_analysis.get("coverage_stats"):
-                df = pd.DataFrame([mitigation_analysis["coverage_stats"]])
-                df.to_excel(writer, sheet_name='Coverage Stats', index=False)
-            
-            # Unmitigated Risks
-            if mitigation_analysis.get("unmitigated_risks"):
-                df = pd.DataFrame(mitigation_analysis["unmitigated_risks"])
-                # Select key columns
-                cols = ["name", "level", "exposure", "categories"]
-                cols = [c for c in cols if c in df.columns]
-                if cols:
-                    df[cols].to_excel(writer, sheet_name='Unmitigated Risks', index=False)
-            
-            # High Priority Unmitigated
-            if coverage_gaps.get("high_priority_unmitigated"):
-                df = pd.DataFrame(coverage_gaps["high_priority_unmitigated"])
-                df.to_excel(writer, sheet_name='High Priority Gaps', index=False)
-            
-            # Category Coverage
-            if coverage_gaps.get("category_coverage"):
-                rows = [
-                    {"category": cat, **stats}
-                    for cat, stats in coverage_gaps["category_coverage"].items()
-                ]
-                df = pd.DataFrame(rows)
-                df.to_excel(writer, sheet_name='Category Coverage', index=False)
+        critical_paths = [
+            {
+                "path": " → ".join(n["name"] for n in p["path"]),
+                "strength": p["strength"],
+                "length": p["length"],
+            }
+            for p in influence_analysis.get("critical_paths") or []
+        ]
+        coverage_stats = mitigation_analysis.get("coverage_stats")
+        unmitigated = mitigation_analysis.get("unmitigated_risks") or []
+        category_coverage = [
+            {"category": cat, **stats}
+            for cat, stats in (coverage_gaps.get("category_coverage") or {}).items()
+        ]
+
+        # (sheet name, records, columns to keep or None for all)
+        sheets = [
+            ("Top Propagators", influence_analysis.get("top_propagators"), None),
+            ("Convergence Points", influence_analysis.get("convergence_points"), None),
+            ("Critical Paths", critical_paths, None),
+            ("Bottlenecks", influence_analysis.get("bottlenecks"), None),
+            ("Coverage Stats", [coverage_stats] if coverage_stats else [], None),
+            ("Unmitigated Risks", unmitigated, [
+                c for c in ("name", "level", "exposure", "categories")
+                if c in _union_columns(unmitigated)
+            ]),
+            ("High Priority Gaps", coverage_gaps.get("high_priority_unmitigated"), None),
+            ("Category Coverage", category_coverage, None),
+        ]
+
+        with _open_excel_writer(filepath) as writer:
+            for sheet_name, records, columns in sheets:
+                if not records or columns == []:
+                    continue
+                df = pd.DataFrame.from_records(records, columns=columns)
+                df.to_excel(writer, sheet_name=sheet_name, index=False)
         
         return True
     
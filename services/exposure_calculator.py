@@ -10,8 +10,15 @@ The calculation is designed to be extensible for future complexity increases.
 """
 
 from typing import Dict, List, Any, Optional, Tuple
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
 from datetime import datetime
+import threading
+import time
+
+import numpy as np
+
+from models.compat import DATACLASS_SLOTS
 
 
 # =============================================================================
@@ -42,6 +49,12 @@ MAX_BASE_EXPOSURE = MAX_LIKELIHOOD * MAX_SEVERITY  # 100
 # TRI exponent — emphasises tail/catastrophic risk
 TRI_ALPHA = 1.5
 
+# Integer codes for the risk levels broken down in the global metrics
+LEVEL_STRATEGIC = 0
+LEVEL_OPERATIONAL = 1
+LEVEL_OTHER = 2
+_LEVEL_CODES = {"Strategic": LEVEL_STRATEGIC, "Operational": LEVEL_OPERATIONAL}
+
 
 # =============================================================================
 # DATA CLASSES
@@ -153,7 +166,7 @@ def detect_cycles(
     )
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class RiskExposureResult:
     """Result of exposure calculation for a single risk."""
     risk_id: str
@@ -207,7 +220,7 @@ class RiskExposureResult:
         }
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class GlobalExposureResult:
     """Result of global exposure calculation for the entire perimeter."""
     
@@ -234,8 +247,10 @@ class GlobalExposureResult:
     mitigated_risks_count: int
     unmitigated_risks_count: int
     
-    # Metadata
-    calculated_at: datetime = field(default_factory=datetime.now)
+    # Metadata: the clock is read as integer nanoseconds; a datetime is
+    # only built when serializing (an explicit calculated_at takes precedence)
+    calculated_at: Optional[datetime] = None
+    calculated_at_ns: int = field(default_factory=time.time_ns)
 
     # Individual risk results (for detailed view)
     risk_results: List[RiskExposureResult] = field(default_factory=list)
@@ -245,9 +260,20 @@ class GlobalExposureResult:
     has_cycles: bool = False
     cycle_warnings: List[str] = field(default_factory=list)
     cycle_node_ids: List[str] = field(default_factory=list)
+
+    # Per-risk dicts of to_dict(), built on first use (risk_results is not
+    # expected to change once the result has been produced)
+    _risk_result_dicts: Optional[List[Dict[str, Any]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for storage/display."""
+    def summary_dict(self) -> Dict[str, Any]:
+        """
+        Convert the top-line metrics to a dictionary.
+        
+        Same as to_dict() without ``risk_results``, for callers that only
+        display the global figures.
+        """
         return {
             "residual_risk_percentage": round(self.residual_risk_percentage, 1),
             "weighted_risk_score": round(self.weighted_risk_score, 1),
@@ -262,14 +288,24 @@ class GlobalExposureResult:
             "operational_exposure": round(self.operational_exposure, 2),
             "mitigated_risks_count": self.mitigated_risks_count,
             "unmitigated_risks_count": self.unmitigated_risks_count,
-            "calculated_at": self.calculated_at.isoformat(),
-            "risk_results": [r.to_dict() for r in self.risk_results],
+            "calculated_at": (
+                self.calculated_at
+                or datetime.fromtimestamp(self.calculated_at_ns / 1e9)
+            ).isoformat(),
             # Cycle detection results (F30)
             "has_cycles": self.has_cycles,
             "cycle_warnings": self.cycle_warnings,
             "cycle_node_ids": self.cycle_node_ids,
         }
     
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for storage/display."""
+        if self._risk_result_dicts is None:
+            self._risk_result_dicts = [r.to_dict() for r in self.risk_results]
+        data = self.summary_dict()
+        data["risk_results"] = self._risk_result_dicts
+        return data
+    
     def get_health_status(self) -> Tuple[str, str]:
         """
         Get health status based on weighted risk score.
@@ -315,6 +351,190 @@ def _compute_risk_quadrant(likelihood: float, severity: float) -> str:
     return "marginal"
 
 
+def _upstream_trace(
+    name: str, residual: float, strength: str, strength_score: float, contribution: float
+) -> str:
+    """Trace line for one upstream risk's contribution to the limitation."""
+    return (
+        f"Upstream [{name}]: Residual ({residual:.2f}) "
+        f"× Strength ({strength}={strength_score}) = {contribution:.3f}"
+    )
+
+
+def _limitation_summary_trace(total: float, valid_count: int) -> str:
+    """Closing trace line of the influence limitation calculation."""
+    if valid_count == 0:
+        return "Influence Limitation: 0.0 (Upstream risks have no data)"
+    return (
+        f"Average Influence Limitation: {total:.3f} / {valid_count} = "
+        f"{total / valid_count:.3f}"
+    )
+
+
+# =============================================================================
+# EXPOSURE PROPAGATION KERNELS
+# =============================================================================
+
+# Below this many risks the NumPy pass wins over Numba's compile/threading cost
+NUMBA_MIN_RISKS = 2000
+
+_numba_kernel = None
+
+
+def _propagate_layers_numpy(
+    layers, base, has_data, mit_factor, edge_source, edge_target, edge_score, edge_ptr
+):
+    """
+    Propagate final exposures layer by layer with vectorized NumPy.
+
+    See _propagate_exposures() for arguments and return value.
+    """
+    n = base.size
+    edge_residual = np.zeros(edge_source.size, dtype=np.float64)
+    edge_used = np.zeros(edge_source.size, dtype=bool)
+
+    # Edges ordered by the layer of their target (stable: keeps edge order)
+    layer_of = np.empty(n, dtype=np.intp)
+    for k, layer in enumerate(layers):
+        layer_of[layer] = k
+    edge_layer = layer_of[edge_target]
+    edge_order = np.argsort(edge_layer, kind="stable")
+    layer_bounds = np.searchsorted(edge_layer[edge_order], np.arange(len(layers) + 1))
+
+    limitation_total = np.zeros(n, dtype=np.float64)
+    valid_count = np.zeros(n, dtype=np.intp)
+    limitation = np.zeros(n, dtype=np.float64)
+    final = np.zeros(n, dtype=np.float64)
+    calculated = np.zeros(n, dtype=bool)
+
+    for k, layer in enumerate(layers):
+        # Only upstream risks calculated in earlier layers limit this one
+        edges = edge_order[layer_bounds[k]:layer_bounds[k + 1]]
+        edges = edges[calculated[edge_source[edges]]]
+        if edges.size:
+            src = edge_source[edges]
+            # Calculated risks have non-zero base exposure (see below)
+            residual = final[src] / base[src]
+            edge_residual[edges] = residual
+            edge_used[edges] = True
+            tgt = edge_target[edges]
+            limitation_total += np.bincount(
+                tgt, weights=residual * edge_score[edges], minlength=n
+            )
+            valid_count += np.bincount(tgt, minlength=n)
+
+        rows = layer[has_data[layer]]
+        counts = valid_count[rows]
+        lim = np.zeros(rows.size, dtype=np.float64)
+        has_upstream = counts > 0
+        lim[has_upstream] = limitation_total[rows][has_upstream] / counts[has_upstream]
+        limitation[rows] = lim
+        mit = mit_factor[rows]
+        final[rows] = base[rows] * (mit + (1.0 - mit) * lim)
+        calculated[rows] = True
+
+    return final, limitation, limitation_total, valid_count, edge_residual, edge_used
+
+
+def _get_numba_kernel():
+    """Compile (once) and return the Numba propagation kernel, or None."""
+    global _numba_kernel
+    if _numba_kernel is not None:
+        return _numba_kernel
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return None
+
+    # No fastmath: results must stay bit-identical to the NumPy pass
+    @njit(parallel=True, cache=True)
+    def kernel(order, layer_ptr, base, has_data, mit_factor, edge_source,
+               edge_score, edge_ptr, final, limitation, limitation_total,
+               valid_count, edge_residual, edge_used):
+        calculated = np.zeros(base.size, dtype=np.bool_)
+        for k in range(layer_ptr.size - 1):
+            # Risks of one layer never depend on each other
+            for p in prange(layer_ptr[k], layer_ptr[k + 1]):
+                i = order[p]
+                total = 0.0
+                count = 0
+                for e in range(edge_ptr[i], edge_ptr[i + 1]):
+                    j = edge_source[e]
+                    if calculated[j]:
+                        residual = final[j] / base[j]
+                        edge_residual[e] = residual
+                        edge_used[e] = True
+                        total += residual * edge_score[e]
+                        count += 1
+                limitation_total[i] = total
+                valid_count[i] = count
+                if has_data[i]:
+                    lim = total / count if count > 0 else 0.0
+                    limitation[i] = lim
+                    final[i] = base[i] * (mit_factor[i] + (1.0 - mit_factor[i]) * lim)
+            for p in range(layer_ptr[k], layer_ptr[k + 1]):
+                if has_data[order[p]]:
+                    calculated[order[p]] = True
+
+    _numba_kernel = kernel
+    return kernel
+
+
+def _propagate_exposures(
+    layers: List[np.ndarray],
+    base: np.ndarray,
+    has_data: np.ndarray,
+    mit_factor: np.ndarray,
+    edge_source: np.ndarray,
+    edge_target: np.ndarray,
+    edge_score: np.ndarray,
+    edge_ptr: np.ndarray,
+    use_numba: Optional[bool] = None,
+) -> Tuple[np.ndarray, ...]:
+    """
+    Propagate final exposures through the influence graph.
+
+    Args:
+        layers: Calculation layers of risk positions
+        base: Base exposure per risk
+        has_data: Whether each risk has likelihood and severity
+        mit_factor: Mitigation factor per risk
+        edge_source: Source position per edge (edges grouped by target)
+        edge_target: Target position per edge
+        edge_score: Strength score per edge
+        edge_ptr: CSR offsets of each risk's upstream edges
+        use_numba: Force (True) or skip (False) the Numba kernel; by default
+            it is used from NUMBA_MIN_RISKS risks on, when numba is installed
+
+    Returns:
+        Tuple of (final, limitation, limitation_total, valid_count,
+        edge_residual, edge_used) arrays
+    """
+    if use_numba is None:
+        use_numba = base.size >= NUMBA_MIN_RISKS
+    kernel = _get_numba_kernel() if use_numba else None
+    if kernel is None:
+        return _propagate_layers_numpy(
+            layers, base, has_data, mit_factor,
+            edge_source, edge_target, edge_score, edge_ptr
+        )
+
+    n = base.size
+    order = np.concatenate(layers) if layers else np.zeros(0, dtype=np.intp)
+    layer_ptr = np.zeros(len(layers) + 1, dtype=np.intp)
+    np.cumsum([layer.size for layer in layers], out=layer_ptr[1:])
+    final = np.zeros(n, dtype=np.float64)
+    limitation = np.zeros(n, dtype=np.float64)
+    limitation_total = np.zeros(n, dtype=np.float64)
+    valid_count = np.zeros(n, dtype=np.intp)
+    edge_residual = np.zeros(edge_source.size, dtype=np.float64)
+    edge_used = np.zeros(edge_source.size, dtype=bool)
+    kernel(order, layer_ptr, base, has_data, mit_factor, edge_source,
+           edge_score, edge_ptr, final, limitation, limitation_total,
+           valid_count, edge_residual, edge_used)
+    return final, limitation, limitation_total, valid_count, edge_residual, edge_used
+
+
 # =============================================================================
 # EXPOSURE CALCULATOR CLASS
 # =============================================================================
@@ -348,6 +568,13 @@ class ExposureCalculator:
             mitigates_relationships: List of MITIGATES relationships
         """
         self.risks = {r["id"]: r for r in risks}
+        # Position of each risk in the per-risk arrays of calculate_all()
+        self.risk_ids: List[str] = list(self.risks)
+        self.risk_index: Dict[str, int] = {rid: i for i, rid in enumerate(self.risk_ids)}
+        self.level_code = np.fromiter(
+            (_LEVEL_CODES.get(r.get("level"), LEVEL_OTHER) for r in self.risks.values()),
+            dtype=np.int8, count=len(self.risk_ids)
+        )
         self.influences = influences
         self.mitigations = {m["id"]: m for m in mitigations}
         self.mitigates_relationships = mitigates_relationships
@@ -365,7 +592,13 @@ class ExposureCalculator:
         self.upstream_influences: Dict[str, List[Tuple[str, str]]] = {
             rid: [] for rid in self.risks
         }
+        # downstream[risk_id] = target ids, one entry per edge between known risks
+        self.downstream: Dict[str, List[str]] = {rid: [] for rid in self.risks}
         
+        index = self.risk_index
+        sources: List[int] = []
+        targets: List[int] = []
+        strengths: List[str] = []
         for inf in self.influences:
             source_id = inf.get("source_id") or inf.get("source")
             target_id = inf.get("target_id") or inf.get("target")
@@ -373,6 +606,31 @@ class ExposureCalculator:
             
             if target_id in self.upstream_influences:
                 self.upstream_influences[target_id].append((source_id, strength))
+                if source_id in self.downstream:
+                    self.downstream[source_id].append(target_id)
+                    sources.append(index[source_id])
+                    targets.append(index[target_id])
+                    strengths.append(strength)
+        
+        # Edges between known risks as parallel arrays, grouped by target
+        # (stable, so each target keeps its upstream order): the upstream
+        # edges of risk i are edge_ptr[i]:edge_ptr[i + 1]
+        n = len(self.risk_ids)
+        by_target = np.argsort(np.array(targets, dtype=np.intp), kind="stable")
+        self.edge_source_idx = np.array(sources, dtype=np.intp)[by_target]
+        self.edge_target_idx = np.array(targets, dtype=np.intp)[by_target]
+        self.edge_strength_label: List[str] = [strengths[e] for e in by_target.tolist()]
+        self.edge_strength = np.array(
+            [INFLUENCE_STRENGTH_SCORES.get(st, 0.5) for st in self.edge_strength_label],
+            dtype=np.float64
+        )
+        self.edge_ptr = np.zeros(n + 1, dtype=np.intp)
+        np.cumsum(np.bincount(self.edge_target_idx, minlength=n), out=self.edge_ptr[1:])
+        # Upstream count per risk, including sources that are not loaded
+        self.upstream_count = np.fromiter(
+            (len(self.upstream_influences[rid]) for rid in self.risk_ids),
+            dtype=np.intp, count=n
+        )
     
     def _build_mitigation_map(self):
         """Build map of risk_id to list of (mitigation_id, effectiveness)."""
@@ -380,6 +638,8 @@ class ExposureCalculator:
         self.risk_mitigations: Dict[str, List[str]] = {
             rid: [] for rid in self.risks
         }
+        # mit_factor[risk_id] = ∏(1 - Effectiveness_i), accumulated once here
+        self.mit_factor: Dict[str, float] = {rid: 1.0 for rid in self.risks}
         
         for rel in self.mitigates_relationships:
             risk_id = rel.get("risk_id")
@@ -388,6 +648,7 @@ class ExposureCalculator:
             
             if risk_id in self.risk_mitigations:
                 self.risk_mitigations[risk_id].append(effectiveness)
+                self.mit_factor[risk_id] *= 1.0 - EFFECTIVENESS_SCORES.get(effectiveness, 0.5)
     
     def _calculate_base_exposure(self, risk: Dict[str, Any]) -> float:
         """
@@ -427,11 +688,10 @@ class ExposureCalculator:
             traces.append("Mitigation Factor: 1.0 (No mitigations applied)")
             return 1.0, 0, traces
         
-        factor = 1.0
+        # Factor precomputed by _build_mitigation_map; only the trace is built here
+        factor = self.mit_factor[risk_id]
         for eff in effectivenesses:
             eff_score = EFFECTIVENESS_SCORES.get(eff, 0.5)
-            reduction = 1.0 - eff_score
-            factor *= reduction
             traces.append(f"Mitigation applied: {eff} effectiveness ({eff_score * 100}% reduction)")
         
         traces.append(f"Combined Mitigation Factor: {factor:.3f}")
@@ -478,13 +738,12 @@ class ExposureCalculator:
             
             upstream_result = calculated_risks[source_id]
             
-            # Calculate normalized residual exposure (0-1 scale)
-            if upstream_result.base_exposure > 0:
-                residual_normalized = (
-                    upstream_result.final_exposure / upstream_result.base_exposure
-                )
-            else:
-                residual_normalized = 1.0  # Assume worst case if no data
+            # Calculate normalized residual exposure (0-1 scale). Only risks
+            # with non-zero likelihood and severity get a result, so the
+            # base exposure of a calculated upstream risk is never zero.
+            residual_normalized = (
+                upstream_result.final_exposure / upstream_result.base_exposure
+            )
             
             # Apply strength weighting
             strength_score = INFLUENCE_STRENGTH_SCORES.get(strength, 0.5)
@@ -492,58 +751,78 @@ class ExposureCalculator:
             total_limitation += limitation_contribution
             valid_count += 1
             
-            traces.append(
-                f"Upstream [{upstream_result.risk_name}]: Residual ({residual_normalized:.2f}) "
-                f"× Strength ({strength}={strength_score}) = {limitation_contribution:.3f}"
-            )
+            traces.append(_upstream_trace(
+                upstream_result.risk_name, residual_normalized,
+                strength, strength_score, limitation_contribution
+            ))
         
+        traces.append(_limitation_summary_trace(total_limitation, valid_count))
         if valid_count == 0:
-            traces.append("Influence Limitation: 0.0 (Upstream risks have no data)")
             return 0.0, len(upstream), traces
         
         # Average the limitation
-        avg_limitation = total_limitation / valid_count
-        traces.append(f"Average Influence Limitation: {total_limitation:.3f} / {valid_count} = {avg_limitation:.3f}")
-        
-        return avg_limitation, len(upstream), traces
+        return total_limitation / valid_count, len(upstream), traces
     
-    def _get_calculation_order(self) -> List[str]:
+    def _get_calculation_layers(self) -> List[np.ndarray]:
         """
-        Determine the order to calculate risks (topological sort).
+        Group risks into layers that can be calculated together.
         
-        Risks with no upstream influences are calculated first,
-        then their downstream risks, and so on.
+        Layer 0 holds the risks with no upstream influences, layer k the
+        risks whose upstream risks all sit in earlier layers (Kahn's
+        algorithm over the downstream adjacency lists, O(V+E)). Risks left
+        over by a cycle follow as one-risk layers in risk order, so each
+        only sees the upstream risks calculated before it.
         
         Returns:
-            List of risk IDs in calculation order
+            List of arrays of risk positions (see ``risk_index``)
         """
-        # Count incoming influences for each risk
-        in_degree = {rid: 0 for rid in self.risks}
-        for rid, upstream in self.upstream_influences.items():
-            in_degree[rid] = len([s for s, _ in upstream if s in self.risks])
+        # Count incoming influences (from known risks) for each risk
+        in_degree = dict(zip(self.risk_ids, np.diff(self.edge_ptr).tolist()))
         
         # Start with risks that have no upstream influences
-        queue = [rid for rid, deg in in_degree.items() if deg == 0]
-        result = []
+        current = [rid for rid, deg in in_degree.items() if deg == 0]
+        layers = []
+        placed = set()
         
-        while queue:
-            current = queue.pop(0)
-            result.append(current)
-            
-            # Find risks that this one influences
-            for rid, upstream in self.upstream_influences.items():
-                for source_id, _ in upstream:
-                    if source_id == current:
-                        in_degree[rid] -= 1
-                        if in_degree[rid] == 0 and rid not in result and rid not in queue:
-                            queue.append(rid)
+        while current:
+            layers.append(current)
+            placed.update(current)
+            following = []
+            for source_id in current:
+                ready = []
+                for rid in self.downstream[source_id]:
+                    in_degree[rid] -= 1
+                    if in_degree[rid] == 0:
+                        ready.append(rid)
+                # Risks released by the same source are queued in risk order
+                ready.sort(key=self.risk_index.__getitem__)
+                following.extend(ready)
+            current = following
         
         # Add any remaining risks (handles cycles)
-        for rid in self.risks:
-            if rid not in result:
-                result.append(rid)
+        layers.extend([rid] for rid in self.risks if rid not in placed)
+        
+        index = self.risk_index
+        return [
+            np.fromiter((index[rid] for rid in layer), dtype=np.intp, count=len(layer))
+            for layer in layers
+        ]
+    
+    def _get_calculation_order(self) -> List[str]:
+        """
+        Determine the order to calculate risks (topological sort).
+        
+        Risks with no upstream influences are calculated first,
+        then their downstream risks, and so on.
         
-        return result
+        Returns:
+            List of risk IDs in calculation order
+        """
+        return [
+            self.risk_ids[i]
+            for layer in self._get_calculation_layers()
+            for i in layer.tolist()
+        ]
     
     def calculate_risk_exposure(
         self,
@@ -572,27 +851,53 @@ class ExposureCalculator:
         if likelihood == 0 or severity == 0:
             return None
 
-        likelihood = float(likelihood)
-        severity = float(severity)
-
+        # Step 2: Mitigation factor
+        mitigation_factor, mit_count, mit_traces = self._calculate_mitigation_factor(risk_id)
+        
+        # Step 3: Influence limitation
+        influence_limitation, upstream_count, inf_traces = self._calculate_influence_limitation(
+            risk_id, calculated_risks
+        )
+        
+        return self._build_risk_result(
+            risk_id, float(likelihood), float(severity),
+            mitigation_factor, mit_count, mit_traces,
+            influence_limitation, upstream_count, inf_traces
+        )
+    
+    def _build_risk_result(
+        self,
+        risk_id: str,
+        likelihood: float,
+        severity: float,
+        mitigation_factor: float,
+        mit_count: int,
+        mit_traces: List[str],
+        influence_limitation: float,
+        upstream_count: int,
+        inf_traces: List[str],
+    ) -> RiskExposureResult:
+        """
+        Combine the per-step factors of a risk into its result and trace.
+        
+        Shared by calculate_risk_exposure() and the array pass of
+        calculate_all() so both produce identical results.
+        """
+        risk = self.risks[risk_id]
         trace = []
         trace.append(f"--- Calculation Trace for {risk.get('name', risk_id)} ---")
 
         # Step 1: Base exposure
-        base_exposure = self._calculate_base_exposure(risk)
+        base_exposure = likelihood * severity
         trace.append(f"1. Base Exposure: Likelihood ({likelihood}) × Severity ({severity}) = {base_exposure:.2f}")
         
         # Step 2: Mitigation factor
-        mitigation_factor, mit_count, mit_traces = self._calculate_mitigation_factor(risk_id)
         trace.append("2. Mitigation Factor Calculation:")
         trace.extend([f"   - {t}" for t in mit_traces])
         mitigated_exposure = base_exposure * mitigation_factor
         trace.append(f"   => Temporarily Mitigated Exposure: {base_exposure:.2f} × {mitigation_factor:.3f} = {mitigated_exposure:.2f}")
         
         # Step 3: Influence limitation
-        influence_limitation, upstream_count, inf_traces = self._calculate_influence_limitation(
-            risk_id, calculated_risks
-        )
         if upstream_count > 0:
             trace.append(f"3. Influence Limitation Calculation ({upstream_count} Upstream Risks):")
             trace.extend([f"   - {t}" for t in inf_traces])
@@ -649,6 +954,10 @@ class ExposureCalculator:
         stored on the instance so ``_calculate_global_metrics`` can embed
         them in the returned ``GlobalExposureResult``.
 
+        The numeric pass runs on per-risk NumPy arrays one calculation
+        layer at a time; the results match calling
+        ``calculate_risk_exposure`` risk by risk in calculation order.
+
         Returns:
             GlobalExposureResult with all metrics (and cycle info when present)
         """
@@ -661,14 +970,76 @@ class ExposureCalculator:
             list(self.risks.keys()), self.influences, risk_names=_risk_names
         )
 
-        # Get calculation order (topological sort with cycle fallback)
-        order = self._get_calculation_order()
+        # Calculation layers (topological sort with cycle fallback)
+        layers = self._get_calculation_layers()
+        n = len(self.risk_ids)
+        risk_rows = list(self.risks.values())
+
+        # Per-risk arrays, indexed by risk position
+        likelihood = np.fromiter(
+            (float(r.get("probability") or r.get("likelihood") or 0) for r in risk_rows),
+            dtype=np.float64, count=n
+        )
+        severity = np.fromiter(
+            (float(r.get("severity") or r.get("impact") or 0) for r in risk_rows),
+            dtype=np.float64, count=n
+        )
+        has_data = (likelihood != 0) & (severity != 0)
+        base = likelihood * severity
+        mit_factor = np.fromiter(
+            (self.mit_factor[rid] for rid in self.risk_ids), dtype=np.float64, count=n
+        )
+
+        # Numeric pass over the layers (Numba kernel on large graphs)
+        edge_source = self.edge_source_idx
+        edge_score = self.edge_strength
+        (final, limitation, limitation_total, valid_count,
+         edge_residual, edge_used) = _propagate_exposures(
+            layers, base, has_data, mit_factor,
+            edge_source, self.edge_target_idx, edge_score, self.edge_ptr
+        )
 
-        # Calculate each risk in order
-        for risk_id in order:
-            result = self.calculate_risk_exposure(risk_id, self.risk_results)
-            if result:
-                self.risk_results[risk_id] = result
+        # Build results (with traces) in calculation order
+        likelihood_list = likelihood.tolist()
+        severity_list = severity.tolist()
+        limitation_list = limitation.tolist()
+        limitation_total_list = limitation_total.tolist()
+        valid_count_list = valid_count.tolist()
+        edge_ptr_list = self.edge_ptr.tolist()
+        edge_source_list = edge_source.tolist()
+        upstream_count_list = self.upstream_count.tolist()
+        edge_residual_list = edge_residual.tolist()
+        edge_score_list = edge_score.tolist()
+        edge_used_list = edge_used.tolist()
+        for layer in layers:
+            for i in layer.tolist():
+                if not has_data[i]:
+                    continue
+                risk_id = self.risk_ids[i]
+                upstream_count = upstream_count_list[i]
+                inf_traces = []
+                if upstream_count:
+                    for e in range(edge_ptr_list[i], edge_ptr_list[i + 1]):
+                        if not edge_used_list[e]:
+                            continue
+                        source = self.risks[self.risk_ids[edge_source_list[e]]]
+                        residual = edge_residual_list[e]
+                        score = edge_score_list[e]
+                        inf_traces.append(_upstream_trace(
+                            source.get("name", "Unknown"), residual,
+                            self.edge_strength_label[e], score, residual * score
+                        ))
+                    inf_traces.append(_limitation_summary_trace(
+                        limitation_total_list[i], valid_count_list[i]
+                    ))
+                mitigation_factor, mit_count, mit_traces = (
+                    self._calculate_mitigation_factor(risk_id)
+                )
+                self.risk_results[risk_id] = self._build_risk_result(
+                    risk_id, likelihood_list[i], severity_list[i],
+                    mitigation_factor, mit_count, mit_traces,
+                    limitation_list[i], upstream_count, inf_traces
+                )
 
         # Aggregate to global metrics
         return self._calculate_global_metrics()
@@ -709,27 +1080,43 @@ class ExposureCalculator:
                 cycle_node_ids=validation.cycle_node_ids if validation else [],
             )
         
+        # Gather every per-result field the metrics need in one pass
+        columns = np.fromiter(
+            (
+                (r.base_exposure, r.final_exposure, r.severity,
+                 r.mitigation_count > 0, self.risk_index[r.risk_id])
+                for r in results
+            ),
+            dtype=[("base", np.float64), ("final", np.float64),
+                   ("severity", np.float64), ("mitigated", np.bool_),
+                   ("position", np.intp)],
+            count=len(results)
+        )
+        final = columns["final"]
+        
         # Calculate totals
-        total_base = sum(r.base_exposure for r in results)
-        total_final = sum(r.final_exposure for r in results)
+        total_base = float(columns["base"].sum())
+        total_final = float(final.sum())
         
         # Residual Risk Percentage
         residual_pct = (total_final / total_base * 100) if total_base > 0 else 0
         
         # Weighted Risk Score (severity-squared weighting)
-        weighted_sum = sum(r.final_exposure * (r.severity ** 2) for r in results)
-        max_weighted = sum(MAX_BASE_EXPOSURE * (r.severity ** 2) for r in results)
+        severity_sq = columns["severity"] ** 2
+        weighted_sum = float((final * severity_sq).sum())
+        max_weighted = float(MAX_BASE_EXPOSURE * severity_sq.sum())
         weighted_score = (weighted_sum / max_weighted * 100) if max_weighted > 0 else 0
         
-        # Maximum single exposure
-        max_result = max(results, key=lambda r: r.final_exposure)
+        # Maximum single exposure (argmax keeps the first maximum, like max())
+        max_result = results[int(np.argmax(final))]
         
-        # Breakdown by level
-        strategic_exp = sum(r.final_exposure for r in results if r.level == "Strategic")
-        operational_exp = sum(r.final_exposure for r in results if r.level == "Operational")
+        # Breakdown by level (integer codes precomputed in __init__)
+        level_code = self.level_code[columns["position"]]
+        strategic_exp = float(final[level_code == LEVEL_STRATEGIC].sum())
+        operational_exp = float(final[level_code == LEVEL_OPERATIONAL].sum())
         
         # Mitigation counts
-        mitigated = sum(1 for r in results if r.mitigation_count > 0)
+        mitigated = int(columns["mitigated"].sum())
         unmitigated = len(results) - mitigated
         
         return GlobalExposureResult(
@@ -758,11 +1145,69 @@ class ExposureCalculator:
 # CONVENIENCE FUNCTION
 # =============================================================================
 
-def calculate_exposure(
+# Number of recent calculate_exposure() results kept when cached=True
+EXPOSURE_CACHE_SIZE = 16
+
+_exposure_cache: "OrderedDict[tuple, GlobalExposureResult]" = OrderedDict()
+_exposure_cache_lock = threading.Lock()
+
+
+def _exposure_cache_key(
     risks: List[Dict[str, Any]],
     influences: List[Dict[str, Any]],
     mitigations: List[Dict[str, Any]],
     mitigates_relationships: List[Dict[str, Any]]
+) -> tuple:
+    """Key made of every input field the calculation reads."""
+    return (
+        tuple(
+            (r["id"], r.get("name"), r.get("level"), r.get("probability"),
+             r.get("likelihood"), r.get("severity"), r.get("impact"))
+            for r in risks
+        ),
+        tuple(
+            (i.get("source_id") or i.get("source"),
+             i.get("target_id") or i.get("target"),
+             i.get("strength", "Moderate"))
+            for i in influences
+        ),
+        tuple(m["id"] for m in mitigations),
+        tuple(
+            (rel.get("risk_id"), rel.get("effectiveness", "Medium"))
+            for rel in mitigates_relationships
+        ),
+    )
+
+
+def _fresh_exposure_result(result: GlobalExposureResult) -> GlobalExposureResult:
+    """
+    Copy of a cached result for one caller, stamped with the current time.
+    
+    The cached instance is never handed out: each caller gets its own
+    result objects and lists (and so its own to_dict() output).
+    """
+    return replace(
+        result,
+        calculated_at=None,
+        calculated_at_ns=time.time_ns(),
+        risk_results=[replace(r, trace=list(r.trace)) for r in result.risk_results],
+        cycle_warnings=list(result.cycle_warnings),
+        cycle_node_ids=list(result.cycle_node_ids),
+    )
+
+
+def clear_exposure_cache() -> None:
+    """Drop all memoized calculate_exposure() results."""
+    with _exposure_cache_lock:
+        _exposure_cache.clear()
+
+
+def calculate_exposure(
+    risks: List[Dict[str, Any]],
+    influences: List[Dict[str, Any]],
+    mitigations: List[Dict[str, Any]],
+    mitigates_relationships: List[Dict[str, Any]],
+    cached: bool = False
 ) -> GlobalExposureResult:
     """
     Convenience function to calculate exposure for all risks.
@@ -772,14 +1217,79 @@ def calculate_exposure(
         influences: List of influence relationships
         mitigations: List of mitigation dictionaries
         mitigates_relationships: List of MITIGATES relationships
+        cached: Reuse the result of an earlier call with identical inputs
+            (the last EXPOSURE_CACHE_SIZE are kept). Each call still gets
+            its own result object, timestamped at the time of the call.
     
     Returns:
         GlobalExposureResult with all metrics
     """
+    key = None
+    if cached:
+        try:
+            key = _exposure_cache_key(risks, influences, mitigations, mitigates_relationships)
+            hash(key)
+        except TypeError:
+            key = None  # Unhashable field value: calculate without caching
+        else:
+            with _exposure_cache_lock:
+                result = _exposure_cache.get(key)
+                if result is not None:
+                    _exposure_cache.move_to_end(key)
+                    return _fresh_exposure_result(result)
+
     calculator = ExposureCalculator(
         risks=risks,
         influences=influences,
         mitigations=mitigations,
         mitigates_relationships=mitigates_relationships
     )
-    return calculator.calculate_all()
+    result = calculator.calculate_all()
+
+    if key is not None:
+        with _exposure_cache_lock:
+            _exposure_cache[key] = result
+            _exposure_cache.move_to_end(key)
+            while len(_exposure_cache) > EXPOSURE_CACHE_SIZE:
+                _exposure_cache.popitem(last=False)
+        return _fresh_exposure_result(result)
+    return result
+
+
+def calculate_risk_exposures(risks: List[Any]) -> List[Optional[float]]:
+    """
+    Batch equivalent of ``Risk.calculate_exposure`` for many Risk objects.
+    
+    Probabilities and severities are gathered into arrays and multiplied in
+    one vectorized operation. Each risk with both scores set has its
+    ``exposure`` updated; the others are left untouched, as with the
+    per-instance method.
+    
+    Args:
+        risks: Risk model instances
+    
+    Returns:
+        Exposure per risk, None where probability or severity is missing
+    """
+    count = len(risks)
+    if not count:
+        return []
+    
+    probabilities = np.fromiter(
+        (r.probability if r.probability is not None else np.nan for r in risks),
+        dtype=np.float64, count=count
+    )
+    severities = np.fromiter(
+        (r.severity if r.severity is not None else np.nan for r in risks),
+        dtype=np.float64, count=count
+    )
+    products = probabilities * severities
+    
+    exposures = []
+    for risk, product in zip(risks, products.tolist()):
+        if product != product:  # NaN: a score is missing
+            exposures.append(None)
+            continue
+        risk.exposure = product
+        exposures.append(product)
+    return exposures
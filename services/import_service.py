@@ -5,22 +5,273 @@ Provides functionality to import RIM data from various formats,
 primarily Excel spreadsheets.
 """
 
-from typing import List, Dict, Any, Optional, Callable
+import ast
+import re
+import threading
+import time
+from collections import deque
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Callable, Set, Tuple, Deque
 from datetime import datetime
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+
+import pandas as pd
+
 from config.settings import (
     RISK_LEVELS, RISK_STATUSES, RISK_ORIGINS, RISK_CATEGORIES,
     MITIGATION_TYPES, MITIGATION_STATUSES,
     INFLUENCE_STRENGTHS, MITIGATION_EFFECTIVENESS
 )
+from models.compat import DATACLASS_SLOTS
 
 # Export-only metadata columns that the importer must always silently ignore
 # (they exist in the workbook for round-trip readability/debugging but are
 # either auto-generated on create or derived from edge endpoints).
 EXPORT_RESERVED_COLUMNS = {"_element_id", "_source", "_target", "created_at", "updated_at"}
 
+# Most log lines an ImportResult keeps; older lines are dropped first so the
+# final summary always survives, and memory stays bounded on huge workbooks
+IMPORT_LOG_LIMIT = 10_000
+
+# Hashed copies of the configured vocabularies, built once for the row checks
+_RISK_LEVELS = frozenset(RISK_LEVELS)
+_RISK_STATUSES = frozenset(RISK_STATUSES)
+_RISK_ORIGINS = frozenset(RISK_ORIGINS)
+_MITIGATION_TYPES = frozenset(MITIGATION_TYPES)
+_MITIGATION_STATUSES = frozenset(MITIGATION_STATUSES)
+_INFLUENCE_STRENGTHS = frozenset(INFLUENCE_STRENGTHS)
+_MITIGATION_EFFECTIVENESS = frozenset(MITIGATION_EFFECTIVENESS)
+
+# Columns each core sheet reader loads. Anything else in the sheet (exported
+# ids, computed exposure, timestamps...) is never parsed. Text columns are read
+# as str so name lookups and vocabulary checks never see numbers or dates.
+_RISK_SHEET_COLUMNS = frozenset({
+    "name", "level", "categories", "description", "status", "origin", "owner",
+    "probability", "severity", "impact", "activation_condition",
+    "activation_decision_date", "subtype",
+})
+_RISK_TEXT_COLUMNS = (
+    "name", "level", "categories", "description", "status", "origin", "owner",
+    "activation_condition", "subtype",
+)
+_INFLUENCE_SHEET_COLUMNS = frozenset({
+    "source_name", "target_name", "source_id", "target_id",
+    "influence_type", "strength", "confidence", "description",
+})
+_INFLUENCE_TEXT_COLUMNS = (
+    "source_name", "target_name", "source_id", "target_id",
+    "influence_type", "strength", "description",
+)
+_MITIGATION_SHEET_COLUMNS = frozenset({
+    "name", "type", "status", "description", "owner", "source_entity",
+})
+_MITIGATION_TEXT_COLUMNS = tuple(sorted(_MITIGATION_SHEET_COLUMNS))
+_MITIGATES_SHEET_COLUMNS = frozenset({
+    "mitigation_name", "risk_name", "mitigation_id", "risk_id",
+    "effectiveness", "description",
+})
+_MITIGATES_TEXT_COLUMNS = tuple(sorted(_MITIGATES_SHEET_COLUMNS))
+
+# Kernel types that have dedicated sheets and are never imported as context data
+_KERNEL_ENTITY_TYPES = frozenset({"risk", "mitigation"})
+_KERNEL_REL_TYPES = frozenset({"influences", "mitigates"})
+_EDGE_ENDPOINT_COLUMNS = frozenset({"source_name", "target_name"})
+
+
+def _column(df, name: str, default=None):
+    """Return ``df[name]``, or a constant Series when the sheet lacks the column."""
+
+    if name in df.columns:
+        return df[name]
+    return pd.Series(default, index=df.index, dtype=object)
+
+
+def _text_column(df, name: str, default: str = ''):
+    """``df[name]`` as strings, with blanks (or a missing column) set to ``default``."""
+    return _column(df, name).fillna(default).astype(str)
+
+
+def _optional_text_column(df, name: str):
+    """``df[name]`` as strings, with blanks (or a missing column) set to None."""
+    values = _column(df, name)
+    return values.astype(str).astype(object).where(values.notna(), None)
+
+
+def _float_column(df, name: str, default: Optional[float] = None):
+    """``df[name]`` as Python floats; blanks and non-numbers become ``default``."""
+    values = pd.to_numeric(_column(df, name), errors='coerce')
+    return values.astype(object).where(values.notna(), default)
+
+
+# A plain list literal of quoted strings, e.g. "['Programme', 'Supply Chain']"
+# (the format the exporter writes). Escapes and non-string items take the
+# ast.literal_eval fallback.
+_QUOTED_ITEM = r"""(?:'[^'\\]*'|"[^"\\]*")"""
+_SIMPLE_LIST_LITERAL = re.compile(
+    rf"^\[\s*{_QUOTED_ITEM}(?:\s*,\s*{_QUOTED_ITEM})*\s*,?\s*\]$"
+)
+_QUOTED_ITEM_VALUE = re.compile(r"'([^'\\]*)'" r'|"([^"\\]*)"')
+
+
+@lru_cache(maxsize=1024)
+def _parse_category_string(value: str) -> Tuple[str, ...]:
+    """
+    Parse a categories cell string (memoized: the same strings repeat across rows).
+
+    Returns a tuple so cached results can't be mutated by callers.
+    """
+    stripped = value.strip()
+    if _SIMPLE_LIST_LITERAL.match(stripped):
+        return tuple(a or b for a, b in _QUOTED_ITEM_VALUE.findall(stripped))
+
+    # Only list-looking cells can be literals; plain "a, b" skips the parser
+    if stripped.startswith('['):
+        try:
+            parsed = ast.literal_eval(stripped)
+            if isinstance(parsed, list):
+                return tuple(parsed)
+        except (ValueError, SyntaxError):
+            pass
+
+    # Try comma-separated
+    return tuple(c.strip().strip("[]'\"") for c in value.split(','))
+
+
+def _excel_read_engine() -> Optional[str]:
+    """
+    Pick the workbook reader for imports.
+
+    Returns "calamine" (Rust-based, much faster than openpyxl's XML parser)
+    when python-calamine is installed and pandas supports it (2.2+), else
+    None so pandas keeps its default engine for the file type.
+    """
+    try:
+        import python_calamine  # noqa: F401
+    except ImportError:
+        return None
+    pandas_version = tuple(int(part) for part in pd.__version__.split(".")[:2])
+    return "calamine" if pandas_version >= (2, 2) else None
+
+
+def _read_core_sheet(xl, sheet_name: str, columns, text_columns, keep_prefix: Optional[str] = None):
+    """
+    Read one core sheet, parsing only the columns the importer uses.
+
+    Args:
+        xl: Open workbook
+        sheet_name: Sheet to read
+        columns: Column names to load
+        text_columns: Columns forced to str (blanks stay NaN)
+        keep_prefix: Also load every column starting with this prefix (e.g. "ext_")
+    """
+    def wanted(col) -> bool:
+        return col in columns or bool(keep_prefix and str(col).startswith(keep_prefix))
+
+    return pd.read_excel(
+        xl, sheet_name=sheet_name, usecols=wanted,
+        dtype=dict.fromkeys(text_columns, str),
+    )
+
+
+def _iso_date_column(series):
+    """
+    Convert a date column to ISO strings in one pass (blanks become None).
+
+    A column Excel stored as real dates arrives as datetime64 and is
+    formatted with a single vectorized strftime; mixed columns (dates typed
+    as text next to real dates) fall back to a per-value conversion.
+    """
+    if pd.api.types.is_datetime64_any_dtype(series):
+        iso = series.dt.strftime("%Y-%m-%dT%H:%M:%S")
+    else:
+        iso = series.map(
+            lambda v: v.isoformat() if hasattr(v, "isoformat") else (str(v) if v else None),
+            na_action="ignore",
+        )
+    return iso.astype(object).where(iso.notna(), None)
+
+
+def _resolve_ids(names, name_to_id: Dict[str, str], direct_ids=None):
+    """
+    Resolve a column of node names to IDs with one ``Series.map`` join.
+
+    Args:
+        names: Names to look up (compared as strings)
+        name_to_id: Name → ID map
+        direct_ids: Optional exported ID column; non-blank values win over the
+            name lookup (same-DB re-import)
+
+    Returns:
+        Series of IDs, NaN where unresolved
+    """
+    ids = names.astype(str).map(name_to_id)
+    if direct_ids is not None:
+        ids = direct_ids.where(direct_ids.notna() & (direct_ids != ""), ids)
+    return ids
+
+
+def _existing_pairs_mask(df, source_col: str, target_col: str, existing: Set[tuple]):
+    """
+    Mask rows whose ``(source, target)`` pair is already in ``existing`` or
+    repeats an earlier row of the same sheet.
+    """
+    mask = df.duplicated(subset=[source_col, target_col])
+    if existing and len(df):
+        pairs = pd.MultiIndex.from_arrays([df[source_col], df[target_col]])
+        mask |= pairs.isin(list(existing))
+    return mask
+
 
-@dataclass
+def _allowed_or(series, allowed, default):
+    """Replace values outside ``allowed`` (blanks included) with ``default``."""
+    return series.where(series.isin(allowed), default)
+
+
+def _register_node_id(node_name_to_id: Dict[str, str], type_id: str, entity: Dict[str, Any]) -> None:
+    """Map an entity's name (and a TPO's reference) to its ID for edge resolution."""
+    name = entity.get("name")
+    node_id = entity.get("id")
+    if not node_id:
+        return
+    if name:
+        node_name_to_id[name] = node_id
+    if type_id == "tpo":
+        ref = entity.get("reference")
+        if ref and ref != name:
+            node_name_to_id[ref] = node_id
+
+
+def _iter_rows(df):
+    """
+    Yield ``(index, row)`` pairs with each row as a plain ``{column: value}`` dict.
+
+    Uses ``itertuples`` rather than ``iterrows`` so no Series is built per
+    row. Plain tuples (``name=None``) are zipped back to column names instead
+    of using namedtuples, because sheet headers such as ``_element_id`` or
+    schema property names are not always valid identifiers.
+    """
+    columns = list(df.columns)
+    for idx, *values in df.itertuples(index=True, name=None):
+        yield idx, dict(zip(columns, values))
+
+
+# (epoch second, "HH:MM:SS") of the last log timestamp formatted
+_last_log_timestamp: Tuple[int, str] = (-1, "")
+
+
+def _log_timestamp() -> str:
+    """Current "HH:MM:SS", re-formatted only when the second changes."""
+    global _last_log_timestamp
+    second = int(time.time())
+    cached = _last_log_timestamp
+    if cached[0] != second:
+        cached = (second, datetime.fromtimestamp(second).strftime("%H:%M:%S"))
+        _last_log_timestamp = cached
+    return cached[1]
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ImportResult:
     """Results from an import operation."""
     risks_created: int = 0
@@ -41,36 +292,39 @@ class ImportResult:
     context_edges_skipped: int = 0
     errors: List[str] = field(default_factory=list)
     warnings: List[str] = field(default_factory=list)
-    logs: List[str] = field(default_factory=list)
+    logs: Deque[str] = field(default_factory=lambda: deque(maxlen=IMPORT_LOG_LIMIT))
+    verbose: bool = False
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary."""
-        return {
-            "risks_created": self.risks_created,
-            "risks_skipped": self.risks_skipped,
-            "influences_created": self.influences_created,
-            "influences_skipped": self.influences_skipped,
-            "tpos_created": self.tpos_created,
-            "tpos_skipped": self.tpos_skipped,
-            "tpo_impacts_created": self.tpo_impacts_created,
-            "tpo_impacts_skipped": self.tpo_impacts_skipped,
-            "mitigations_created": self.mitigations_created,
-            "mitigations_skipped": self.mitigations_skipped,
-            "mitigates_created": self.mitigates_created,
-            "mitigates_skipped": self.mitigates_skipped,
-            "context_nodes_created": self.context_nodes_created,
-            "context_nodes_skipped": self.context_nodes_skipped,
-            "context_edges_created": self.context_edges_created,
-            "context_edges_skipped": self.context_edges_skipped,
-            "errors": self.errors,
-            "warnings": self.warnings,
-            "logs": self.logs
-        }
+        """Convert to dictionary (every counter and message list; logs as a list)."""
+        data = {f.name: getattr(self, f.name) for f in fields(self) if f.name != "verbose"}
+        data["logs"] = list(self.logs)
+        return data
     
     def log(self, message: str, level: str = "INFO"):
         """Add a log entry with timestamp."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.logs.append(f"[{timestamp}] {level}: {message}")
+        self.logs.append(f"[{_log_timestamp()}] {level}: {message}")
+
+    def debug(self, message: str, *args: Any):
+        """
+        Add a per-row detail entry, only when ``verbose``.
+
+        ``message`` is %-formatted with ``args`` lazily, so nothing is built
+        for the (default) non-verbose imports.
+        """
+        if self.verbose:
+            self.log(message % args if args else message, "DEBUG")
+
+    def merge(self, other: "ImportResult") -> None:
+        """Add another (partial) result's counters and append its messages."""
+        for f in fields(self):
+            value = getattr(other, f.name)
+            if isinstance(value, bool):
+                continue
+            if isinstance(value, int):
+                setattr(self, f.name, getattr(self, f.name) + value)
+            else:
+                getattr(self, f.name).extend(value)
 
 
 class ExcelImporter:
@@ -95,23 +349,36 @@ class ExcelImporter:
         registry=None,
         get_all_influences_fn: Optional[Callable] = None,
         get_all_mitigates_fn: Optional[Callable] = None,
+        create_influences_bulk_fn: Optional[Callable] = None,
+        create_mitigates_bulk_fn: Optional[Callable] = None,
     ):
         """
         Initialize the importer with database operation functions.
 
         Args:
-            create_risk_fn: Function to create a risk
+            create_risk_fn: Function to create a risk; returns the new risk ID
             create_influence_fn: Function to create an influence
-            create_mitigation_fn: Function to create a mitigation
+            create_mitigation_fn: Function to create a mitigation; returns the new mitigation ID
             create_mitigates_fn: Function to create a mitigates relationship
-            get_all_risks_fn: Function to get all risks
-            get_all_mitigations_fn: Function to get all mitigations
+            get_all_risks_fn: Function to get all risks (read once, before importing)
+            get_all_mitigations_fn: Function to get all mitigations (read once, before importing)
             create_generic_entity_fn: Function to create a ContextNode (type_id, data) -> dict
             get_generic_entities_fn: Function to get ContextNodes (type_id) -> list
             create_generic_relationship_fn: Function to create a ContextEdge
             registry: SchemaRegistry instance for ContextNode/ContextEdge type lookup
             get_all_influences_fn: Function to get all influence relationships (for dedup)
             get_all_mitigates_fn: Function to get all mitigates relationships (for dedup)
+            create_influences_bulk_fn: Function creating many influences in one call
+                (rows) -> list of created {source_id, target_id}; per-row creation
+                via create_influence_fn is used when absent
+            create_mitigates_bulk_fn: Function creating many mitigates relationships in
+                one call (rows) -> list of created {mitigation_id, risk_id}; per-row
+                creation via create_mitigates_fn is used when absent
+
+        The Risks, Mitigations and CN_* phases run concurrently on worker threads,
+        so the risk, mitigation and generic entity callbacks must be safe to call
+        from several threads at once (the Neo4j manager's are: each call opens
+        its own session).
         """
         self.create_risk = create_risk_fn
         self.create_influence = create_influence_fn
@@ -125,87 +392,77 @@ class ExcelImporter:
         self.registry = registry
         self.get_all_influences = get_all_influences_fn
         self.get_all_mitigates = get_all_mitigates_fn
+        self.create_influences_bulk = create_influences_bulk_fn
+        self.create_mitigates_bulk = create_mitigates_bulk_fn
+        # Serializes sheet parsing on the shared workbook handle across phase threads
+        self._workbook_lock = threading.Lock()
     
-    def import_from_excel(self, filepath: str) -> ImportResult:
+    def import_from_excel(self, filepath: str, verbose: bool = False) -> ImportResult:
         """
         Import all data from an Excel file.
         
         Args:
             filepath: Path to the Excel file
+            verbose: Also log per-row details (e.g. rows skipped as duplicates)
         
         Returns:
             ImportResult with counts and logs
         """
-        import pandas as pd
-        
-        result = ImportResult()
+        result = ImportResult(verbose=verbose)
         result.log(f"Starting import from {filepath}")
         
         # Mappings for name-to-ID resolution
         risk_name_to_id: Dict[str, str] = {}
-        tpo_ref_to_id: Dict[str, str] = {}
         mitigation_name_to_id: Dict[str, str] = {}
         
         try:
-            # Import core entities
-            self._import_risks(filepath, result)
-            
-            # Build risk name mapping
-            result.log("Building risk name mapping from database...")
-            all_risks = self.get_all_risks()
-            for risk in all_risks:
-                risk_name_to_id[risk['name']] = risk['id']
-            result.log(f"Mapped {len(risk_name_to_id)} risks by name")
-            
-            # Build TPO reference mapping — TPOs are ContextNodes; use get_generic_entities
-            # (Legacy "TPOs" sheet handler removed; live path is _import_context_nodes for CN_tpo)
-            result.log("Building TPO reference mapping from database...")
-            if self.get_generic_entities:
-                all_tpos = self.get_generic_entities('tpo') or []
-                for tpo in all_tpos:
-                    name = tpo.get('name', '')
-                    ref = tpo.get('reference', '')
-                    tpo_id = tpo.get('id', '')
-                    if name and tpo_id:
-                        tpo_ref_to_id[name] = tpo_id
-                    if ref and tpo_id and ref != name:
-                        tpo_ref_to_id[ref] = tpo_id
-            result.log(f"Mapped {len(tpo_ref_to_id)} TPOs by name/reference")
-            
-            # Import Influences
-            self._import_influences(filepath, result, risk_name_to_id)
-
-            # (Legacy "TPO_Impacts" sheet handler removed; live path is _import_context_edges for CE_impacts_tpo)
-
-            # Import Mitigations
-            self._import_mitigations(filepath, result)
-            
-            # Build mitigation name mapping
-            result.log("Building mitigation name mapping from database...")
-            all_mitigations = self.get_all_mitigations()
-            for mit in all_mitigations:
-                mitigation_name_to_id[mit['name']] = mit['id']
-            result.log(f"Mapped {len(mitigation_name_to_id)} mitigations by name")
-            
-            # Import Mitigates relationships
-            self._import_mitigates(filepath, result, mitigation_name_to_id, risk_name_to_id)
-            
-            # Import Context data (schema-driven, no new types created)
-            if self.registry and self.create_generic_entity:
-                self._import_context_nodes(filepath, result)
-                # Build full node name map for edge resolution (risks + TPOs + context nodes)
-                node_name_to_id: Dict[str, str] = {**risk_name_to_id}
-                node_name_to_id.update(tpo_ref_to_id)
-                if self.get_generic_entities:
-                    for type_id in self.registry.entity_types:
-                        if type_id in ("risk", "mitigation"):
-                            continue
-                        for entity in (self.get_generic_entities(type_id) or []):
-                            if entity.get("name") and entity.get("id"):
-                                node_name_to_id[entity["name"]] = entity["id"]
-                if self.create_generic_relationship:
-                    self._import_context_edges(filepath, result, node_name_to_id)
-            
+            # Open the workbook once; every sheet reader below reuses this handle
+            # instead of re-parsing the whole file per sheet.
+            engine = _excel_read_engine()
+            result.log(f"Reading workbook with {engine or 'default'} engine")
+            with pd.ExcelFile(filepath, engine=engine) as xl:
+                # Risks, Mitigations and context nodes don't depend on each other,
+                # so they run concurrently and their database round-trips overlap.
+                # Each importer seeds its name → id map from the dedup read it
+                # already does and adds the IDs it creates, so no phase needs to
+                # re-query the database afterwards.
+                context_name_to_id: Dict[str, str] = {}
+                import_context = bool(self.registry and self.create_generic_entity)
+                phases = [
+                    (self._import_risks, risk_name_to_id),
+                    (self._import_mitigations, mitigation_name_to_id),
+                ]
+                if import_context:
+                    phases.append((self._import_context_nodes, context_name_to_id))
+                phase_returns = self._run_independent_phases(xl, result, phases)
+                result.log(f"Mapped {len(risk_name_to_id)} risks by name")
+                result.log(f"Mapped {len(mitigation_name_to_id)} mitigations by name")
+
+                # Relationship sheets need the parent maps above
+                self._import_influences(xl, result, risk_name_to_id)
+
+                # (Legacy "TPO_Impacts" sheet handler removed; live path is _import_context_edges for CE_impacts_tpo)
+
+                self._import_mitigates(xl, result, mitigation_name_to_id, risk_name_to_id)
+
+                # Import Context edges (schema-driven, no new types created)
+                if import_context:
+                    # Full node name map for edge resolution (risks + TPOs + context nodes).
+                    # (Legacy "TPOs" sheet handler removed; TPOs are ContextNodes imported
+                    # from CN_tpo and are also mapped by their reference.)
+                    node_name_to_id: Dict[str, str] = {**risk_name_to_id, **context_name_to_id}
+                    mapped_types = phase_returns[-1]
+                    # Types without a CN_ sheet were not read during the import
+                    if self.get_generic_entities:
+                        for type_id in self.registry.entity_types:
+                            if type_id in _KERNEL_ENTITY_TYPES or type_id in mapped_types:
+                                continue
+                            for entity in (self.get_generic_entities(type_id) or []):
+                                _register_node_id(node_name_to_id, type_id, entity)
+                    result.log(f"Mapped {len(node_name_to_id)} nodes by name for context edges")
+                    if self.create_generic_relationship:
+                        self._import_context_edges(xl, result, node_name_to_id)
+
         except Exception as e:
             result.errors.append(f"Global import error: {str(e)}")
             result.log(f"Global error during import: {str(e)}", "ERROR")
@@ -225,70 +482,131 @@ class ExcelImporter:
         
         return result
     
-    def _import_risks(self, filepath: str, result: ImportResult):
-        """Import risks from Excel."""
-        import pandas as pd
+    def _run_independent_phases(
+        self,
+        xl: pd.ExcelFile,
+        result: ImportResult,
+        phases: List[Tuple[Callable, Dict[str, str]]],
+    ) -> List[Any]:
+        """
+        Run ``phase(xl, partial_result, name_to_id)`` calls on a thread pool.
+
+        Each phase writes into its own ImportResult, merged into ``result`` in
+        the order given so counts and logs stay deterministic. Callbacks used
+        by these phases run off the Streamlit script thread, where ``st.*``
+        output is dropped: they must raise on failure, and the phase records
+        the error in the result.
+
+        Returns:
+            The phases' return values, in the same order
+        """
+        partials = [ImportResult(verbose=result.verbose) for _ in phases]
+        with ThreadPoolExecutor(max_workers=len(phases)) as executor:
+            futures = [
+                executor.submit(phase, xl, partial, name_to_id)
+                for (phase, name_to_id), partial in zip(phases, partials)
+            ]
+        for partial in partials:
+            result.merge(partial)
+        return [future.result() for future in futures]
+
+    def _import_risks(
+        self,
+        xl: pd.ExcelFile,
+        result: ImportResult,
+        risk_name_to_id: Dict[str, str]
+    ):
+        """
+        Import risks from Excel.
+
+        ``risk_name_to_id`` is filled with the risks already in the database
+        plus every risk created here.
+        """
 
         result.log("Processing Risks sheet...")
         try:
-            df = pd.read_excel(filepath, sheet_name='Risks')
+            # Existing risks: used for deduplication and for resolving relationship rows
+            for risk in (self.get_all_risks() or []):
+                if risk.get('name') and risk.get('id'):
+                    risk_name_to_id[risk['name']] = risk['id']
+
+            # sheet_names reads through the shared reader too, so it needs the lock
+            with self._workbook_lock:
+                if 'Risks' not in xl.sheet_names:
+                    result.log("No 'Risks' sheet found", "WARNING")
+                    return
+                df = _read_core_sheet(
+                    xl, 'Risks', _RISK_SHEET_COLUMNS, _RISK_TEXT_COLUMNS, keep_prefix='ext_'
+                )
             result.log(f"Found {len(df)} risks in Excel file")
 
-            # Build existing-name set for deduplication
-            existing_risk_names = {r['name'] for r in (self.get_all_risks() or []) if r.get('name')}
-            
             # Detect ext_* columns
             ext_columns = [c for c in df.columns if c.startswith("ext_")]
             if ext_columns:
                 result.log(f"Found extension columns: {', '.join(ext_columns)}")
-            
-            for idx, row in df.iterrows():
+
+            # Validate required fields column-wise, then only loop over valid rows
+            names = _column(df, 'name')
+            levels = _column(df, 'level')
+            has_name = names.notna()
+            valid_level = levels.isin(_RISK_LEVELS)
+            missing_name = df.index[~has_name]
+            invalid_level = df.index[has_name & ~valid_level]
+            result.warnings.extend(
+                f"Row {idx + 2}: Missing risk name, skipped" for idx in missing_name
+            )
+            result.warnings.extend(
+                f"Row {idx + 2} ({name}): Invalid level '{level}'. Valid: {RISK_LEVELS}"
+                for idx, name, level in zip(
+                    invalid_level, names.loc[invalid_level], levels.loc[invalid_level]
+                )
+            )
+            result.risks_skipped += len(missing_name) + len(invalid_level)
+
+            df = df.loc[has_name & valid_level].copy()
+            df['status'] = _allowed_or(_column(df, 'status'), _RISK_STATUSES, 'Active')
+            df['origin'] = _allowed_or(_column(df, 'origin'), _RISK_ORIGINS, 'New')
+            df['activation_decision_date'] = _iso_date_column(_column(df, 'activation_decision_date'))
+            df['description'] = _text_column(df, 'description')
+            df['owner'] = _text_column(df, 'owner')
+            df['activation_condition'] = _optional_text_column(df, 'activation_condition')
+            df['subtype'] = _optional_text_column(df, 'subtype')
+            df['probability'] = _float_column(df, 'probability')
+            severity = _float_column(df, 'severity')
+            df['severity'] = severity.where(severity.notna(), _float_column(df, 'impact'))
+            has_categories = 'categories' in df.columns
+            df['categories'] = _column(df, 'categories').map(self._parse_categories)
+
+            # Skip risks whose name already exists in the DB in one pass
+            exists = df['name'].isin(risk_name_to_id.keys())
+            result.risks_skipped += int(exists.sum())
+            if result.verbose:
+                for risk_name in df.loc[exists, 'name']:
+                    result.debug("Skipped (already exists): %s", risk_name)
+            df = df.loc[~exists]
+
+            # A sheet without the column silently defaults; blank/unparsable cells warn
+            if has_categories:
+                no_categories = df.loc[~df['categories'].astype(bool), 'name']
+                result.warnings.extend(
+                    f"Row {idx + 2} ({name}): Invalid categories, defaulting"
+                    for idx, name in no_categories.items()
+                )
+
+            created = skipped = 0
+            for idx, row in _iter_rows(df):
                 row_num = idx + 2
                 try:
-                    risk_name = row.get('name', 'Unknown')
-                    
-                    # Validate required fields
-                    if pd.isna(row.get('name')):
-                        result.warnings.append(f"Row {row_num}: Missing risk name, skipped")
-                        result.risks_skipped += 1
-                        continue
-                    
-                    if pd.isna(row.get('level')) or row.get('level') not in RISK_LEVELS:
-                        result.warnings.append(f"Row {row_num} ({risk_name}): Invalid level '{row.get('level', 'None')}'. Valid: {RISK_LEVELS}")
-                        result.risks_skipped += 1
+                    risk_name = row['name']
+
+                    # Same name earlier in this sheet
+                    if risk_name in risk_name_to_id:
+                        skipped += 1
+                        result.debug("Skipped (already exists): %s", risk_name)
                         continue
-                    
-                    # Parse categories
-                    categories = self._parse_categories(row.get('categories', ['Programme']))
-                    if not categories:
-                        categories = ['Programme']
-                        result.warnings.append(f"Row {row_num} ({risk_name}): Invalid categories, defaulting")
-                    
-                    # Parse other fields with defaults
-                    description = self._safe_string(row.get('description', ''))
-                    status = row.get('status', 'Active')
-                    if pd.isna(status) or status not in RISK_STATUSES:
-                        status = 'Active'
-                    
-                    origin = row.get('origin', 'New')
-                    if pd.isna(origin) or origin not in RISK_ORIGINS:
-                        origin = 'New'
-                    
-                    owner = self._safe_string(row.get('owner', ''))
-                    probability = self._safe_float(row.get('probability'))
-                    severity = self._safe_float(row.get('severity') or row.get('impact'))
-                    
-                    activation_condition = None
-                    if not pd.isna(row.get('activation_condition')):
-                        activation_condition = str(row.get('activation_condition'))
-                    
-                    activation_date = self._parse_date(row.get('activation_decision_date'))
-                    
-                    # Parse subtype
-                    subtype = None
-                    if 'subtype' in df.columns and not pd.isna(row.get('subtype')):
-                        subtype = str(row.get('subtype'))
-                    
+
+                    categories = row['categories'] or ['Programme']
+
                     # Parse extension fields
                     ext_fields = {}
                     for col in ext_columns:
@@ -304,59 +622,56 @@ class ExcelImporter:
                             else:
                                 ext_fields[col] = str(val)
                     
-                    # Skip if risk with this name already exists in DB
-                    if risk_name in existing_risk_names:
-                        result.risks_skipped += 1
-                        result.log(f"Skipped (already exists): {risk_name}")
-                        continue
-
-                    # Create risk
-                    if self.create_risk(
+                    # Create risk (the callback returns the new risk ID)
+                    risk_id = self.create_risk(
                         name=risk_name,
                         level=row['level'],
                         categories=categories,
-                        description=description,
-                        status=status,
-                        activation_condition=activation_condition,
-                        activation_decision_date=activation_date,
-                        owner=owner,
-                        probability=probability,
-                        severity=severity,
-                        origin=origin,
-                        subtype=subtype,
+                        description=row['description'],
+                        status=row['status'],
+                        activation_condition=row['activation_condition'],
+                        activation_decision_date=row['activation_decision_date'],
+                        owner=row['owner'],
+                        probability=row['probability'],
+                        severity=row['severity'],
+                        origin=row['origin'],
+                        subtype=row['subtype'],
                         ext_fields=ext_fields if ext_fields else None,
-                    ):
-                        existing_risk_names.add(risk_name)
-                        result.risks_created += 1
-                        result.log(f"Created risk: {risk_name}")
+                    )
+                    if risk_id:
+                        risk_name_to_id[risk_name] = risk_id
+                        created += 1
+                        result.debug("Created risk: %s", risk_name)
                     else:
-                        result.risks_skipped += 1
+                        skipped += 1
                         result.warnings.append(f"Row {row_num} ({risk_name}): Failed to create")
                 
                 except Exception as e:
-                    result.risks_skipped += 1
+                    skipped += 1
                     result.errors.append(f"Row {row_num} - Risk error: {str(e)}")
+
+            result.risks_created += created
+            result.risks_skipped += skipped
         
-        except ValueError as e:
-            if "Worksheet" in str(e):
-                result.log("No 'Risks' sheet found", "WARNING")
-            else:
-                raise
         except Exception as e:
             result.errors.append(f"Risks sheet error: {str(e)}")
     
     def _import_influences(
         self,
-        filepath: str,
+        xl: pd.ExcelFile,
         result: ImportResult,
         risk_name_to_id: Dict[str, str]
     ):
         """Import influences from Excel."""
-        import pandas as pd
         
         result.log("Processing Influences sheet...")
+        if 'Influences' not in xl.sheet_names:
+            result.log("No 'Influences' sheet found", "WARNING")
+            return
         try:
-            df = pd.read_excel(filepath, sheet_name='Influences')
+            df = _read_core_sheet(
+                xl, 'Influences', _INFLUENCE_SHEET_COLUMNS, _INFLUENCE_TEXT_COLUMNS
+            )
             result.log(f"Found {len(df)} influences in Excel file")
 
             # Build existing (source_id, target_id) set for deduplication
@@ -373,148 +688,217 @@ class ExcelImporter:
             # the WHERE NOT EXISTS guard in create_influence hits the EXACT same node pair.
             has_direct_ids = 'source_id' in df.columns and 'target_id' in df.columns
 
-            for idx, row in df.iterrows():
+            has_names = _column(df, 'source_name').notna() & _column(df, 'target_name').notna()
+            missing_names = df.index[~has_names]
+            result.warnings.extend(
+                f"Influence Row {idx + 2}: Missing names, skipped" for idx in missing_names
+            )
+            result.influences_skipped += len(missing_names)
+
+            df = df.loc[has_names].copy()
+            df['strength'] = _allowed_or(_column(df, 'strength'), _INFLUENCE_STRENGTHS, 'Moderate')
+            df['influence_type'] = _text_column(df, 'influence_type')
+            df['description'] = _text_column(df, 'description')
+            df['confidence'] = _float_column(df, 'confidence', 0.8)
+
+            # Prefer exported IDs (same-DB re-import); fall back to name lookup
+            df['source_id'] = _resolve_ids(
+                df['source_name'], risk_name_to_id, df['source_id'] if has_direct_ids else None
+            )
+            df['target_id'] = _resolve_ids(
+                df['target_name'], risk_name_to_id, df['target_id'] if has_direct_ids else None
+            )
+            resolved = df['source_id'].notna() & df['target_id'].notna()
+            unresolved = df.index[~resolved]
+            result.warnings.extend(
+                f"Influence Row {idx + 2}: Risk not found, skipped" for idx in unresolved
+            )
+            result.influences_skipped += len(unresolved)
+            df = df.loc[resolved]
+
+            # Skip pairs already in the DB (application-layer check) or repeated in the sheet
+            exists = _existing_pairs_mask(df, 'source_id', 'target_id', existing_infs)
+            result.influences_skipped += int(exists.sum())
+            if result.verbose:
+                for source_name, target_name in zip(
+                    df.loc[exists, 'source_name'], df.loc[exists, 'target_name']
+                ):
+                    result.debug("Skipped (already exists): %s → %s", source_name, target_name)
+            df = df.loc[~exists]
+
+            # Rows queued for a single bulk create (only used with create_influences_bulk)
+            pending: List[Dict[str, Any]] = []
+            pending_names: List[tuple] = []
+
+            created = skipped = 0
+            for idx, row in _iter_rows(df):
                 row_num = idx + 2
                 try:
-                    source_name = row.get('source_name')
-                    target_name = row.get('target_name')
-
-                    if pd.isna(source_name) or pd.isna(target_name):
-                        result.warnings.append(f"Influence Row {row_num}: Missing names, skipped")
-                        result.influences_skipped += 1
-                        continue
-
-                    # Prefer exported IDs (same-DB re-import); fall back to name lookup
-                    if has_direct_ids:
-                        raw_sid = row.get('source_id')
-                        raw_tid = row.get('target_id')
-                        source_id = (str(raw_sid) if not pd.isna(raw_sid) and raw_sid else None) \
-                                    or risk_name_to_id.get(str(source_name))
-                        target_id = (str(raw_tid) if not pd.isna(raw_tid) and raw_tid else None) \
-                                    or risk_name_to_id.get(str(target_name))
-                    else:
-                        source_id = risk_name_to_id.get(str(source_name))
-                        target_id = risk_name_to_id.get(str(target_name))
-
-                    if not source_id or not target_id:
-                        result.warnings.append(f"Influence Row {row_num}: Risk not found, skipped")
-                        result.influences_skipped += 1
-                        continue
-
-                    # Skip if influence already exists (application-layer check)
-                    if (source_id, target_id) in existing_infs:
-                        result.influences_skipped += 1
-                        result.log(f"Skipped (already exists): {source_name} → {target_name}")
-                        continue
-
-                    strength = row.get('strength', 'Moderate')
-                    if pd.isna(strength) or strength not in INFLUENCE_STRENGTHS:
-                        strength = 'Moderate'
-
-                    confidence = self._safe_float(row.get('confidence'), 0.8)
-                    description = self._safe_string(row.get('description', ''))
-
-                    if self.create_influence(
+                    source_name = row['source_name']
+                    target_name = row['target_name']
+                    source_id = row['source_id']
+                    target_id = row['target_id']
+
+                    if self.create_influences_bulk:
+                        pending.append({
+                            "source_id": source_id,
+                            "target_id": target_id,
+                            "strength": row['strength'],
+                            "description": row['description'],
+                            "confidence": row['confidence'],
+                        })
+                        pending_names.append((source_name, target_name))
+                    elif self.create_influence(
                         source_id=source_id,
                         target_id=target_id,
-                        influence_type=row.get('influence_type', ''),
-                        strength=strength,
-                        description=description,
-                        confidence=confidence
+                        influence_type=row['influence_type'],
+                        strength=row['strength'],
+                        description=row['description'],
+                        confidence=row['confidence']
                     ):
-                        existing_infs.add((source_id, target_id))
-                        result.influences_created += 1
-                        result.log(f"Created influence: {source_name} → {target_name}")
+                        created += 1
+                        result.debug("Created influence: %s → %s", source_name, target_name)
                     else:
-                        existing_infs.add((source_id, target_id))  # DB-layer dedup fired; count as skip
-                        result.influences_skipped += 1
-                        result.log(f"Skipped (already exists): {source_name} → {target_name}")
+                        skipped += 1  # DB-layer dedup fired; count as skip
+                        result.debug("Skipped (already exists): %s → %s", source_name, target_name)
                 
                 except Exception as e:
-                    result.influences_skipped += 1
+                    skipped += 1
                     result.errors.append(f"Influence Row {row_num} - Error: {str(e)}")
+
+            if pending:
+                try:
+                    created_pairs = {
+                        (rel['source_id'], rel['target_id'])
+                        for rel in (self.create_influences_bulk(pending) or [])
+                    }
+                except Exception as e:
+                    skipped += len(pending)
+                    result.errors.append(f"Influences batch error: {str(e)}")
+                    pending = []
+                created_flags = [
+                    (rec['source_id'], rec['target_id']) in created_pairs for rec in pending
+                ]
+                created += sum(created_flags)
+                skipped += len(created_flags) - sum(created_flags)
+                if result.verbose:
+                    for was_created, (source_name, target_name) in zip(created_flags, pending_names):
+                        if was_created:
+                            result.debug("Created influence: %s → %s", source_name, target_name)
+                        else:
+                            result.debug("Skipped (already exists): %s → %s", source_name, target_name)
+
+            result.influences_created += created
+            result.influences_skipped += skipped
         
-        except ValueError:
-            result.log("No 'Influences' sheet found", "WARNING")
         except Exception as e:
             result.log(f"Influences sheet error: {str(e)}", "WARNING")
     
-    def _import_mitigations(self, filepath: str, result: ImportResult):
-        """Import mitigations from Excel."""
-        import pandas as pd
+    def _import_mitigations(
+        self,
+        xl: pd.ExcelFile,
+        result: ImportResult,
+        mitigation_name_to_id: Dict[str, str]
+    ):
+        """
+        Import mitigations from Excel.
+
+        ``mitigation_name_to_id`` is filled with the mitigations already in
+        the database plus every mitigation created here.
+        """
         
         result.log("Processing Mitigations sheet...")
         try:
-            df = pd.read_excel(filepath, sheet_name='Mitigations')
+            # Existing mitigations: used for deduplication and for resolving Mitigates rows
+            for mit in (self.get_all_mitigations() or []):
+                if mit.get('name') and mit.get('id'):
+                    mitigation_name_to_id[mit['name']] = mit['id']
+
+            # sheet_names reads through the shared reader too, so it needs the lock
+            with self._workbook_lock:
+                if 'Mitigations' not in xl.sheet_names:
+                    result.log("No 'Mitigations' sheet found", "WARNING")
+                    return
+                df = _read_core_sheet(
+                    xl, 'Mitigations', _MITIGATION_SHEET_COLUMNS, _MITIGATION_TEXT_COLUMNS
+                )
             result.log(f"Found {len(df)} mitigations in Excel file")
 
-            # Build existing-name set for deduplication
-            existing_mit_names = {m['name'] for m in (self.get_all_mitigations() or []) if m.get('name')}
-
-            for idx, row in df.iterrows():
+            has_name = _column(df, 'name').notna()
+            missing_name = df.index[~has_name]
+            result.warnings.extend(
+                f"Mitigation Row {idx + 2}: Missing name, skipped" for idx in missing_name
+            )
+            result.mitigations_skipped += len(missing_name)
+
+            df = df.loc[has_name].copy()
+            df['type'] = _allowed_or(_column(df, 'type'), _MITIGATION_TYPES, 'Dedicated')
+            df['status'] = _allowed_or(_column(df, 'status'), _MITIGATION_STATUSES, 'Proposed')
+            for col in ('description', 'owner', 'source_entity'):
+                df[col] = _text_column(df, col)
+
+            # Skip mitigations whose name already exists in the DB in one pass
+            exists = df['name'].isin(mitigation_name_to_id.keys())
+            result.mitigations_skipped += int(exists.sum())
+            if result.verbose:
+                for mit_name in df.loc[exists, 'name']:
+                    result.debug("Skipped (already exists): %s", mit_name)
+            df = df.loc[~exists]
+
+            created = skipped = 0
+            for idx, row in _iter_rows(df):
                 row_num = idx + 2
                 try:
-                    mit_name = row.get('name', 'Unknown')
-
-                    if pd.isna(row.get('name')):
-                        result.warnings.append(f"Mitigation Row {row_num}: Missing name, skipped")
-                        result.mitigations_skipped += 1
-                        continue
+                    mit_name = row['name']
 
-                    # Skip if mitigation with this name already exists in DB
-                    if mit_name in existing_mit_names:
-                        result.mitigations_skipped += 1
-                        result.log(f"Skipped (already exists): {mit_name}")
+                    # Same name earlier in this sheet
+                    if mit_name in mitigation_name_to_id:
+                        skipped += 1
+                        result.debug("Skipped (already exists): %s", mit_name)
                         continue
 
-                    mit_type = row.get('type', 'Dedicated')
-                    if pd.isna(mit_type) or mit_type not in MITIGATION_TYPES:
-                        mit_type = 'Dedicated'
-                    
-                    mit_status = row.get('status', 'Proposed')
-                    if pd.isna(mit_status) or mit_status not in MITIGATION_STATUSES:
-                        mit_status = 'Proposed'
-                    
-                    description = self._safe_string(row.get('description', ''))
-                    owner = self._safe_string(row.get('owner', ''))
-                    source_entity = self._safe_string(row.get('source_entity', ''))
-                    
-                    if self.create_mitigation(
+                    mitigation_id = self.create_mitigation(
                         name=mit_name,
-                        mitigation_type=mit_type,
-                        status=mit_status,
-                        description=description,
-                        owner=owner,
-                        source_entity=source_entity
-                    ):
-                        existing_mit_names.add(mit_name)
-                        result.mitigations_created += 1
-                        result.log(f"Created mitigation: {mit_name}")
+                        mitigation_type=row['type'],
+                        status=row['status'],
+                        description=row['description'],
+                        owner=row['owner'],
+                        source_entity=row['source_entity']
+                    )
+                    if mitigation_id:
+                        mitigation_name_to_id[mit_name] = mitigation_id
+                        created += 1
+                        result.debug("Created mitigation: %s", mit_name)
                     else:
-                        result.mitigations_skipped += 1
+                        skipped += 1
                 
                 except Exception as e:
-                    result.mitigations_skipped += 1
+                    skipped += 1
                     result.errors.append(f"Mitigation Row {row_num} - Error: {str(e)}")
+
+            result.mitigations_created += created
+            result.mitigations_skipped += skipped
         
-        except ValueError:
-            result.log("No 'Mitigations' sheet found", "WARNING")
         except Exception as e:
             result.log(f"Mitigations sheet error: {str(e)}", "WARNING")
     
     def _import_mitigates(
         self,
-        filepath: str,
+        xl: pd.ExcelFile,
         result: ImportResult,
         mitigation_name_to_id: Dict[str, str],
         risk_name_to_id: Dict[str, str]
     ):
         """Import mitigates relationships from Excel."""
-        import pandas as pd
         
         result.log("Processing Mitigates sheet...")
+        if 'Mitigates' not in xl.sheet_names:
+            result.log("No 'Mitigates' sheet found", "WARNING")
+            return
         try:
-            df = pd.read_excel(filepath, sheet_name='Mitigates')
+            df = _read_core_sheet(
+                xl, 'Mitigates', _MITIGATES_SHEET_COLUMNS, _MITIGATES_TEXT_COLUMNS
+            )
             result.log(f"Found {len(df)} mitigates relationships in Excel file")
 
             # Build existing (mitigation_id, risk_id) set for deduplication
@@ -529,74 +913,112 @@ class ExcelImporter:
             # Detect whether Excel has exported ID columns (same-DB re-import path)
             has_direct_ids = 'mitigation_id' in df.columns and 'risk_id' in df.columns
 
-            for idx, row in df.iterrows():
+            has_names = _column(df, 'mitigation_name').notna() & _column(df, 'risk_name').notna()
+            missing_names = df.index[~has_names]
+            result.warnings.extend(
+                f"Mitigates Row {idx + 2}: Missing names, skipped" for idx in missing_names
+            )
+            result.mitigates_skipped += len(missing_names)
+
+            df = df.loc[has_names].copy()
+            df['effectiveness'] = _allowed_or(
+                _column(df, 'effectiveness'), _MITIGATION_EFFECTIVENESS, 'Medium'
+            )
+            df['description'] = _text_column(df, 'description')
+
+            # Prefer exported IDs (same-DB re-import); fall back to name lookup
+            df['mitigation_id'] = _resolve_ids(
+                df['mitigation_name'], mitigation_name_to_id,
+                df['mitigation_id'] if has_direct_ids else None,
+            )
+            df['risk_id'] = _resolve_ids(
+                df['risk_name'], risk_name_to_id, df['risk_id'] if has_direct_ids else None
+            )
+            resolved = df['mitigation_id'].notna() & df['risk_id'].notna()
+            unresolved = df.index[~resolved]
+            result.warnings.extend(
+                f"Mitigates Row {idx + 2}: Entity not found, skipped" for idx in unresolved
+            )
+            result.mitigates_skipped += len(unresolved)
+            df = df.loc[resolved]
+
+            # Skip pairs already in the DB (app-layer guard) or repeated in the sheet
+            exists = _existing_pairs_mask(df, 'mitigation_id', 'risk_id', existing_mits)
+            result.mitigates_skipped += int(exists.sum())
+            if result.verbose:
+                for mitigation_name, risk_name in zip(
+                    df.loc[exists, 'mitigation_name'], df.loc[exists, 'risk_name']
+                ):
+                    result.debug("Skipped (already exists): %s → %s", mitigation_name, risk_name)
+            df = df.loc[~exists]
+
+            # Rows queued for a single bulk create (only used with create_mitigates_bulk)
+            pending: List[Dict[str, Any]] = []
+            pending_names: List[tuple] = []
+
+            created = skipped = 0
+            for idx, row in _iter_rows(df):
                 row_num = idx + 2
                 try:
-                    mitigation_name = row.get('mitigation_name')
-                    risk_name = row.get('risk_name')
-
-                    if pd.isna(mitigation_name) or pd.isna(risk_name):
-                        result.warnings.append(f"Mitigates Row {row_num}: Missing names, skipped")
-                        result.mitigates_skipped += 1
-                        continue
-
-                    # Prefer exported IDs (same-DB re-import); fall back to name lookup
-                    if has_direct_ids:
-                        raw_mid = row.get('mitigation_id')
-                        raw_rid = row.get('risk_id')
-                        mitigation_id = (str(raw_mid) if not pd.isna(raw_mid) and raw_mid else None) \
-                                        or mitigation_name_to_id.get(str(mitigation_name))
-                        risk_id = (str(raw_rid) if not pd.isna(raw_rid) and raw_rid else None) \
-                                  or risk_name_to_id.get(str(risk_name))
-                    else:
-                        mitigation_id = mitigation_name_to_id.get(str(mitigation_name))
-                        risk_id = risk_name_to_id.get(str(risk_name))
-
-                    if not mitigation_id or not risk_id:
-                        result.warnings.append(f"Mitigates Row {row_num}: Entity not found, skipped")
-                        result.mitigates_skipped += 1
-                        continue
-
-                    # Skip if mitigates relationship already exists (app-layer guard)
-                    if (mitigation_id, risk_id) in existing_mits:
-                        result.mitigates_skipped += 1
-                        result.log(f"Skipped (already exists): {mitigation_name} → {risk_name}")
-                        continue
-
-                    effectiveness = row.get('effectiveness', 'Medium')
-                    if pd.isna(effectiveness) or effectiveness not in MITIGATION_EFFECTIVENESS:
-                        effectiveness = 'Medium'
-
-                    description = self._safe_string(row.get('description', ''))
-
-                    if self.create_mitigates(
+                    mitigation_name = row['mitigation_name']
+                    risk_name = row['risk_name']
+                    mitigation_id = row['mitigation_id']
+                    risk_id = row['risk_id']
+
+                    if self.create_mitigates_bulk:
+                        pending.append({
+                            "mitigation_id": mitigation_id,
+                            "risk_id": risk_id,
+                            "effectiveness": row['effectiveness'],
+                            "description": row['description'],
+                        })
+                        pending_names.append((mitigation_name, risk_name))
+                    elif self.create_mitigates(
                         mitigation_id=mitigation_id,
                         risk_id=risk_id,
-                        effectiveness=effectiveness,
-                        description=description
+                        effectiveness=row['effectiveness'],
+                        description=row['description']
                     ):
-                        existing_mits.add((mitigation_id, risk_id))
-                        result.mitigates_created += 1
-                        result.log(f"Created mitigates: {mitigation_name} → {risk_name}")
+                        created += 1
+                        result.debug("Created mitigates: %s → %s", mitigation_name, risk_name)
                     else:
-                        existing_mits.add((mitigation_id, risk_id))  # DB-layer dedup fired
-                        result.mitigates_skipped += 1
-                        result.log(f"Skipped (already exists): {mitigation_name} → {risk_name}")
+                        skipped += 1  # DB-layer dedup fired
+                        result.debug("Skipped (already exists): %s → %s", mitigation_name, risk_name)
                 
                 except Exception as e:
-                    result.mitigates_skipped += 1
+                    skipped += 1
                     result.errors.append(f"Mitigates Row {row_num} - Error: {str(e)}")
+
+            if pending:
+                try:
+                    created_pairs = {
+                        (rel['mitigation_id'], rel['risk_id'])
+                        for rel in (self.create_mitigates_bulk(pending) or [])
+                    }
+                except Exception as e:
+                    skipped += len(pending)
+                    result.errors.append(f"Mitigates batch error: {str(e)}")
+                    pending = []
+                created_flags = [
+                    (rec['mitigation_id'], rec['risk_id']) in created_pairs for rec in pending
+                ]
+                created += sum(created_flags)
+                skipped += len(created_flags) - sum(created_flags)
+                if result.verbose:
+                    for was_created, (mitigation_name, risk_name) in zip(created_flags, pending_names):
+                        if was_created:
+                            result.debug("Created mitigates: %s → %s", mitigation_name, risk_name)
+                        else:
+                            result.debug("Skipped (already exists): %s → %s", mitigation_name, risk_name)
+
+            result.mitigates_created += created
+            result.mitigates_skipped += skipped
         
-        except ValueError:
-            result.log("No 'Mitigates' sheet found", "WARNING")
         except Exception as e:
             result.log(f"Mitigates sheet error: {str(e)}", "WARNING")
     
     def _parse_categories(self, value) -> List[str]:
         """Parse categories from various formats."""
-        import pandas as pd
-        import ast
-        
         if pd.isna(value):
             return []
         
@@ -604,45 +1026,16 @@ class ExcelImporter:
             return value
         
         if isinstance(value, str):
-            try:
-                parsed = ast.literal_eval(value)
-                if isinstance(parsed, list):
-                    return parsed
-            except:
-                pass
-            
-            # Try comma-separated
-            return [c.strip().strip("[]'\"") for c in value.split(',')]
+            return list(_parse_category_string(value))
         
         return []
     
-    def _safe_string(self, value, default: str = '') -> str:
-        """Safely convert value to string."""
-        import pandas as pd
-        if pd.isna(value):
-            return default
-        return str(value)
-    
-    def _safe_float(self, value, default: Optional[float] = None) -> Optional[float]:
-        """Safely convert value to float."""
-        import pandas as pd
-        if pd.isna(value):
-            return default
-        try:
-            return float(value)
-        except (ValueError, TypeError):
-            return default
-    
-    def _parse_date(self, value) -> Optional[str]:
-        """Parse date value to ISO string."""
-        import pandas as pd
-        if pd.isna(value):
-            return None
-        if hasattr(value, 'isoformat'):
-            return value.isoformat()
-        return str(value) if value else None
-
-    def _import_context_nodes(self, filepath: str, result: ImportResult) -> None:
+    def _import_context_nodes(
+        self,
+        xl: pd.ExcelFile,
+        result: ImportResult,
+        node_name_to_id: Optional[Dict[str, str]] = None,
+    ) -> Set[str]:
         """
         Import all ContextNode sheets (sheets prefixed with 'CN_') from an Excel file.
 
@@ -651,19 +1044,25 @@ class ExcelImporter:
           structured [SCHEMA] warning with a ready-to-paste YAML snippet is logged.
         - Extra columns not declared in the schema property list emit a one-time
           per-sheet [SCHEMA] warning pointing to the exact schema.yaml location.
+
+        Args:
+            xl: Open workbook
+            result: ImportResult to update
+            node_name_to_id: Optional map filled with the existing and created
+                nodes of every imported type (for context edge resolution)
+
+        Returns:
+            Type IDs whose existing nodes were read (and so are fully mapped)
         """
-        import pandas as pd
-        import openpyxl
 
-        result.log("Processing Context Node sheets (CN_*) ...")
+        if node_name_to_id is None:
+            node_name_to_id = {}
+        mapped_types: Set[str] = set()
 
-        try:
-            wb = openpyxl.load_workbook(filepath, read_only=True, data_only=True)
-        except Exception as e:
-            result.log(f"Could not open workbook for context nodes: {e}", "WARNING")
-            return
+        result.log("Processing Context Node sheets (CN_*) ...")
 
-        cn_sheets = [s for s in wb.sheetnames if s.startswith("CN_")]
+        with self._workbook_lock:
+            cn_sheets = [s for s in xl.sheet_names if s.startswith("CN_")]
         result.log(f"Found {len(cn_sheets)} context node sheet(s): {cn_sheets or 'none'}")
 
         for sheet_name in cn_sheets:
@@ -671,11 +1070,11 @@ class ExcelImporter:
 
             # --- Registry check ---
             entity_type = self.registry.get_entity_type(type_id) if self.registry else None
-            if entity_type is None or type_id in ("risk", "mitigation"):
+            if entity_type is None or type_id in _KERNEL_ENTITY_TYPES:
                 # Read column headers for the YAML scaffold
-                ws = wb[sheet_name]
-                col_headers = [cell.value for cell in next(ws.iter_rows(min_row=1, max_row=1))]
-                col_headers = [c for c in col_headers if c]
+                with self._workbook_lock:
+                    skipped_df = pd.read_excel(xl, sheet_name=sheet_name)
+                col_headers = [c for c in skipped_df.columns if not str(c).startswith("Unnamed:")]
                 props_yaml = "\n".join(
                     f"            - {{ name: \"{c}\", type: \"string\" }}" for c in col_headers
                 )
@@ -692,14 +1091,14 @@ class ExcelImporter:
                 )
                 result.warnings.append(warning)
                 result.log(f"[SCHEMA] Sheet '{sheet_name}' skipped (type unknown)", "WARNING")
-                # Count all rows (minus header) as skipped
-                row_count = sum(1 for _ in ws.iter_rows(min_row=2)) - 1
-                result.context_nodes_skipped += max(row_count, 0)
+                # Count all data rows as skipped
+                result.context_nodes_skipped += len(skipped_df)
                 continue
 
             # --- Load sheet with pandas for easy row iteration ---
             try:
-                df = pd.read_excel(filepath, sheet_name=sheet_name)
+                with self._workbook_lock:
+                    df = pd.read_excel(xl, sheet_name=sheet_name)
             except Exception as e:
                 result.log(f"Sheet '{sheet_name}': could not read — {e}", "WARNING")
                 continue
@@ -729,26 +1128,34 @@ class ExcelImporter:
                     name = entity.get('name', '')
                     if name:
                         existing_cn_names.add(name)
+                    _register_node_id(node_name_to_id, type_id, entity)
+                mapped_types.add(type_id)
 
             # --- Import rows ---
             result.log(f"Importing '{sheet_name}' ({len(df)} rows) ...")
-            for idx, row in df.iterrows():
+            has_name_col = "name" in df.columns
+            if has_name_col:
+                has_name = df["name"].notna()
+                missing_name = df.index[~has_name]
+                result.warnings.extend(
+                    f"[{sheet_name}] Row {idx + 2}: missing 'name', skipped" for idx in missing_name
+                )
+                result.context_nodes_skipped += len(missing_name)
+                df = df.loc[has_name]
+
+            for idx, row in _iter_rows(df):
                 row_num = idx + 2
                 try:
                     # Build data dict using only schema-declared properties (+ name)
                     data: Dict[str, Any] = {}
-                    if "name" in df.columns and not pd.isna(row.get("name")):
+                    if has_name_col:
                         data["name"] = str(row["name"])
-                    elif "name" in df.columns:
-                        result.warnings.append(f"[{sheet_name}] Row {row_num}: missing 'name', skipped")
-                        result.context_nodes_skipped += 1
-                        continue
 
                     # Skip if context node with this name/type already exists
                     node_name = data.get("name", "")
                     if node_name and node_name in existing_cn_names:
                         result.context_nodes_skipped += 1
-                        result.log(f"Skipped (already exists): {type_id} '{node_name}'")
+                        result.debug("Skipped (already exists): %s '%s'", type_id, node_name)
                         continue
 
                     for prop in entity_type.attributes:
@@ -760,8 +1167,10 @@ class ExcelImporter:
                     created = self.create_generic_entity(type_id, data)
                     if created:
                         existing_cn_names.add(node_name)
+                        if isinstance(created, dict):
+                            _register_node_id(node_name_to_id, type_id, {**data, **created})
                         result.context_nodes_created += 1
-                        result.log(f"Created {type_id}: {data.get('name', '?')}")
+                        result.debug("Created %s: %s", type_id, data.get('name', '?'))
                     else:
                         result.context_nodes_skipped += 1
 
@@ -769,11 +1178,11 @@ class ExcelImporter:
                     result.context_nodes_skipped += 1
                     result.errors.append(f"[{sheet_name}] Row {row_num}: {str(e)}")
 
-        wb.close()
+        return mapped_types
 
     def _import_context_edges(
         self,
-        filepath: str,
+        xl: pd.ExcelFile,
         result: ImportResult,
         node_name_to_id: Dict[str, str],
     ) -> None:
@@ -787,31 +1196,23 @@ class ExcelImporter:
           per-sheet [SCHEMA] warning.
         - Rows with unresolvable source_name / target_name are skipped with a warning.
         """
-        import pandas as pd
-        import openpyxl
 
         result.log("Processing Context Edge sheets (CE_*) ...")
 
-        try:
-            wb = openpyxl.load_workbook(filepath, read_only=True, data_only=True)
-        except Exception as e:
-            result.log(f"Could not open workbook for context edges: {e}", "WARNING")
-            return
-
-        ce_sheets = [s for s in wb.sheetnames if s.startswith("CE_")]
+        ce_sheets = [s for s in xl.sheet_names if s.startswith("CE_")]
         result.log(f"Found {len(ce_sheets)} context edge sheet(s): {ce_sheets or 'none'}")
 
-        kernel_rel_ids = {"influences", "mitigates"}
-
         for sheet_name in ce_sheets:
             rel_type_id = sheet_name[3:]  # strip "CE_"
 
             # --- Registry check ---
             rel_type = self.registry.get_relationship_type(rel_type_id) if self.registry else None
-            if rel_type is None or rel_type_id in kernel_rel_ids:
-                ws = wb[sheet_name]
-                col_headers = [cell.value for cell in next(ws.iter_rows(min_row=1, max_row=1))]
-                col_headers = [c for c in col_headers if c and c not in ("source_name", "target_name")]
+            if rel_type is None or rel_type_id in _KERNEL_REL_TYPES:
+                skipped_df = pd.read_excel(xl, sheet_name=sheet_name)
+                col_headers = [
+                    c for c in skipped_df.columns
+                    if not str(c).startswith("Unnamed:") and c not in _EDGE_ENDPOINT_COLUMNS
+                ]
                 props_yaml = "\n".join(
                     f"            - {{ name: \"{c}\", type: \"string\" }}" for c in col_headers
                 ) if col_headers else "            []"
@@ -828,20 +1229,19 @@ class ExcelImporter:
                 )
                 result.warnings.append(warning)
                 result.log(f"[SCHEMA] Sheet '{sheet_name}' skipped (rel type unknown)", "WARNING")
-                row_count = sum(1 for _ in ws.iter_rows(min_row=2)) - 1
-                result.context_edges_skipped += max(row_count, 0)
+                result.context_edges_skipped += len(skipped_df)
                 continue
 
             # --- Load sheet ---
             try:
-                df = pd.read_excel(filepath, sheet_name=sheet_name)
+                df = pd.read_excel(xl, sheet_name=sheet_name)
             except Exception as e:
                 result.log(f"Sheet '{sheet_name}': could not read — {e}", "WARNING")
                 continue
 
             # --- Column mismatch check ---
             schema_prop_names = {p.name for p in rel_type.attributes}
-            reserved = {"source_name", "target_name"} | EXPORT_RESERVED_COLUMNS
+            reserved = _EDGE_ENDPOINT_COLUMNS | EXPORT_RESERVED_COLUMNS
             sheet_cols = set(df.columns.tolist())
             unknown_cols = sheet_cols - schema_prop_names - reserved
             if unknown_cols:
@@ -860,28 +1260,38 @@ class ExcelImporter:
 
             # --- Import rows ---
             result.log(f"Importing '{sheet_name}' ({len(df)} rows) ...")
-            for idx, row in df.iterrows():
+            has_names = _column(df, "source_name").notna() & _column(df, "target_name").notna()
+            missing_names = df.index[~has_names]
+            result.warnings.extend(
+                f"[{sheet_name}] Row {idx + 2}: missing source_name or target_name, skipped"
+                for idx in missing_names
+            )
+            result.context_edges_skipped += len(missing_names)
+            df = df.loc[has_names].copy()
+
+            df["_source_id"] = _resolve_ids(df["source_name"], node_name_to_id)
+            df["_target_id"] = _resolve_ids(df["target_name"], node_name_to_id)
+            resolved = df["_source_id"].notna() & df["_target_id"].notna()
+            unresolved = df.loc[~resolved]
+            result.warnings.extend(
+                f"[{sheet_name}] Row {idx + 2}: source '{source_name}' not found in graph, skipped"
+                if no_source else
+                f"[{sheet_name}] Row {idx + 2}: target '{target_name}' not found in graph, skipped"
+                for idx, source_name, target_name, no_source in zip(
+                    unresolved.index, unresolved["source_name"], unresolved["target_name"],
+                    unresolved["_source_id"].isna(),
+                )
+            )
+            result.context_edges_skipped += int((~resolved).sum())
+            df = df.loc[resolved]
+
+            for idx, row in _iter_rows(df):
                 row_num = idx + 2
                 try:
-                    source_name = row.get("source_name")
-                    target_name = row.get("target_name")
-
-                    if pd.isna(source_name) or pd.isna(target_name):
-                        result.warnings.append(f"[{sheet_name}] Row {row_num}: missing source_name or target_name, skipped")
-                        result.context_edges_skipped += 1
-                        continue
-
-                    source_id = node_name_to_id.get(str(source_name))
-                    target_id = node_name_to_id.get(str(target_name))
-
-                    if not source_id:
-                        result.warnings.append(f"[{sheet_name}] Row {row_num}: source '{source_name}' not found in graph, skipped")
-                        result.context_edges_skipped += 1
-                        continue
-                    if not target_id:
-                        result.warnings.append(f"[{sheet_name}] Row {row_num}: target '{target_name}' not found in graph, skipped")
-                        result.context_edges_skipped += 1
-                        continue
+                    source_name = row["source_name"]
+                    target_name = row["target_name"]
+                    source_id = row["_source_id"]
+                    target_id = row["_target_id"]
 
                     # Build property data dict (schema-declared props only)
                     data: Dict[str, Any] = {}
@@ -896,7 +1306,7 @@ class ExcelImporter:
                     )
                     if created:
                         result.context_edges_created += 1
-                        result.log(f"Created {rel_type_id}: {source_name} → {target_name}")
+                        result.debug("Created %s: %s → %s", rel_type_id, source_name, target_name)
                     else:
                         result.context_edges_skipped += 1
 
@@ -904,5 +1314,3 @@ class ExcelImporter:
                     result.context_edges_skipped += 1
                     result.errors.append(f"[{sheet_name}] Row {row_num}: {str(e)}")
 
-        wb.close()
-
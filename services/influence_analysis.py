@@ -9,8 +9,14 @@ Provides comprehensive influence network analysis including:
 - Risk Clusters (tightly interconnected groups)
 """
 
+import heapq
+from collections import Counter, deque
+from functools import cached_property, wraps
 from typing import List, Dict, Any, Set, Tuple, Optional
 from dataclasses import dataclass, field
+
+import numpy as np
+
 from config.settings import (
     STRENGTH_VALUES, IMPACT_VALUES,
     PROPAGATION_DECAY, MAX_INFLUENCE_DEPTH, CONVERGENCE_MULTIPLIER_FACTOR
@@ -72,12 +78,174 @@ class RiskCluster:
     levels: Dict[str, int]
 
 
+# Edge type codes stored in the CSR ``*_etype`` arrays
+EDGE_INFLUENCES = 0
+EDGE_TYPE_NAMES = ("INFLUENCES",)
+
+# Risk level codes stored in ``level_code``; levels the analysis doesn't
+# single out are LEVEL_OTHER, and nodes that aren't risks LEVEL_NONE
+LEVEL_NONE, LEVEL_OTHER, LEVEL_BUSINESS, LEVEL_STRATEGIC, LEVEL_OPERATIONAL = range(5)
+_LEVEL_CODES = {
+    "Business": LEVEL_BUSINESS,
+    "Strategic": LEVEL_STRATEGIC,
+    "Operational": LEVEL_OPERATIONAL,
+}
+
+# Longest path (in nodes, endpoints included) counted by get_bottlenecks
+MAX_BOTTLENECK_PATH = 6
+
+
+def _csr(keys: np.ndarray, values: np.ndarray, scores: np.ndarray, n: int):
+    """
+    Group edges by ``keys`` into CSR arrays, keeping input order per key.
+
+    Returns:
+        Tuple of (indptr, neighbors, scores, order) where ``order`` maps CSR
+        positions back to input edge positions
+    """
+    order = np.argsort(keys, kind="stable")
+    indptr = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(np.bincount(keys, minlength=n), out=indptr[1:])
+    return indptr, values[order].astype(np.int32), scores[order], order
+
+
+# Below this many risks the Python BFS wins over Numba's compile/dispatch cost
+NUMBA_MIN_RISKS = 200
+
+_bfs_kernel = None
+
+
+def _get_bfs_kernel():
+    """
+    Compile (once) and return the Numba per-risk BFS kernel, or None.
+
+    ``kernel(indptr, nbr, edge_score, node_weight, n_risks, max_depth,
+    decay, risks_only, n_chunks)`` runs one decayed BFS from every risk, the
+    sources split into ``n_chunks`` parallel strides, and returns
+    ``(scores, reached)`` arrays. Each visited risk other than
+    the source adds ``node_weight * cumulative_strength * decay[depth]``;
+    with ``risks_only`` the walk never leaves the risk nodes.
+    """
+    global _bfs_kernel
+    if _bfs_kernel is not None:
+        return _bfs_kernel
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return None
+
+    @njit(parallel=True, cache=True)
+    def kernel(indptr, nbr, edge_score, node_weight, n_risks, max_depth, decay,
+               risks_only, n_chunks):
+        n_nodes = indptr.size - 1
+        scores = np.zeros(n_risks, dtype=np.float64)
+        reached = np.zeros(n_risks, dtype=np.int64)
+
+        for chunk in prange(n_chunks):
+            # One set of BFS buffers per chunk, reused across its sources. A node
+            # is visited when its stamp equals the current source, so nothing
+            # needs clearing between sources. Each node is expanded at most
+            # once per BFS, so E + 1 queue slots suffice.
+            visited = np.full(n_nodes, -1, dtype=np.int32)
+            queue_node = np.empty(nbr.size + 1, dtype=np.int32)
+            queue_strength = np.empty(nbr.size + 1, dtype=np.float64)
+            queue_depth = np.empty(nbr.size + 1, dtype=np.int32)
+            for source in range(chunk, n_risks, n_chunks):
+                # Same operations in the same order as the Python BFS, so scores match exactly
+                queue_node[0] = source
+                queue_strength[0] = 1.0
+                queue_depth[0] = 0
+                head = 0
+                tail = 1
+                score = 0.0
+                count = 0
+                while head < tail:
+                    current = queue_node[head]
+                    cum_strength = queue_strength[head]
+                    depth = queue_depth[head]
+                    head += 1
+                    if visited[current] == source:
+                        continue
+                    visited[current] = source
+                    if current != source and current < n_risks:
+                        count += 1
+                        score += node_weight[current] * cum_strength * decay[depth]
+                    if depth < max_depth:
+                        for k in range(indptr[current], indptr[current + 1]):
+                            target = nbr[k]
+                            if risks_only and target >= n_risks:
+                                continue
+                            if visited[target] != source:
+                                queue_node[tail] = target
+                                queue_strength[tail] = cum_strength * (edge_score[k] / 4)
+                                queue_depth[tail] = depth + 1
+                                tail += 1
+                scores[source] = score
+                reached[source] = count
+        return scores, reached
+
+    _bfs_kernel = kernel
+    return kernel
+
+
+def _bfs_chunks(n_sources: int) -> int:
+    """Number of parallel source strides for the BFS kernel (one per Numba thread)."""
+    from numba import get_num_threads
+
+    return max(1, min(get_num_threads(), n_sources))
+
+
+def _top_rounded(limit: int, items: list, key, digits: int) -> list:
+    """
+    ``heapq.nlargest(limit, items, key=round(key(item), digits))`` that only
+    rounds the items near the cut.
+
+    Rounding is monotonic, so everything that can tie with or beat the
+    ``limit``-th best rounded key has a raw key above that key minus one
+    rounding step; only those candidates are rounded and ranked. Ties keep
+    input order, as with a stable sort.
+    """
+    top = heapq.nlargest(limit, items, key=key)
+    if not top:
+        return top
+    if len(top) == limit:
+        floor = round(key(top[-1]), digits) - 10 ** -digits
+        items = [item for item in items if key(item) > floor]
+    return heapq.nlargest(limit, items, key=lambda item: round(key(item), digits))
+
+
+def _memoize_limit(method):
+    """
+    Cache a ``get_*(limit)`` analysis on the analyzer, keyed on ``(name, limit)``.
+
+    The graph is fixed once the analyzer is built, so repeated calls (e.g.
+    analyze() followed by get_high_priority_ids()) reuse the first result.
+    Callers get a fresh list each time.
+    """
+    @wraps(method)
+    def wrapper(self, limit: int = 5):
+        key = (method.__name__, limit)
+        if key not in self._cache:
+            self._cache[key] = method(self, limit)
+        return list(self._cache[key])
+    return wrapper
+
+
 class InfluenceAnalyzer:
     """
     Analyzes influence relationships in the risk network.
     
     This class performs graph analysis on the risk influence network
     to identify key structural properties and high-impact risks.
+
+    Nodes are numbered densely: risks first (``0 .. n_risks - 1``, in input
+    order), then any other ids that only appear on influence edges. The
+    graph is stored as CSR arrays (``out_indptr``/``out_nbr``/``out_score``/
+    ``out_etype`` and the ``in_*`` mirror) so traversals walk contiguous
+    slices instead of per-node lists of tuples.
+
+    The ``risks`` and ``influences`` inputs are treated as read-only and
+    shared, not copied.
     """
     
     def __init__(
@@ -95,33 +263,120 @@ class InfluenceAnalyzer:
         self.risks = risks
         self.influences = influences
         
-        # Build indexed dictionaries
-        self.risk_dict = {r["id"]: dict(r) for r in risks}
+        # Index the inputs by id; they are only read, never copied or mutated
+        self.risk_dict = {r["id"]: r for r in risks}
+
+        # Dense integer ids (risks first, see class docstring)
+        self.node_ids: List[str] = list(self.risk_dict)
+        self.id_of: Dict[str, int] = {node_id: i for i, node_id in enumerate(self.node_ids)}
+        self.n_risks = len(self.node_ids)
         
         # Build adjacency structures
-        self.outgoing: Dict[str, List[Tuple[str, float, str]]] = {}
-        self.incoming: Dict[str, List[Tuple[str, float, str]]] = {}
         self._build_adjacency()
+
+        # Per-node level codes, so traversals compare bytes instead of
+        # looking up each visited risk's level string
+        self.level_code = np.zeros(len(self.node_ids), dtype=np.uint8)
+        self.level_code[:self.n_risks] = [
+            _LEVEL_CODES.get(r["level"], LEVEL_OTHER) for r in self.risk_dict.values()
+        ]
+
+        # PROPAGATION_DECAY ** depth for every reachable depth, computed with
+        # Python's pow so the BFS fallbacks and the Numba kernel match exactly
+        self._decay_table = np.array(
+            [PROPAGATION_DECAY ** d for d in range(MAX_INFLUENCE_DEPTH + 1)], dtype=np.float64
+        )
+
+        # get_* results by (method name, limit), see _memoize_limit
+        self._cache: Dict[Tuple[str, int], Any] = {}
+
+    def _node_index(self, node_id: str) -> int:
+        """Dense index of ``node_id``, assigning the next one if it's new."""
+        index = self.id_of.get(node_id)
+        if index is None:
+            index = self.id_of[node_id] = len(self.node_ids)
+            self.node_ids.append(node_id)
+        return index
     
     def _build_adjacency(self):
-        """Build outgoing and incoming adjacency lists."""
-        # Process influence edges
+        """Build outgoing and incoming CSR adjacency arrays."""
+        # Strength labels are coded per edge and scored through a lookup
+        # table; the last slot holds the default for unknown labels
+        strength_code = {label: i for i, label in enumerate(STRENGTH_VALUES)}
+        unknown_strength = len(strength_code)
+        strength_lut = np.array([*STRENGTH_VALUES.values(), 2], dtype=np.float64)
+
+        sources: List[int] = []
+        targets: List[int] = []
+        strengths: List[int] = []
+        confidences: List[float] = []
         for inf in self.influences:
-            source = inf["source_id"]
-            target = inf["target_id"]
-            strength = STRENGTH_VALUES.get(inf.get("strength", "Moderate"), 2)
-            confidence = inf.get("confidence", 0.8) or 0.8
-            score = strength * confidence
-            
-            if source not in self.outgoing:
-                self.outgoing[source] = []
-            self.outgoing[source].append((target, score, "INFLUENCES"))
-            
-            if target not in self.incoming:
-                self.incoming[target] = []
-            self.incoming[target].append((source, score, "INFLUENCES"))
-        
-        pass
+            sources.append(self._node_index(inf["source_id"]))
+            targets.append(self._node_index(inf["target_id"]))
+            strengths.append(strength_code.get(inf.get("strength", "Moderate"), unknown_strength))
+            confidences.append(inf.get("confidence") or 0.8)
+
+        n = len(self.node_ids)
+        source_arr = np.array(sources, dtype=np.int64)
+        target_arr = np.array(targets, dtype=np.int64)
+        # float64 keeps scores identical to the former per-edge Python floats
+        score_arr = strength_lut[np.array(strengths, dtype=np.intp)] * np.array(
+            confidences, dtype=np.float64
+        )
+        etype_arr = np.full(len(sources), EDGE_INFLUENCES, dtype=np.uint8)
+
+        self.out_indptr, self.out_nbr, self.out_score, order = _csr(
+            source_arr, target_arr, score_arr, n
+        )
+        self.out_etype = etype_arr[order]
+        self.in_indptr, self.in_nbr, self.in_score, order = _csr(
+            target_arr, source_arr, score_arr, n
+        )
+        self.in_etype = etype_arr[order]
+
+    def _adjacency_dict(self, indptr, nbr, score, etype) -> Dict[str, List[Tuple[str, float, str]]]:
+        """Expand CSR arrays into ``{node_id: [(other_id, score, edge_type), ...]}``."""
+        node_ids = self.node_ids
+        nbr, score, etype = nbr.tolist(), score.tolist(), etype.tolist()
+        return {
+            node_ids[u]: [
+                (node_ids[nbr[k]], score[k], EDGE_TYPE_NAMES[etype[k]])
+                for k in range(indptr[u], indptr[u + 1])
+            ]
+            for u in range(len(node_ids))
+            if indptr[u + 1] > indptr[u]
+        }
+
+    @cached_property
+    def outgoing(self) -> Dict[str, List[Tuple[str, float, str]]]:
+        """Outgoing edges per node id (built from the CSR arrays on first use)."""
+        return self._adjacency_dict(self.out_indptr, self.out_nbr, self.out_score, self.out_etype)
+
+    @cached_property
+    def incoming(self) -> Dict[str, List[Tuple[str, float, str]]]:
+        """Incoming edges per node id (built from the CSR arrays on first use)."""
+        return self._adjacency_dict(self.in_indptr, self.in_nbr, self.in_score, self.in_etype)
+
+    @cached_property
+    def _reaches_business(self) -> List[bool]:
+        """
+        Per node, whether any influence path leads from it to a Business risk.
+
+        One reverse BFS from all Business risks; path searches skip nodes
+        outside it since they can never end on a Business risk.
+        """
+        indptr = self.in_indptr.tolist()
+        nbr = self.in_nbr.tolist()
+        reaches = (self.level_code == LEVEL_BUSINESS).tolist()
+        queue = deque(node for node, flag in enumerate(reaches) if flag)
+        while queue:
+            current = queue.popleft()
+            for k in range(indptr[current], indptr[current + 1]):
+                upstream = nbr[k]
+                if not reaches[upstream]:
+                    reaches[upstream] = True
+                    queue.append(upstream)
+        return reaches
     
     def analyze(self) -> Dict[str, Any]:
         """
@@ -138,6 +393,7 @@ class InfluenceAnalyzer:
             "risk_clusters": self.get_risk_clusters()
         }
     
+    @_memoize_limit
     def get_top_propagators(self, limit: int = 5) -> List[Dict[str, Any]]:
         """
         Calculate top propagators - risks with highest downstream impact.
@@ -151,53 +407,99 @@ class InfluenceAnalyzer:
         Returns:
             List of top propagator dictionaries
         """
-        propagation_scores = {}
-        
-        for risk_id, risk_data in self.risk_dict.items():
+        scores, reached = self._propagation_scores()
+        
+        # Rank on the displayed (rounded) scores, building only the returned entries
+        top = _top_rounded(limit, range(self.n_risks), scores.__getitem__, 1)
+        propagators = []
+        for source in top:
+            risk_id = self.node_ids[source]
+            risk_data = self.risk_dict[risk_id]
+            propagators.append({
+                "id": risk_id,
+                "name": risk_data["name"],
+                "level": risk_data["level"],
+                "score": round(scores[source], 1),
+                "risks_reached": reached[source]
+            })
+        return propagators
+
+    def _propagation_scores(self, use_numba: Optional[bool] = None) -> Tuple[List[float], List[int]]:
+        """
+        Downstream propagation score and number of risks reached, per risk.
+
+        Args:
+            use_numba: Force (True) or skip (False) the Numba kernel; by default
+                it is used from NUMBA_MIN_RISKS risks on, when numba is installed
+
+        Returns:
+            Tuple of (scores, risks_reached) lists indexed like ``node_ids``
+        """
+        if use_numba is None:
+            use_numba = self.n_risks >= NUMBA_MIN_RISKS
+        kernel = _get_bfs_kernel() if use_numba else None
+        node_value = self._level_weights({LEVEL_STRATEGIC: 5.0}, 2.0)
+        if kernel is None:
+            return self._propagation_scores_python(node_value.tolist())
+
+        scores, reached = kernel(
+            self.out_indptr, self.out_nbr, self.out_score, node_value, self.n_risks,
+            MAX_INFLUENCE_DEPTH, self._decay_table, False, _bfs_chunks(self.n_risks),
+        )
+        return scores.tolist(), reached.tolist()
+
+    def _level_weights(self, weights: Dict[int, float], default: float) -> np.ndarray:
+        """Per-node weight array: ``weights`` by level code, ``default`` for other risks, 0 for non-risks."""
+        table = np.full(LEVEL_OPERATIONAL + 1, default, dtype=np.float64)
+        table[LEVEL_NONE] = 0.0
+        for code, weight in weights.items():
+            table[code] = weight
+        return table[self.level_code]
+
+    def _propagation_scores_python(self, node_value: List[float]) -> Tuple[List[float], List[int]]:
+        """Pure-Python BFS behind _propagation_scores()."""
+        scores: List[float] = []
+        reached: List[int] = []
+        indptr = self.out_indptr.tolist()
+        nbr = self.out_nbr.tolist()
+        edge_scores = self.out_score.tolist()
+        decay_table = self._decay_table.tolist()
+        n_risks = self.n_risks
+        # Visit stamps shared by every BFS: visited[v] == source marks v as
+        # seen from the current source, so the buffer is never cleared
+        visited = [-1] * len(self.node_ids)
+        
+        for source in range(n_risks):
             score = 0
-            risks_reached: Set[str] = set()
+            risks_reached = 0
             
             # BFS with score accumulation
-            visited: Set[str] = set()
-            queue = [(risk_id, 1.0, 0, [risk_id])]  # (node, cumulative_strength, depth, path)
+            queue = deque([(source, 1.0, 0)])  # (node, cumulative_strength, depth)
             
             while queue:
-                current, cum_strength, depth, path = queue.pop(0)
+                current, cum_strength, depth = queue.popleft()
                 
-                if current in visited:
+                if visited[current] == source:
                     continue
-                visited.add(current)
+                visited[current] = source
                 
-                if current != risk_id:
-                    decay = PROPAGATION_DECAY ** depth
-                    
-                    if current in self.risk_dict:
-                        risks_reached.add(current)
-                        node_value = 5 if self.risk_dict[current]["level"] == "Strategic" else 2
-                        score += node_value * cum_strength * decay
+                if current != source and current < n_risks:
+                    risks_reached += 1
+                    score += node_value[current] * cum_strength * decay_table[depth]
                 
                 # Continue traversal
-                if current in self.outgoing and depth < MAX_INFLUENCE_DEPTH:
-                    for target, edge_score, edge_type in self.outgoing[current]:
-                        if target not in visited:
-                            new_strength = cum_strength * (edge_score / 4)  # Normalize
-                            queue.append((target, new_strength, depth + 1, path + [target]))
+                if depth < MAX_INFLUENCE_DEPTH:
+                    for k in range(indptr[current], indptr[current + 1]):
+                        target = nbr[k]
+                        if visited[target] != source:
+                            new_strength = cum_strength * (edge_scores[k] / 4)  # Normalize
+                            queue.append((target, new_strength, depth + 1))
             
-            propagation_scores[risk_id] = {
-                "id": risk_id,
-                "name": risk_data["name"],
-                "level": risk_data["level"],
-                "score": round(score, 1),
-                "risks_reached": len(risks_reached)
-            }
-        
-        # Sort and return top propagators
-        sorted_propagators = sorted(
-            propagation_scores.values(),
-            key=lambda x: -x["score"]
-        )
-        return sorted_propagators[:limit]
+            scores.append(score)
+            reached.append(risks_reached)
+        return scores, reached
     
+    @_memoize_limit
     def get_convergence_points(self, limit: int = 5) -> List[Dict[str, Any]]:
         """
         Calculate convergence points - nodes where multiple influences converge.
@@ -210,69 +512,115 @@ class InfluenceAnalyzer:
         Returns:
             List of convergence point dictionaries
         """
-        convergence_scores = {}
-        
-        # Analyze risks as potential convergence points
-        convergence_candidates = list(self.risk_dict.keys())
-        
-        for node_id in convergence_candidates:
-            if node_id not in self.incoming:
-                continue
-            
-            score = 0
-            unique_sources: Set[str] = set()
-            path_count = 0
-            
-            # BFS upstream
-            visited: Set[str] = set()
-            queue = [(node_id, 1.0, 0)]  # (node, cumulative_strength, depth)
-            
-            while queue:
-                current, cum_strength, depth = queue.pop(0)
-                
-                if current in visited:
-                    continue
-                visited.add(current)
-                
-                if current != node_id and current in self.risk_dict:
-                    unique_sources.add(current)
-                    source_weight = 1.0 if self.risk_dict[current]["level"] == "Operational" else 0.7
-                    decay = PROPAGATION_DECAY ** depth
-                    score += cum_strength * source_weight * decay
-                    path_count += 1
-                
-                # Continue upstream
-                if current in self.incoming and depth < MAX_INFLUENCE_DEPTH:
-                    for source, edge_score, edge_type in self.incoming[current]:
-                        if source not in visited and source in self.risk_dict:
-                            new_strength = cum_strength * (edge_score / 4)
-                            queue.append((source, new_strength, depth + 1))
+        scores, source_counts = self._convergence_scores()
+        # Only risks with incoming influences can be convergence points
+        has_incoming = np.flatnonzero(np.diff(self.in_indptr[:self.n_risks + 1]))
+        convergence_scores: Dict[int, float] = {}
+        
+        for node in has_incoming.tolist():
+            score = scores[node]
+            unique_sources = source_counts[node]
+            # Every upstream risk is reached once, so each one counts one path
+            path_count = unique_sources
             
             # Convergence bonus for multiple paths
-            if len(unique_sources) > 0:
-                convergence_multiplier = 1 + (path_count / len(unique_sources)) * CONVERGENCE_MULTIPLIER_FACTOR
+            if unique_sources > 0:
+                convergence_multiplier = 1 + (path_count / unique_sources) * CONVERGENCE_MULTIPLIER_FACTOR
                 score *= convergence_multiplier
             
-            node_data = self.risk_dict.get(node_id, {})
+            # Keep only scores that don't round to 0.0 (round(score, 1) > 0)
+            if score >= 0.05:
+                convergence_scores[node] = score
+        
+        # Rank on the displayed (rounded) scores, building only the returned entries
+        top = _top_rounded(limit, list(convergence_scores), convergence_scores.__getitem__, 1)
+        convergence_points = []
+        for node in top:
+            unique_sources = source_counts[node]
+            path_count = unique_sources
+            node_id = self.node_ids[node]
+            node_data = self.risk_dict[node_id]
             
-            convergence_scores[node_id] = {
+            convergence_points.append({
                 "id": node_id,
                 "name": node_data.get("name", ""),
                 "level": node_data.get("level", ""),
                 "node_type": "Risk",
-                "score": round(score, 1),
-                "source_count": len(unique_sources),
+                "score": round(convergence_scores[node], 1),
+                "source_count": unique_sources,
                 "path_count": path_count,
-                "is_high_convergence": path_count > len(unique_sources) * 1.5 if unique_sources else False
-            }
-        
-        # Sort and return top convergence points
-        sorted_convergence = sorted(
-            [c for c in convergence_scores.values() if c["score"] > 0],
-            key=lambda x: -x["score"]
+                "is_high_convergence": path_count > unique_sources * 1.5 if unique_sources else False
+            })
+        return convergence_points
+
+    def _convergence_scores(self, use_numba: Optional[bool] = None) -> Tuple[List[float], List[int]]:
+        """
+        Upstream convergence score (before the multiplier) and number of
+        upstream risks, per risk.
+
+        Args:
+            use_numba: Force (True) or skip (False) the Numba kernel; by default
+                it is used from NUMBA_MIN_RISKS risks on, when numba is installed
+
+        Returns:
+            Tuple of (scores, source_counts) lists indexed like ``node_ids``
+        """
+        if use_numba is None:
+            use_numba = self.n_risks >= NUMBA_MIN_RISKS
+        kernel = _get_bfs_kernel() if use_numba else None
+        source_weight = self._level_weights({LEVEL_OPERATIONAL: 1.0}, 0.7)
+        if kernel is None:
+            return self._convergence_scores_python(source_weight.tolist())
+
+        scores, counts = kernel(
+            self.in_indptr, self.in_nbr, self.in_score, source_weight, self.n_risks,
+            MAX_INFLUENCE_DEPTH, self._decay_table, True, _bfs_chunks(self.n_risks),
         )
-        return sorted_convergence[:limit]
+        return scores.tolist(), counts.tolist()
+
+    def _convergence_scores_python(self, source_weight: List[float]) -> Tuple[List[float], List[int]]:
+        """Pure-Python upstream BFS behind _convergence_scores()."""
+        scores: List[float] = []
+        counts: List[int] = []
+        indptr = self.in_indptr.tolist()
+        nbr = self.in_nbr.tolist()
+        edge_scores = self.in_score.tolist()
+        decay_table = self._decay_table.tolist()
+        n_risks = self.n_risks
+        # Visit stamps shared by every BFS (see _propagation_scores_python)
+        visited = [-1] * len(self.node_ids)
+
+        for node in range(n_risks):
+            score = 0
+            unique_sources = 0
+
+            # BFS upstream
+            queue = deque([(node, 1.0, 0)])  # (node, cumulative_strength, depth)
+
+            while queue:
+                current, cum_strength, depth = queue.popleft()
+
+                if visited[current] == node:
+                    continue
+                visited[current] = node
+
+                if current != node and current < n_risks:
+                    unique_sources += 1
+                    score += cum_strength * source_weight[current] * decay_table[depth]
+
+                # Continue upstream
+                if depth < MAX_INFLUENCE_DEPTH:
+                    for k in range(indptr[current], indptr[current + 1]):
+                        upstream = nbr[k]
+                        if upstream < n_risks and visited[upstream] != node:
+                            new_strength = cum_strength * (edge_scores[k] / 4)
+                            queue.append((upstream, new_strength, depth + 1))
+
+            scores.append(score)
+            counts.append(unique_sources)
+        return scores, counts
     
+    @_memoize_limit
     def get_critical_paths(self, limit: int = 5) -> List[Dict[str, Any]]:
         """
         Find strongest paths from operational risks to TPOs.
@@ -283,63 +631,214 @@ class InfluenceAnalyzer:
         Returns:
             List of critical path dictionaries
         """
-        critical_paths = []
+        indptr = self.out_indptr.tolist()
+        nbr = self.out_nbr.tolist()
+        edge_scores = self.out_score.tolist()
+        n_risks = self.n_risks
+        level_code = self.level_code.tolist()
+        reaches_business = self._reaches_business
+        # Visit stamps shared by every BFS (see _propagation_scores_python)
+        visited = [-1] * len(self.node_ids)
+
+        # Paths reaching a Business risk: (strength, queue entry, entry arrays)
+        hits: List[Tuple[float, int, Tuple[List[int], List[int], List[int]]]] = []
         
-        for risk_id, risk_data in self.risk_dict.items():
-            if risk_data["level"] != "Operational":
+        for source in range(n_risks):
+            if level_code[source] != LEVEL_OPERATIONAL or not reaches_business[source]:
                 continue
             
-            # Find paths to TPOs
-            visited: Set[str] = set()
-            queue = [(
-                risk_id,
-                1.0,
-                [{"id": risk_id, "name": risk_data["name"], "type": "Operational"}],
-                []
-            )]
+            # BFS over queue entries. Paths are never copied: each entry keeps
+            # its node, the entry it was reached from and the edge used, and
+            # only the winning paths are rebuilt from those pointers at the end.
+            entry_node = [source]
+            entry_parent = [-1]
+            entry_edge = [-1]
+            entry_strength = [1.0]
+            entry_depth = [0]
+            entries = (entry_node, entry_parent, entry_edge)
+            head = 0
             
-            while queue:
-                current, cum_strength, path_nodes, path_edges = queue.pop(0)
+            while head < len(entry_node):
+                entry = head
+                head += 1
+                current = entry_node[entry]
                 
-                if current in visited:
+                if visited[current] == source:
                     continue
-                visited.add(current)
+                visited[current] = source
                 
-                # Continue traversal
-                if current in self.outgoing and len(path_nodes) < 6:
-                    for target, edge_score, edge_type in self.outgoing[current]:
-                        if target not in visited:
-                            new_strength = cum_strength * (edge_score / 4)
-                            
-                            if target in self.risk_dict:
-                                target_info = {
-                                    "id": target,
-                                    "name": self.risk_dict[target]["name"],
-                                    "type": self.risk_dict[target]["level"]
-                                }
-                            else:
-                                continue
-                            
-                            queue.append((
-                                target,
-                                new_strength,
-                                path_nodes + [target_info],
-                                path_edges + [{"type": edge_type, "score": edge_score}]
-                            ))
+                # Continue traversal (paths up to 6 nodes)
+                if entry_depth[entry] < 5:
+                    cum_strength = entry_strength[entry]
+                    for k in range(indptr[current], indptr[current + 1]):
+                        target = nbr[k]
+                        if target < n_risks and visited[target] != source:
+                            new_strength = cum_strength * (edge_scores[k] / 4)
+                            entry_node.append(target)
+                            entry_parent.append(entry)
+                            entry_edge.append(k)
+                            entry_strength.append(new_strength)
+                            entry_depth.append(entry_depth[entry] + 1)
                             
                             # Add path if we reached a Business risk
-                            if self.risk_dict[target]["level"] == "Business":
-                                critical_paths.append({
-                                    "path": path_nodes + [target_info],
-                                    "edges": path_edges + [{"type": edge_type, "score": edge_score}],
-                                    "strength": round(new_strength, 3),
-                                    "length": len(path_nodes)
-                                })
-        
-        # Sort by strength and return top paths
-        critical_paths.sort(key=lambda x: -x["strength"])
-        return critical_paths[:limit]
+                            if level_code[target] == LEVEL_BUSINESS:
+                                hits.append((new_strength, len(entry_node) - 1, entries))
+        
+        # Pick the strongest (to 3 decimals) and build only the returned paths
+        top_hits = _top_rounded(limit, hits, lambda hit: hit[0], 3)
+        return [self._critical_path(*hit) for hit in top_hits]
+
+    def _critical_path(
+        self,
+        strength: float,
+        entry: int,
+        entries: Tuple[List[int], List[int], List[int]],
+    ) -> Dict[str, Any]:
+        """Rebuild a get_critical_paths() result by walking queue entry parents."""
+        entry_node, entry_parent, entry_edge = entries
+        path: List[Dict[str, Any]] = []
+        edges: List[Dict[str, Any]] = []
+        while entry >= 0:
+            node_id = self.node_ids[entry_node[entry]]
+            risk_data = self.risk_dict[node_id]
+            path.append({"id": node_id, "name": risk_data["name"], "type": risk_data["level"]})
+            k = entry_edge[entry]
+            if k >= 0:
+                edges.append({
+                    "type": EDGE_TYPE_NAMES[self.out_etype[k]],
+                    "score": float(self.out_score[k]),
+                })
+            entry = entry_parent[entry]
+        path.reverse()
+        edges.reverse()
+        return {
+            "path": path,
+            "edges": edges,
+            "strength": round(strength, 3),
+            "length": len(edges)
+        }
     
+    def _is_acyclic(self) -> bool:
+        """Whether the influence graph has no directed cycle (Kahn's algorithm)."""
+        indptr = self.out_indptr.tolist()
+        nbr = self.out_nbr.tolist()
+        in_degree = np.diff(self.in_indptr).tolist()
+        ready = [u for u, degree in enumerate(in_degree) if degree == 0]
+        removed = 0
+        while ready:
+            u = ready.pop()
+            removed += 1
+            for k in range(indptr[u], indptr[u + 1]):
+                target = nbr[k]
+                in_degree[target] -= 1
+                if in_degree[target] == 0:
+                    ready.append(target)
+        return removed == len(self.node_ids)
+
+    def _bottleneck_counts(self) -> Tuple[List[int], int]:
+        """
+        Number of paths to Business risks through each risk, and in total.
+
+        Acyclic networks are counted by dynamic programming; any cycle falls
+        back to enumerating the simple paths.
+
+        Returns:
+            Tuple of (path_counts indexed like the risks, total_paths)
+        """
+        if self._is_acyclic():
+            return self._bottleneck_counts_dp()
+        return self._bottleneck_counts_dfs()
+
+    def _bottleneck_counts_dp(self) -> Tuple[List[int], int]:
+        """
+        Layered path counting behind _bottleneck_counts() on a DAG.
+
+        ``down[l, v]`` counts the ``l``-edge paths from ``v`` to a Business risk
+        and ``up[l, v]`` the ``l``-edge paths from any risk to ``v``, passing
+        through non-Business nodes only. Every walk in a DAG is a simple path,
+        so the paths through ``v`` are the products of the two, for up to
+        ``MAX_BOTTLENECK_PATH - 1`` edges in total.
+        """
+        n_nodes = len(self.node_ids)
+        max_edges = MAX_BOTTLENECK_PATH - 1
+        # Parallel influences between the same pair describe the same path
+        pairs = np.unique(
+            np.repeat(np.arange(n_nodes, dtype=np.int64), np.diff(self.out_indptr)) * n_nodes
+            + self.out_nbr
+        )
+        src, dst = pairs // n_nodes, pairs % n_nodes
+        business = self.level_code == LEVEL_BUSINESS
+        passable = (~business).astype(np.int64)
+        is_risk = (np.arange(n_nodes) < self.n_risks).astype(np.int64)
+
+        down = np.zeros((max_edges + 1, n_nodes), dtype=np.int64)
+        up = np.zeros((max_edges + 1, n_nodes), dtype=np.int64)
+        np.add.at(down[1], src, business[dst].astype(np.int64))
+        np.add.at(up[1], dst, is_risk[src])
+        for length in range(2, max_edges + 1):
+            np.add.at(down[length], src, down[length - 1][dst] * passable[dst])
+            np.add.at(up[length], dst, up[length - 1][src] * passable[src])
+
+        through = np.zeros(n_nodes, dtype=np.int64)
+        for length in range(1, max_edges):
+            through += up[length] * down[1:max_edges - length + 1].sum(axis=0)
+        through *= passable
+        total_paths = int(down[1:, :self.n_risks].sum())
+        return through[:self.n_risks].tolist(), total_paths
+
+    def _bottleneck_counts_dfs(self) -> Tuple[List[int], int]:
+        """Simple-path enumeration behind _bottleneck_counts()."""
+        path_count = [0] * self.n_risks
+        total_paths = 0
+        indptr = self.out_indptr.tolist()
+        nbr = self.out_nbr.tolist()
+        n_risks = self.n_risks
+        is_business = (self.level_code == LEVEL_BUSINESS).tolist()
+        reaches_business = self._reaches_business
+        # Parallel influences between the same pair describe the same path,
+        # so each node walks its distinct successors only, and never those
+        # that can't lead to a Business risk.
+        successors = [
+            [v for v in dict.fromkeys(nbr[indptr[u]:indptr[u + 1]]) if reaches_business[v]]
+            for u in range(len(self.node_ids))
+        ]
+        on_path = bytearray(len(self.node_ids))
+        
+        for source in range(n_risks):
+            if not reaches_business[source]:
+                continue
+            # Depth-first walk of the simple paths (up to MAX_BOTTLENECK_PATH nodes) to Business risks
+            path = [source]
+            cursor = [0]
+            on_path[source] = 1
+            
+            while path:
+                current = path[-1]
+                position = cursor[-1]
+                targets = successors[current]
+                if len(path) >= MAX_BOTTLENECK_PATH or position == len(targets):
+                    on_path[current] = 0
+                    path.pop()
+                    cursor.pop()
+                    continue
+                cursor[-1] = position + 1
+                target = targets[position]
+                if on_path[target]:
+                    continue
+                
+                if is_business[target]:
+                    total_paths += 1
+                    for node in path[1:]:  # Exclude start and end
+                        if node < n_risks:
+                            path_count[node] += 1
+                    continue
+                
+                on_path[target] = 1
+                path.append(target)
+                cursor.append(0)
+        return path_count, total_paths
+
+    @_memoize_limit
     def get_bottlenecks(self, limit: int = 5) -> List[Dict[str, Any]]:
         """
         Identify bottleneck nodes - nodes appearing in many paths to Business risks.
@@ -352,134 +851,119 @@ class InfluenceAnalyzer:
         Returns:
             List of bottleneck dictionaries
         """
-        node_path_count: Dict[str, int] = {}
-        total_paths = 0
-        
-        for risk_id, risk_data in self.risk_dict.items():
-            # Find all paths to Business risks
-            visited_paths: Set[tuple] = set()
-            queue = [(risk_id, [risk_id])]
-            
-            while queue:
-                current, path = queue.pop(0)
-                path_key = tuple(path)
-                
-                if path_key in visited_paths:
-                    continue
-                visited_paths.add(path_key)
-                
-                if current in self.risk_dict and self.risk_dict[current]["level"] == "Business" and len(path) > 1:
-                    total_paths += 1
-                    for node in path[1:-1]:  # Exclude start and end
-                        if node in self.risk_dict:
-                            if node not in node_path_count:
-                                node_path_count[node] = 0
-                            node_path_count[node] += 1
-                    continue
-                
-                if current in self.outgoing and len(path) < 6:
-                    for target, _, _ in self.outgoing[current]:
-                        if target not in path:
-                            queue.append((target, path + [target]))
-        
-        # Calculate bottleneck scores
+        path_count, total_paths = self._bottleneck_counts()
+
+        # Risks on at least two paths, most first; only the returned ones get a dict
+        candidates = [node for node, count in enumerate(path_count) if count >= 2]
         bottlenecks = []
-        for node_id, count in node_path_count.items():
-            if count >= 2 and node_id in self.risk_dict:
-                bottlenecks.append({
-                    "id": node_id,
-                    "name": self.risk_dict[node_id]["name"],
-                    "level": self.risk_dict[node_id]["level"],
-                    "path_count": count,
-                    "total_paths": total_paths,
-                    "percentage": round(count / max(total_paths, 1) * 100, 1)
-                })
-        
-        bottlenecks.sort(key=lambda x: -x["path_count"])
-        return bottlenecks[:limit]
+        for node in heapq.nlargest(limit, candidates, key=path_count.__getitem__):
+            node_id = self.node_ids[node]
+            count = path_count[node]
+            bottlenecks.append({
+                "id": node_id,
+                "name": self.risk_dict[node_id]["name"],
+                "level": self.risk_dict[node_id]["level"],
+                "path_count": count,
+                "total_paths": total_paths,
+                "percentage": round(count / max(total_paths, 1) * 100, 1)
+            })
+        return bottlenecks
     
+    @_memoize_limit
     def get_risk_clusters(self, limit: int = 5) -> List[Dict[str, Any]]:
         """
         Find tightly connected groups of risks using connected components.
         
+        Clusters are ranked by size, then density; ties are listed in order
+        of their earliest member's first appearance in ``influences``. Each
+        cluster's members are listed in ``risks`` order.
+        
         Args:
             limit: Maximum number of results to return
         
         Returns:
             List of cluster dictionaries
         """
-        # Build undirected adjacency for clustering
-        undirected: Dict[str, Set[str]] = {}
-        
-        for source in self.outgoing:
-            if source not in self.risk_dict:
+        indptr = self.out_indptr.tolist()
+        nbr = self.out_nbr.tolist()
+        n_risks = self.n_risks
+
+        # Union-find over risk-to-risk influences (direction ignored)
+        parent = list(range(n_risks))
+        size = [1] * n_risks
+        
+        def find(node: int) -> int:
+            while parent[node] != node:
+                parent[node] = parent[parent[node]]  # path halving
+                node = parent[node]
+            return node
+        
+        # Risks in order of first appearance on an edge, walking sources in
+        # influence-list order (CSR keeps each source's edges in list order),
+        # so clusters are listed by their earliest member
+        appearance: List[int] = []
+        seen = bytearray(n_risks)
+        internal_sources: List[int] = []
+        id_of = self.id_of
+        source_order = dict.fromkeys(id_of[inf["source_id"]] for inf in self.influences)
+        
+        for source in source_order:
+            if source >= n_risks:
                 continue
-            for target, score, _ in self.outgoing[source]:
-                if target not in self.risk_dict:
+            for k in range(indptr[source], indptr[source + 1]):
+                target = nbr[k]
+                if target >= n_risks:
                     continue
-                if source not in undirected:
-                    undirected[source] = set()
-                if target not in undirected:
-                    undirected[target] = set()
-                undirected[source].add(target)
-                undirected[target].add(source)
-        
-        # Find connected components
-        visited: Set[str] = set()
+                internal_sources.append(source)
+                for node in (source, target):
+                    if not seen[node]:
+                        seen[node] = 1
+                        appearance.append(node)
+                root_s, root_t = find(source), find(target)
+                if root_s != root_t:
+                    if size[root_s] < size[root_t]:
+                        root_s, root_t = root_t, root_s
+                    parent[root_t] = root_s
+                    size[root_s] += size[root_t]
+        
+        # Group members by component root
+        components: Dict[int, List[int]] = {}
+        for node in appearance:
+            components.setdefault(find(node), []).append(node)
+        
+        # Both ends of a risk-to-risk edge share a component
+        internal_count = Counter(find(source) for source in internal_sources)
         clusters = []
         
-        for start_node in undirected:
-            if start_node in visited:
-                continue
-            
-            # BFS to find cluster
-            cluster: Set[str] = set()
-            queue = [start_node]
-            
-            while queue:
-                current = queue.pop(0)
-                if current in visited:
-                    continue
-                visited.add(current)
-                cluster.add(current)
-                
-                for neighbor in undirected.get(current, set()):
-                    if neighbor not in visited:
-                        queue.append(neighbor)
-            
+        for root, cluster in components.items():
             if len(cluster) >= 2:
-                # Count internal edges
-                internal_edges = 0
-                for node in cluster:
-                    for target, _, _ in self.outgoing.get(node, []):
-                        if target in cluster:
-                            internal_edges += 1
+                internal_edges = internal_count[root]
                 
                 # Determine cluster category
-                levels = [self.risk_dict[n]["level"] for n in cluster if n in self.risk_dict]
-                categories = []
-                for n in cluster:
-                    if n in self.risk_dict:
-                        categories.extend(self.risk_dict[n].get("categories", []))
+                members = [self.risk_dict[self.node_ids[n]] for n in sorted(cluster)]
+                levels = Counter(r["level"] for r in members)
+                categories = Counter()
+                for r in members:
+                    categories.update(r.get("categories", []))
                 
-                primary_category = max(set(categories), key=categories.count) if categories else "Mixed"
+                # Ties go to the category seen first
+                primary_category = categories.most_common(1)[0][0] if categories else "Mixed"
                 
                 clusters.append({
-                    "nodes": list(cluster),
-                    "node_names": [self.risk_dict[n]["name"] for n in cluster if n in self.risk_dict],
+                    "nodes": [r["id"] for r in members],
+                    "node_names": [r["name"] for r in members],
                     "size": len(cluster),
                     "internal_edges": internal_edges,
                     "density": round(internal_edges / (len(cluster) * (len(cluster) - 1)) if len(cluster) > 1 else 0, 2),
                     "primary_category": primary_category,
                     "levels": {
-                        "Strategic": levels.count("Strategic"),
-                        "Operational": levels.count("Operational")
+                        "Strategic": levels["Strategic"],
+                        "Operational": levels["Operational"]
                     }
                 })
         
-        # Sort by size and density
-        clusters.sort(key=lambda x: (-x["size"], -x["density"]))
-        return clusters[:limit]
+        # Largest and densest first
+        return heapq.nlargest(limit, clusters, key=lambda x: (x["size"], x["density"]))
     
     def get_propagator_ids(self) -> Set[str]:
         """Get IDs of top propagators."""
@@ -9,11 +9,24 @@ Provides comprehensive mitigation coverage analysis including:
 - Cross-reference with influence analysis
 """
 
-from typing import List, Dict, Any, Set, Optional
+from collections import Counter, defaultdict
+from functools import cached_property
+from typing import List, Dict, Any, Set, Tuple, Optional
 from dataclasses import dataclass, field
+
+import numpy as np
+
 from config.settings import EFFECTIVENESS_VALUES
 
 
+# Mitigation status codes stored in ``rel_status``
+STATUS_OTHER, STATUS_IMPLEMENTED, STATUS_PROPOSED = range(3)
+_STATUS_CODES = {
+    "Implemented": STATUS_IMPLEMENTED,
+    "Proposed": STATUS_PROPOSED,
+    "In Progress": STATUS_PROPOSED,
+}
+
 @dataclass
 class CoverageStats:
     """Statistics about mitigation coverage."""
@@ -43,12 +56,33 @@ class RiskMitigationSummary:
     influence_flags: List[str] = field(default_factory=list)
 
 
+def _by_exposure(entries: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """``entries`` by descending ``"exposure"``, ties in input order (one stable argsort)."""
+    exposures = np.fromiter(
+        (entry["exposure"] for entry in entries), dtype=np.float64, count=len(entries)
+    )
+    return [entries[j] for j in np.argsort(-exposures, kind="stable").tolist()]
+
+
 class MitigationAnalyzer:
     """
     Analyzes mitigation coverage in the risk network.
     
     This class performs analysis on mitigation relationships
     to identify coverage gaps and prioritize risk treatment.
+
+    Besides the per-id mappings, every MITIGATES relationship is kept in
+    parallel arrays (``rel_risk_idx``, ``rel_eff_score``, ``rel_status``
+    and its ``rel_is_implemented``/``rel_is_proposed`` masks) indexed like
+    ``mitigates_rels``, so per-risk totals are a few ``np.bincount`` calls.
+    ``rel_risk_idx`` indexes ``risk_dict`` (insertion order), or is -1 for
+    risks that aren't in ``risks``.
+
+    The input lists and their dictionaries are treated as read-only and
+    shared, not copied. The analyzer is immutable once built, so derived
+    results (per-risk totals, the ``analyze()`` and ``get_coverage_gaps()``
+    outputs) are computed once and reused. Both outputs come from a single
+    pass over ``risks``.
     """
     
     def __init__(
@@ -72,9 +106,9 @@ class MitigationAnalyzer:
         self.mitigates_rels = mitigates_relationships
         self.influence_analysis = influence_analysis
         
-        # Build indexed dictionaries
-        self.risk_dict = {r["id"]: dict(r) for r in risks}
-        self.mitigation_dict = {m["id"]: dict(m) for m in mitigations}
+        # Index the inputs by id; they are only read, never copied or mutated
+        self.risk_dict = {r["id"]: r for r in risks}
+        self.mitigation_dict = {m["id"]: m for m in mitigations}
         
         # Build mappings
         self.risk_to_mitigations: Dict[str, List[Dict]] = {}
@@ -86,53 +120,112 @@ class MitigationAnalyzer:
         self.propagator_ids: Set[str] = set()
         self.convergence_ids: Set[str] = set()
         self.bottleneck_ids: Set[str] = set()
+        # First influence record per risk id, for get_risk_details
+        self.propagator_by_id: Dict[str, Dict[str, Any]] = {}
+        self.convergence_by_id: Dict[str, Dict[str, Any]] = {}
+        self.bottleneck_by_id: Dict[str, Dict[str, Any]] = {}
         self._extract_influence_priorities()
+        
+        # analyze() and get_coverage_gaps() results, built together on first use
+        self._analysis: Optional[Dict[str, Any]] = None
+        self._gaps: Optional[Dict[str, Any]] = None
     
     def _build_mappings(self):
-        """Build risk-to-mitigations and mitigation-to-risks mappings."""
+        """Build risk-to-mitigations and mitigation-to-risks mappings and relationship arrays."""
+        self._risk_index: Dict[str, int] = {risk_id: i for i, risk_id in enumerate(self.risk_dict)}
+        risk_idx: List[int] = []
+        eff_scores: List[int] = []
+        status_codes: List[int] = []
+        risk_to_mitigations: Dict[str, List[Dict]] = defaultdict(list)
+        mitigation_to_risks: Dict[str, List[Dict]] = defaultdict(list)
+        
         for rel in self.mitigates_rels:
             risk_id = rel["risk_id"]
             mit_id = rel["mitigation_id"]
+            status = self.mitigation_dict.get(mit_id, {}).get("status", "Unknown")
+            risk_idx.append(self._risk_index.get(risk_id, -1))
+            eff_scores.append(EFFECTIVENESS_VALUES.get(rel.get("effectiveness", "Medium"), 2))
+            status_codes.append(_STATUS_CODES.get(status, STATUS_OTHER))
             
             # Risk to mitigations
-            if risk_id not in self.risk_to_mitigations:
-                self.risk_to_mitigations[risk_id] = []
-            
-            self.risk_to_mitigations[risk_id].append({
+            risk_to_mitigations[risk_id].append({
                 "mitigation_id": mit_id,
                 "mitigation_name": rel.get("mitigation_name", ""),
                 "mitigation_type": rel.get("mitigation_type", "Unknown"),
                 "effectiveness": rel.get("effectiveness", "Medium"),
                 "description": rel.get("description", ""),
-                "status": self.mitigation_dict.get(mit_id, {}).get("status", "Unknown")
+                "status": status
             })
             
             # Mitigation to risks
-            if mit_id not in self.mitigation_to_risks:
-                self.mitigation_to_risks[mit_id] = []
-            
-            self.mitigation_to_risks[mit_id].append({
+            mitigation_to_risks[mit_id].append({
                 "risk_id": risk_id,
                 "risk_name": rel.get("risk_name", ""),
                 "risk_level": rel.get("risk_level", "Unknown"),
                 "effectiveness": rel.get("effectiveness", "Medium")
             })
+        
+        # Plain dicts again, so lookups of unknown ids don't insert empty lists
+        self.risk_to_mitigations = dict(risk_to_mitigations)
+        self.mitigation_to_risks = dict(mitigation_to_risks)
+        
+        self.rel_risk_idx = np.array(risk_idx, dtype=np.int32)
+        self.rel_eff_score = np.array(eff_scores, dtype=np.int64)
+        self.rel_status = np.array(status_codes, dtype=np.uint8)
+        self.rel_is_implemented = self.rel_status == STATUS_IMPLEMENTED
+        self.rel_is_proposed = self.rel_status == STATUS_PROPOSED
+    
+    @cached_property
+    def _risk_totals(self) -> Tuple[List[int], List[int], List[int], List[int], List[int]]:
+        """
+        Per-risk relationship totals, indexed like ``risk_dict`` (computed once).
+        
+        Returns:
+            Tuple of (mitigation_count, mitigation_score, implemented_count,
+            proposed_count, implemented_score) lists
+        """
+        n_risks = len(self.risk_dict)
+        known = self.rel_risk_idx >= 0
+        idx = self.rel_risk_idx[known]
+        
+        def total(weights: Optional[np.ndarray] = None) -> List[int]:
+            if weights is not None:
+                weights = weights[known]
+            return np.bincount(idx, weights=weights, minlength=n_risks).astype(np.int64).tolist()
+        
+        return (
+            total(),
+            total(self.rel_eff_score),
+            total(self.rel_is_implemented),
+            total(self.rel_is_proposed),
+            total(self.rel_eff_score * self.rel_is_implemented),
+        )
+    
+    @cached_property
+    def _coverage_statuses(self) -> List[str]:
+        """Coverage status per risk, indexed like ``risk_dict`` (computed once)."""
+        mit_counts, mit_scores, implemented_counts, _, _ = self._risk_totals
+        return [
+            self._get_coverage_status(count, implemented, score)
+            for count, implemented, score in zip(mit_counts, implemented_counts, mit_scores)
+        ]
     
     def _extract_influence_priorities(self):
-        """Extract high-priority risk IDs from influence analysis."""
+        """Extract high-priority risk IDs and records from influence analysis."""
         if not self.influence_analysis:
             return
         
-        self.propagator_ids = set(
-            p["id"] for p in self.influence_analysis.get("top_propagators", [])
-        )
-        self.convergence_ids = set(
-            c["id"] for c in self.influence_analysis.get("convergence_points", [])
-            if c.get("node_type") == "Risk"
-        )
-        self.bottleneck_ids = set(
-            b["id"] for b in self.influence_analysis.get("bottlenecks", [])
-        )
+        for prop in self.influence_analysis.get("top_propagators", []):
+            self.propagator_by_id.setdefault(prop["id"], prop)
+        for conv in self.influence_analysis.get("convergence_points", []):
+            self.convergence_by_id.setdefault(conv["id"], conv)
+            if conv.get("node_type") == "Risk":
+                self.convergence_ids.add(conv["id"])
+        for bn in self.influence_analysis.get("bottlenecks", []):
+            self.bottleneck_by_id.setdefault(bn["id"], bn)
+        
+        self.propagator_ids = set(self.propagator_by_id)
+        self.bottleneck_ids = set(self.bottleneck_by_id)
         self.high_priority_ids = self.propagator_ids | self.convergence_ids | self.bottleneck_ids
     
     def _get_coverage_status(
@@ -176,9 +269,18 @@ class MitigationAnalyzer:
         """
         Perform comprehensive mitigation analysis.
         
+        The analysis is computed on the first call; later calls return a
+        fresh top-level dict over the same results.
+        
         Returns:
             Dictionary containing all analysis results
         """
+        if self._analysis is None:
+            self._compute_all_derived()
+        return dict(self._analysis)
+    
+    def _compute_all_derived(self):
+        """Build the analyze() and get_coverage_gaps() results in one pass over risks."""
         analysis = {
             "coverage_stats": {},
             "unmitigated_risks": [],
@@ -191,9 +293,9 @@ class MitigationAnalyzer:
         
         # Calculate coverage statistics
         total_risks = len(self.risks)
-        mitigated_ids = set(self.risk_to_mitigations.keys())
-        all_risk_ids = set(r["id"] for r in self.risks)
-        unmitigated_ids = all_risk_ids - mitigated_ids
+        # Key views support set operations, so nothing is rebuilt per call
+        mitigated_ids = self.risk_to_mitigations.keys()
+        unmitigated_ids = self.risk_dict.keys() - mitigated_ids
         
         analysis["coverage_stats"] = {
             "total_risks": total_risks,
@@ -206,25 +308,36 @@ class MitigationAnalyzer:
             "total_links": len(self.mitigates_rels)
         }
         
+        gaps = {
+            "critical_unmitigated": [],
+            "high_priority_unmitigated": [],
+            "proposed_only_high_exposure": [],
+            "strategic_gaps": [],
+            "category_coverage": {}
+        }
+        
+        # Calculate average exposure for threshold (over risks with an exposure)
+        exposures = [r.get("exposure") or 0 for r in self.risks]
+        rated = [e for e in exposures if e]
+        avg_exposure = sum(rated) / len(rated) if rated else 5.0
+        high_exposure_threshold = avg_exposure * 1.2
+        
+        # Category tracking
+        category_stats: Dict[str, Dict[str, int]] = {}
+        # Ids already listed in strategic_gaps
+        strategic_gap_ids: Set[str] = set()
+        
+        (mit_counts, mit_scores, implemented_counts, proposed_counts,
+         implemented_scores) = self._risk_totals
+        coverage_statuses = self._coverage_statuses
+        
         # Analyze each risk
-        for risk in self.risks:
+        for risk, exposure in zip(self.risks, exposures):
             risk_id = risk["id"]
+            i = self._risk_index[risk_id]
             mits = self.risk_to_mitigations.get(risk_id, [])
-            
-            # Calculate mitigation score
-            mit_score = sum(
-                EFFECTIVENESS_VALUES.get(m.get("effectiveness", "Medium"), 2)
-                for m in mits
-            )
-            
-            # Count by status
-            implemented_count = sum(1 for m in mits if m.get("status") == "Implemented")
-            proposed_count = sum(1 for m in mits if m.get("status") in ["Proposed", "In Progress"])
-            
-            # Determine coverage status
-            coverage_status = self._get_coverage_status(
-                len(mits), implemented_count, mit_score
-            )
+            categories = risk.get("categories", [])
+            is_strategic = risk["level"] == "Strategic"
             
             # Get influence flags
             influence_flags = self._get_influence_flags(risk_id)
@@ -234,43 +347,106 @@ class MitigationAnalyzer:
                 "name": risk["name"],
                 "level": risk["level"],
                 "origin": risk.get("origin", "New"),
-                "exposure": risk.get("exposure") or 0,
-                "categories": risk.get("categories", []),
-                "mitigation_count": len(mits),
-                "implemented_count": implemented_count,
-                "proposed_count": proposed_count,
-                "mitigation_score": mit_score,
+                "exposure": exposure,
+                "categories": categories,
+                "mitigation_count": mit_counts[i],
+                "implemented_count": implemented_counts[i],
+                "proposed_count": proposed_counts[i],
+                "mitigation_score": mit_scores[i],
                 "mitigations": mits,
-                "coverage_status": coverage_status,
+                "coverage_status": coverage_statuses[i],
                 "influence_flags": influence_flags
             }
             
             analysis["risk_mitigation_summary"].append(risk_summary)
             
-            # Categorize by coverage
+            # Track category stats
+            for cat in categories:
+                if cat not in category_stats:
+                    category_stats[cat] = {"total": 0, "mitigated": 0}
+                category_stats[cat]["total"] += 1
+                if len(mits) > 0:
+                    category_stats[cat]["mitigated"] += 1
+            
+            # Analyze unmitigated risks
+            if len(mits) == 0:
+                is_high_priority = risk_id in self.high_priority_ids
+                if not (is_high_priority or is_strategic or exposure >= high_exposure_threshold):
+                    continue
+                risk_info = self._gap_info(risk, exposure, influence_flags)
+                
+                if is_high_priority:
+                    gaps["high_priority_unmitigated"].append(risk_info)
+                elif exposure >= high_exposure_threshold:
+                    gaps["critical_unmitigated"].append(risk_info)
+                
+                if is_strategic:
+                    gaps["strategic_gaps"].append(risk_info)
+                    strategic_gap_ids.add(risk_id)
+            else:
+                # Only proposed mitigations / strategic risks with weak mitigation
+                proposed_only = implemented_counts[i] == 0 and exposure >= high_exposure_threshold
+                total_eff = implemented_scores[i]
+                weak_strategic = is_strategic and total_eff < 4  # Less than one "High" effectiveness
+                if not (proposed_only or weak_strategic):
+                    continue
+                risk_info = self._gap_info(risk, exposure, influence_flags)
+                
+                if proposed_only:
+                    risk_info["proposed_mitigations"] = [m["mitigation_name"] for m in mits]
+                    gaps["proposed_only_high_exposure"].append(risk_info)
+                
+                if weak_strategic:
+                    risk_info["implemented_effectiveness"] = total_eff
+                    if risk_id not in strategic_gap_ids:
+                        gaps["strategic_gaps"].append(risk_info)
+                        strategic_gap_ids.add(risk_id)
+        
+        # Bucket by coverage, highest exposure first (one stable argsort; ties
+        # keep input order). Well covered risks stay in input order.
+        summaries = analysis["risk_mitigation_summary"]
+        exposures = np.array([summary["exposure"] for summary in summaries], dtype=np.float64)
+        analysis["well_covered_risks"] = [
+            summary for summary in summaries if summary["coverage_status"] == "well_covered"
+        ]
+        for j in np.argsort(-exposures, kind="stable").tolist():
+            risk_summary = summaries[j]
+            coverage_status = risk_summary["coverage_status"]
             if coverage_status == "unmitigated":
                 analysis["unmitigated_risks"].append(risk_summary)
-                if risk_id in self.high_priority_ids:
+                if risk_summary["id"] in self.high_priority_ids:
                     analysis["high_priority_unmitigated"].append(risk_summary)
             elif coverage_status == "proposed_only":
                 analysis["partially_mitigated_risks"].append(risk_summary)
-            elif coverage_status == "well_covered":
-                analysis["well_covered_risks"].append(risk_summary)
-        
-        # Sort by exposure
-        analysis["unmitigated_risks"].sort(key=lambda x: -(x["exposure"] or 0))
-        analysis["partially_mitigated_risks"].sort(key=lambda x: -(x["exposure"] or 0))
-        analysis["high_priority_unmitigated"].sort(key=lambda x: -(x["exposure"] or 0))
         
         # Effectiveness distribution
-        effectiveness_dist = {"Critical": 0, "High": 0, "Medium": 0, "Low": 0}
-        for rel in self.mitigates_rels:
-            eff = rel.get("effectiveness", "Medium")
-            if eff in effectiveness_dist:
-                effectiveness_dist[eff] += 1
-        analysis["mitigation_effectiveness"] = effectiveness_dist
+        eff_counts = Counter(rel.get("effectiveness", "Medium") for rel in self.mitigates_rels)
+        analysis["mitigation_effectiveness"] = {
+            eff: eff_counts[eff] for eff in ("Critical", "High", "Medium", "Low")
+        }
+        
+        # Sort gaps by exposure
+        for key in (
+            "critical_unmitigated", "high_priority_unmitigated",
+            "proposed_only_high_exposure", "strategic_gaps",
+        ):
+            gaps[key] = _by_exposure(gaps[key])
+        
+        # Calculate category coverage
+        for cat, stats in category_stats.items():
+            coverage = round(
+                stats["mitigated"] / stats["total"] * 100, 1
+            ) if stats["total"] > 0 else 0
+            
+            gaps["category_coverage"][cat] = {
+                "total": stats["total"],
+                "mitigated": stats["mitigated"],
+                "unmitigated": stats["total"] - stats["mitigated"],
+                "coverage_percentage": coverage
+            }
         
-        return analysis
+        self._analysis = analysis
+        self._gaps = gaps
     
     def get_risk_details(self, risk_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -289,44 +465,36 @@ class MitigationAnalyzer:
         mits = self.risk_to_mitigations.get(risk_id, [])
         
         # Calculate metrics
-        mit_score = sum(
-            EFFECTIVENESS_VALUES.get(m.get("effectiveness", "Medium"), 2)
-            for m in mits
-        )
-        implemented = [m for m in mits if m.get("status") == "Implemented"]
-        
-        coverage_status = self._get_coverage_status(
-            len(mits), len(implemented), mit_score
-        )
+        _, mit_scores, implemented_counts, _, _ = self._risk_totals
+        i = self._risk_index[risk_id]
+        mit_score = mit_scores[i]
+        implemented_count = implemented_counts[i]
+        coverage_status = self._coverage_statuses[i]
         
         # Build influence info
         influence_info = {}
-        if self.influence_analysis:
-            for prop in self.influence_analysis.get("top_propagators", []):
-                if prop["id"] == risk_id:
-                    influence_info["is_top_propagator"] = True
-                    influence_info["propagation_score"] = prop["score"]
-                    influence_info["tpos_reached"] = prop["tpos_reached"]
-                    break
-            
-            for conv in self.influence_analysis.get("convergence_points", []):
-                if conv["id"] == risk_id:
-                    influence_info["is_convergence_point"] = True
-                    influence_info["convergence_score"] = conv["score"]
-                    influence_info["source_count"] = conv["source_count"]
-                    break
-            
-            for bn in self.influence_analysis.get("bottlenecks", []):
-                if bn["id"] == risk_id:
-                    influence_info["is_bottleneck"] = True
-                    influence_info["path_percentage"] = bn["percentage"]
-                    break
+        prop = self.propagator_by_id.get(risk_id)
+        if prop is not None:
+            influence_info["is_top_propagator"] = True
+            influence_info["propagation_score"] = prop["score"]
+            influence_info["tpos_reached"] = prop["tpos_reached"]
+        
+        conv = self.convergence_by_id.get(risk_id)
+        if conv is not None:
+            influence_info["is_convergence_point"] = True
+            influence_info["convergence_score"] = conv["score"]
+            influence_info["source_count"] = conv["source_count"]
+        
+        bn = self.bottleneck_by_id.get(risk_id)
+        if bn is not None:
+            influence_info["is_bottleneck"] = True
+            influence_info["path_percentage"] = bn["percentage"]
         
         return {
             "risk": risk,
             "mitigations": mits,
             "mitigation_count": len(mits),
-            "implemented_count": len(implemented),
+            "implemented_count": implemented_count,
             "total_effectiveness_score": mit_score,
             "coverage_status": coverage_status,
             "influence_info": influence_info
@@ -357,9 +525,10 @@ class MitigationAnalyzer:
                 risk_data["effectiveness"] = risk_ref["effectiveness"]
                 risks_with_data.append(risk_data)
         
-        # Count by level
-        strategic_count = sum(1 for r in risks_with_data if r.get("level") == "Strategic")
-        operational_count = sum(1 for r in risks_with_data if r.get("level") == "Operational")
+        # Count by level (one counting pass)
+        level_counts = Counter(r.get("level") for r in risks_with_data)
+        strategic_count = level_counts["Strategic"]
+        operational_count = level_counts["Operational"]
         
         # Calculate total exposure covered
         total_exposure = sum(r.get("exposure") or 0 for r in risks_with_data)
@@ -386,99 +555,35 @@ class MitigationAnalyzer:
             "addresses_high_priority": len(strategic_impacts) > 0
         }
     
+    def _gap_info(
+        self, risk: Dict[str, Any], exposure: float, influence_flags: List[str]
+    ) -> Dict[str, Any]:
+        """Entry for a risk listed by get_coverage_gaps()."""
+        risk_id = risk["id"]
+        return {
+            "id": risk_id,
+            "name": risk["name"],
+            "level": risk["level"],
+            "exposure": exposure,
+            "categories": risk.get("categories", []),
+            "is_high_priority": risk_id in self.high_priority_ids,
+            # Own copy, so gap entries and risk summaries don't alias
+            "influence_flags": list(influence_flags)
+        }
+    
     def get_coverage_gaps(self) -> Dict[str, Any]:
         """
         Identify coverage gaps in the mitigation strategy.
         
+        Computed together with analyze() on the first call to either; later
+        calls return a fresh top-level dict over the same results.
+        
         Returns:
             Dictionary containing gap analysis results
         """
-        gaps = {
-            "critical_unmitigated": [],
-            "high_priority_unmitigated": [],
-            "proposed_only_high_exposure": [],
-            "strategic_gaps": [],
-            "category_coverage": {}
-        }
-        
-        # Calculate average exposure for threshold
-        exposures = [r.get("exposure") or 0 for r in self.risks if r.get("exposure")]
-        avg_exposure = sum(exposures) / len(exposures) if exposures else 5.0
-        high_exposure_threshold = avg_exposure * 1.2
-        
-        # Category tracking
-        category_stats: Dict[str, Dict[str, int]] = {}
-        
-        for risk in self.risks:
-            risk_id = risk["id"]
-            mits = self.risk_to_mitigations.get(risk_id, [])
-            exposure = risk.get("exposure") or 0
-            
-            # Track category stats
-            for cat in risk.get("categories", []):
-                if cat not in category_stats:
-                    category_stats[cat] = {"total": 0, "mitigated": 0}
-                category_stats[cat]["total"] += 1
-                if len(mits) > 0:
-                    category_stats[cat]["mitigated"] += 1
-            
-            risk_info = {
-                "id": risk_id,
-                "name": risk["name"],
-                "level": risk["level"],
-                "exposure": exposure,
-                "categories": risk.get("categories", []),
-                "is_high_priority": risk_id in self.high_priority_ids,
-                "influence_flags": self._get_influence_flags(risk_id)
-            }
-            
-            # Analyze unmitigated risks
-            if len(mits) == 0:
-                if risk_id in self.high_priority_ids:
-                    gaps["high_priority_unmitigated"].append(risk_info)
-                elif exposure >= high_exposure_threshold:
-                    gaps["critical_unmitigated"].append(risk_info)
-                
-                if risk["level"] == "Strategic":
-                    gaps["strategic_gaps"].append(risk_info)
-            else:
-                # Check if only proposed mitigations
-                implemented = [m for m in mits if m.get("status") == "Implemented"]
-                if len(implemented) == 0 and exposure >= high_exposure_threshold:
-                    risk_info["proposed_mitigations"] = [m["mitigation_name"] for m in mits]
-                    gaps["proposed_only_high_exposure"].append(risk_info)
-                
-                # Strategic risks with weak mitigation
-                if risk["level"] == "Strategic":
-                    total_eff = sum(
-                        EFFECTIVENESS_VALUES.get(m.get("effectiveness", "Medium"), 2)
-                        for m in implemented
-                    )
-                    if total_eff < 4:  # Less than one "High" effectiveness
-                        risk_info["implemented_effectiveness"] = total_eff
-                        if risk_info not in gaps["strategic_gaps"]:
-                            gaps["strategic_gaps"].append(risk_info)
-        
-        # Sort by exposure
-        gaps["critical_unmitigated"].sort(key=lambda x: -x["exposure"])
-        gaps["high_priority_unmitigated"].sort(key=lambda x: -x["exposure"])
-        gaps["proposed_only_high_exposure"].sort(key=lambda x: -x["exposure"])
-        gaps["strategic_gaps"].sort(key=lambda x: -x["exposure"])
-        
-        # Calculate category coverage
-        for cat, stats in category_stats.items():
-            coverage = round(
-                stats["mitigated"] / stats["total"] * 100, 1
-            ) if stats["total"] > 0 else 0
-            
-            gaps["category_coverage"][cat] = {
-                "total": stats["total"],
-                "mitigated": stats["mitigated"],
-                "unmitigated": stats["total"] - stats["mitigated"],
-                "coverage_percentage": coverage
-            }
-        
-        return gaps
+        if self._gaps is None:
+            self._compute_all_derived()
+        return dict(self._gaps)
 
 
 def analyze_mitigation_coverage(
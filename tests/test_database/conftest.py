@@ -0,0 +1,26 @@
+"""
+Shared fixtures for database query tests.
+"""
+
+import pytest
+from unittest.mock import MagicMock
+from core import load_schema
+from core.schema_registry import reset_registry
+
+
+@pytest.fixture
+def default_registry():
+    """Load the default schema into a fresh global registry."""
+    reset_registry()
+    load_schema("default")
+    yield
+    reset_registry()
+
+
+@pytest.fixture
+def mock_driver():
+    """Mock Neo4j driver."""
+    driver = MagicMock()
+    session = MagicMock()
+    driver.session.return_value.__enter__.return_value = session
+    return driver, session
@@ -0,0 +1,42 @@
+"""
+Tests for analysis queries.
+"""
+
+import threading
+import pytest
+from unittest.mock import MagicMock, patch
+from database.queries import analysis
+
+
+pytestmark = pytest.mark.usefixtures("default_registry")
+
+
+class TestStatistics:
+    """Tests for get_statistics."""
+
+    def test_reads_are_issued_concurrently(self):
+        """All independent reads are in flight together, not one after another."""
+        barrier = threading.Barrier(5, timeout=5)
+
+        def waits(result):
+            def _read(*args, **kwargs):
+                barrier.wait()
+                return result
+            return _read
+
+        tpos = [{"id": "t1", "cluster": "Safety",
+                 "_incoming": [{"id": "i1", "source_id": "r1", "target_id": "t1"}]}]
+        with patch.object(analysis.risks, "get_all_risks", waits([
+                {"id": "r1", "level": "Business", "status": "Active", "origin": "New",
+                 "exposure": 4.0, "categories": ["Programme"]}])), \
+             patch.object(analysis.mitigations, "get_all_mitigations", waits([])), \
+             patch.object(analysis.influences, "get_all_influences", waits([])), \
+             patch.object(analysis.mitigations, "get_all_mitigates_relationships", waits([])), \
+             patch("database.queries.generic_relationship.get_targets_with_incoming", waits(tpos)):
+            stats = analysis.get_statistics(MagicMock())
+
+        assert stats["total_risks"] == 1
+        assert stats["total_tpos"] == 1
+        assert stats["total_tpo_impacts"] == 1
+        assert stats["tpo_clusters"] == {"Safety": 1}
+        assert stats["avg_exposure"] == 4.0
@@ -0,0 +1,97 @@
+"""
+Tests for Neo4j connection configuration.
+"""
+
+from unittest.mock import MagicMock, patch
+from neo4j import READ_ACCESS, WRITE_ACCESS
+from database.connection import Neo4jConnection, normalize_ids, chunk_ids
+from database.queries.mitigations import get_mitigates_edges
+from config.settings import NEO4J_DRIVER_SETTINGS
+
+
+class TestNeo4jConnection:
+    """Tests for driver tuning and session routing."""
+
+    def test_connect_passes_pool_settings(self):
+        """Pool size, acquisition timeout and lifetime reach the driver."""
+        with patch("database.connection.GraphDatabase.driver") as mock_factory:
+            conn = Neo4jConnection(
+                "bolt://x:7687", "neo4j", "pw",
+                max_connection_pool_size=7, connection_acquisition_timeout=2.5
+            )
+            conn.connect()
+
+        kwargs = mock_factory.call_args.kwargs
+        assert kwargs["max_connection_pool_size"] == 7
+        assert kwargs["connection_acquisition_timeout"] == 2.5
+        assert kwargs["max_connection_lifetime"] == NEO4J_DRIVER_SETTINGS["max_connection_lifetime"]
+
+    def test_sessions_name_database(self):
+        """Every session names the database; reads use READ_ACCESS."""
+        conn = Neo4jConnection("bolt://x:7687", "neo4j", "pw", database="rim")
+        conn._driver = MagicMock()
+        session = conn._driver.session.return_value
+        session.execute_read.return_value = []
+        session.run.return_value = []
+
+        conn.execute_read("RETURN 1")
+        conn.execute_query("RETURN 1")
+
+        calls = conn._driver.session.call_args_list
+        assert calls[0].kwargs == {"database": "rim", "default_access_mode": READ_ACCESS}
+        assert calls[1].kwargs == {"database": "rim", "default_access_mode": WRITE_ACCESS}
+
+
+    def test_database_defaults_to_home_database(self):
+        """Without RIM_NEO4J_DATABASE no database is named."""
+        import importlib
+        import config.settings as settings
+
+        with patch.dict("os.environ", {}, clear=False) as env:
+            env.pop("RIM_NEO4J_DATABASE", None)
+            assert importlib.reload(settings).NEO4J_DRIVER_SETTINGS["database"] is None
+            env["RIM_NEO4J_DATABASE"] = "rim"
+            assert importlib.reload(settings).NEO4J_DRIVER_SETTINGS["database"] == "rim"
+        importlib.reload(settings)
+
+    def test_generic_queries_use_connection_database(self):
+        """Generic entity/relationship sessions target the connection's database."""
+        from database.manager import RiskGraphManager
+        from database.queries import generic_entity, generic_relationship
+
+        manager = RiskGraphManager("bolt://x:7687", "neo4j", "pw")
+        manager._connection = Neo4jConnection("bolt://x:7687", "neo4j", "pw", database="rim")
+        raw = manager._connection._driver = MagicMock()
+
+        generic_entity.count_entities(manager.driver, MagicMock(neo4j_label="Risk"))
+        generic_relationship.count_relationships(manager.driver, MagicMock(neo4j_type="IMPACTS_TPO"))
+
+        assert [c.kwargs["database"] for c in raw.session.call_args_list] == ["rim", "rim"]
+        assert manager.driver.database == "rim"
+
+
+class TestIdListBatching:
+    """Tests for id list normalization used by edge queries."""
+
+    def test_normalize_ids_dedupes_and_sorts(self):
+        """Equivalent inputs produce identical parameters."""
+        assert normalize_ids(["b", "a", "b"]) == normalize_ids(["a", "b"]) == ["a", "b"]
+
+    def test_chunk_ids_only_splits_large_lists(self):
+        """Small lists stay whole, large lists are split into fixed batches."""
+        assert chunk_ids(["a", "b"]) == [["a", "b"]]
+        ids = [f"id{i:05d}" for i in range(12_000)]
+        batches = chunk_ids(ids)
+        assert [len(b) for b in batches] == [5_000, 5_000, 2_000]
+
+    def test_mitigates_edges_sends_deduped_ids(self):
+        """Duplicate ids are dropped before the query is sent."""
+        conn = MagicMock()
+        conn.execute_read.return_value = [{"source": "m1", "target": "r1"}]
+
+        edges = get_mitigates_edges(conn, ["m1", "m1"], ["r2", "r1", "r2"])
+
+        assert conn.execute_read.call_count == 1
+        params = conn.execute_read.call_args[0][1]
+        assert params == {"mit_ids": ["m1"], "risk_ids": ["r1", "r2"]}
+        assert edges == [{"source": "m1", "target": "r1"}]
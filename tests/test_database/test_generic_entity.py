@@ -7,22 +7,16 @@ from unittest.mock import MagicMock, patch
 from database.queries.generic_entity import (
     create_entity,
     get_all_entities,
+    get_entities_columnar,
     get_entity_by_id,
     update_entity,
     delete_entity,
+    count_entities,
     EntityValidationError
 )
 from core.entity import EntityTypeDefinition
 from core.attribute import AttributeDefinition, AttributeType
 
-@pytest.fixture
-def mock_driver():
-    """Mock Neo4j driver."""
-    driver = MagicMock()
-    session = MagicMock()
-    driver.session.return_value.__enter__.return_value = session
-    return driver, session
-
 @pytest.fixture
 def entity_type():
     """Simple entity type for testing."""
@@ -110,6 +104,19 @@ class TestGenericEntityCRUD:
         assert result["id"] == "123"
         assert "MATCH (n:TestNode {id: $id})" in session.run.call_args[0][0]
 
+    def test_reads_use_read_sessions(self, mock_driver, entity_type):
+        """Test that read queries open read-routed sessions."""
+        from neo4j import READ_ACCESS
+        driver, session = mock_driver
+        
+        mock_result = MagicMock()
+        mock_result.single.return_value = None
+        session.run.return_value = mock_result
+        
+        get_entity_by_id(driver, entity_type, "123")
+        
+        driver.session.assert_called_with(default_access_mode=READ_ACCESS)
+
     def test_update_entity(self, mock_driver, entity_type):
         """Test updating an entity."""
         driver, session = mock_driver
@@ -124,6 +131,29 @@ class TestGenericEntityCRUD:
         args, _ = session.run.call_args
         assert "SET n.name = $name" in args[0]
 
+    def test_update_entity_return_previous(self, mock_driver, entity_type):
+        """Test that the pre-update state comes back from the same query."""
+        driver, session = mock_driver
+        
+        mock_result = MagicMock()
+        mock_result.single.return_value = {
+            "n": {"id": "123", "name": "New"},
+            "before": {"id": "123", "name": "Old"},
+            "nodeId": "id123"
+        }
+        session.run.return_value = mock_result
+        
+        result = update_entity(driver, entity_type, "123", {"name": "New"}, return_previous=True)
+        
+        assert result["name"] == "New"
+        assert result["_previous"]["name"] == "Old"
+        assert session.run.call_count == 1
+        assert "properties(n) AS before" in session.run.call_args[0][0]
+        
+        # Not requested -> not attached
+        plain = update_entity(driver, entity_type, "123", {"name": "New"})
+        assert "_previous" not in plain
+
     def test_delete_entity(self, mock_driver, entity_type):
         """Test deleting an entity."""
         driver, session = mock_driver
@@ -136,3 +166,60 @@ class TestGenericEntityCRUD:
         
         assert success is True
         assert "DETACH DELETE n" in session.run.call_args[0][0]
+
+
+    def test_count_context_nodes_by_node_type(self, mock_driver):
+        """ContextNodes share a label, so counts are scoped to the type id."""
+        driver, session = mock_driver
+        session.run.return_value.single.return_value = {"cnt": 2}
+        tpo_type = EntityTypeDefinition(
+            id="tpo", label="TPO", neo4j_label="ContextNode", is_context_node=True
+        )
+
+        assert count_entities(driver, tpo_type, {"cluster": "Product"}) == 2
+
+        query, params = session.run.call_args[0]
+        assert "n.node_type = $__node_type" in query
+        assert params == {"__node_type": "tpo", "filter_cluster": "Product"}
+
+
+class TestGenericEntityColumnar:
+    """Tests for the columnar entity read."""
+
+    def test_rows_are_transposed_into_columns(self, mock_driver, entity_type):
+        """One packed record becomes one array per property, nulls kept."""
+        import pandas as pd
+        driver, session = mock_driver
+        entity_type.is_context_node = True
+
+        mock_result = MagicMock()
+        mock_result.single.return_value = {"rows": [
+            ["t1", "Alpha", "Safety"],
+            ["t2", None, "Safety"],
+            ["t3", "Gamma", "Sustainability"],
+        ]}
+        session.run.return_value = mock_result
+
+        columns = get_entities_columnar(
+            driver, entity_type, ["id", "name", "cluster"], categorical=["cluster"]
+        )
+
+        query, params = session.run.call_args[0]
+        assert "collect([n.id, n.name, n.cluster]) AS rows" in query
+        assert params == {"__node_type": "test_type"}
+        assert list(columns["id"]) == ["t1", "t2", "t3"]
+        assert columns["name"][1] is None
+        assert isinstance(columns["cluster"], pd.Categorical)
+        assert list(columns["cluster"].categories) == ["Safety", "Sustainability"]
+
+    def test_empty_result_gives_empty_columns(self, mock_driver, entity_type):
+        """No rows still yields every requested column."""
+        driver, session = mock_driver
+        mock_result = MagicMock()
+        mock_result.single.return_value = {"rows": []}
+        session.run.return_value = mock_result
+
+        columns = get_entities_columnar(driver, entity_type, ["id", "name"])
+
+        assert set(columns) == {"id", "name"}
+        assert len(columns["id"]) == 0
@@ -0,0 +1,243 @@
+"""
+Tests for generic database operations (relationships).
+"""
+
+import pytest
+from unittest.mock import MagicMock
+from database.queries.generic_relationship import (
+    create_relationships_bulk,
+    get_relationship_edges,
+    get_targets_with_incoming,
+    get_relationships_to_entity,
+    ConstraintViolationError,
+    RelationshipValidationError
+)
+from core.entity import EntityTypeDefinition
+from core.relationship import RelationshipTypeDefinition
+from core.attribute import AttributeDefinition, AttributeType
+
+@pytest.fixture
+def risk_type():
+    """Source entity type for testing."""
+    return EntityTypeDefinition(id="risk", label="Risk", neo4j_label="Risk")
+
+@pytest.fixture
+def tpo_type():
+    """Target entity type for testing."""
+    return EntityTypeDefinition(id="tpo", label="TPO", neo4j_label="ContextNode")
+
+@pytest.fixture
+def rel_type():
+    """Simple relationship type for testing."""
+    return RelationshipTypeDefinition(
+        id="impacts_tpo",
+        label="Impacts TPO",
+        neo4j_type="IMPACTS_TPO",
+        from_entity_types=["risk"],
+        to_entity_types=["tpo"],
+        attributes=[
+            AttributeDefinition(name="impact_level", type=AttributeType.STRING, required=True),
+            AttributeDefinition(name="description", type=AttributeType.STRING, required=False)
+        ]
+    )
+
+class TestGenericRelationshipBulk:
+    """Tests for bulk relationship creation."""
+
+    def test_create_bulk_single_round_trip(self, mock_driver, rel_type, risk_type, tpo_type):
+        """All rows are sent in one UNWIND query."""
+        driver, session = mock_driver
+
+        mock_records = [
+            {"r": {"id": "i1", "impact_level": "High"}, "relId": "e1",
+             "source_id": "r1", "target_id": "t1"},
+            {"r": {"id": "i2", "impact_level": "Low"}, "relId": "e2",
+             "source_id": "r2", "target_id": "t1"},
+        ]
+        mock_result = MagicMock()
+        mock_result.__iter__.return_value = iter(mock_records)
+        session.run.return_value = mock_result
+
+        rows = [
+            {"source_id": "r1", "target_id": "t1", "impact_level": "High", "id": "i1"},
+            {"source_id": "r2", "target_id": "t1", "impact_level": "Low"},
+        ]
+        created = create_relationships_bulk(driver, rel_type, rows, risk_type, tpo_type)
+
+        assert session.run.call_count == 1
+        query, params = session.run.call_args[0]
+        assert "UNWIND $rows AS row" in query
+        assert "CREATE (a)-[r:IMPACTS_TPO]->(b)" in query
+        assert len(params["rows"]) == 2
+        assert params["rows"][0]["props"] == {"impact_level": "High", "id": "i1"}
+        assert "id" in params["rows"][1]["props"]
+        assert "source_id" not in params["rows"][1]["props"]
+        assert [r["source_id"] for r in created] == ["r1", "r2"]
+        assert created[0]["_element_id"] == "e1"
+
+    def test_create_bulk_empty_rows(self, mock_driver, rel_type, risk_type, tpo_type):
+        """No query is issued for an empty batch."""
+        driver, session = mock_driver
+
+        assert create_relationships_bulk(driver, rel_type, [], risk_type, tpo_type) == []
+        session.run.assert_not_called()
+
+    def test_create_bulk_constraint_violation(self, mock_driver, rel_type, risk_type, tpo_type):
+        """Wrong endpoint types are rejected before any query."""
+        driver, session = mock_driver
+
+        with pytest.raises(ConstraintViolationError):
+            create_relationships_bulk(
+                driver, rel_type, [{"source_id": "t1", "target_id": "r1"}], tpo_type, risk_type
+            )
+        session.run.assert_not_called()
+
+    def test_create_bulk_validation_failure(self, mock_driver, rel_type, risk_type, tpo_type):
+        """A single invalid row fails the whole batch."""
+        driver, session = mock_driver
+
+        rows = [
+            {"source_id": "r1", "target_id": "t1", "impact_level": "High"},
+            {"source_id": "r2", "target_id": "t1"},
+        ]
+        with pytest.raises(RelationshipValidationError, match="row 1"):
+            create_relationships_bulk(driver, rel_type, rows, risk_type, tpo_type)
+        session.run.assert_not_called()
+
+
+class TestGenericRelationshipEdges:
+    """Tests for the thin edge projection."""
+
+    def test_edges_project_only_requested_properties(self, mock_driver, rel_type):
+        """No node bodies are requested, only ids and listed properties."""
+        driver, session = mock_driver
+
+        mock_result = MagicMock()
+        mock_result.single.return_value = {"types": ["IMPACTS_TPO"]}
+        mock_result.__iter__.return_value = iter([
+            {"id": "i1", "source_id": "r1", "target_id": "t1", "impact_level": "High"}
+        ])
+        session.run.return_value = mock_result
+
+        edges = get_relationship_edges(driver, rel_type, ["impact_level"])
+
+        assert edges == [{"id": "i1", "source_id": "r1", "target_id": "t1", "impact_level": "High"}]
+        query = session.run.call_args[0][0]
+        assert "r.impact_level as impact_level" in query
+        assert "RETURN r," not in query
+        assert "LIMIT" not in query
+
+    def test_edges_keyset_pagination(self, mock_driver, rel_type):
+        """Pages are ordered by id and resume after the last seen id."""
+        driver, session = mock_driver
+
+        mock_result = MagicMock()
+        mock_result.single.return_value = {"types": ["IMPACTS_TPO"]}
+        mock_result.__iter__.return_value = iter([])
+        session.run.return_value = mock_result
+
+        get_relationship_edges(driver, rel_type, limit=50, after_id="i9")
+
+        query, params = session.run.call_args[0]
+        assert "WHERE r.id > $after_id" in query
+        assert "ORDER BY r.id LIMIT $limit" in query
+        assert params == {"after_id": "i9", "limit": 50}
+
+    def test_edges_missing_type_short_circuits(self, mock_driver, rel_type):
+        """A type not yet persisted returns [] after the guard query."""
+        driver, session = mock_driver
+
+        mock_result = MagicMock()
+        mock_result.single.return_value = {"types": ["INFLUENCES"]}
+        session.run.return_value = mock_result
+
+        assert get_relationship_edges(driver, rel_type) == []
+        assert session.run.call_count == 1
+
+
+class TestGenericTargetsWithIncoming:
+    """Tests for the fused targets + incoming relationships query."""
+
+    def test_targets_with_incoming_single_query(self, mock_driver, rel_type, tpo_type):
+        """Targets and their incoming edges come back from one query."""
+        driver, session = mock_driver
+        tpo_type.is_context_node = True
+
+        mock_result = MagicMock()
+        mock_result.__iter__.return_value = iter([
+            {"b": {"id": "t1", "name": "TPO 1"}, "nodeId": "n1",
+             "incoming": [{"id": "i1", "source_id": "r1", "target_id": "t1", "impact_level": "High"}]},
+            {"b": {"id": "t2", "name": "TPO 2"}, "nodeId": "n2", "incoming": []},
+        ])
+        session.run.return_value = mock_result
+
+        tpos = get_targets_with_incoming(driver, rel_type, tpo_type, properties=["impact_level"])
+
+        assert session.run.call_count == 1
+        query, params = session.run.call_args[0]
+        assert "OPTIONAL MATCH (a)-[r:IMPACTS_TPO]->(b)" in query
+        assert "impact_level: r.impact_level" in query
+        assert params == {"__node_type": "tpo"}
+        assert tpos[0]["_incoming"][0]["source_id"] == "r1"
+        assert tpos[1]["_incoming"] == []
+
+    def test_targets_restricted_to_sources(self, mock_driver, rel_type, tpo_type):
+        """With source_ids only connected targets are matched."""
+        driver, session = mock_driver
+
+        mock_result = MagicMock()
+        mock_result.__iter__.return_value = iter([])
+        session.run.return_value = mock_result
+
+        get_targets_with_incoming(driver, rel_type, tpo_type, source_ids=["r1", "r2"])
+
+        query, params = session.run.call_args[0]
+        assert "OPTIONAL MATCH" not in query
+        assert "WHERE a.id IN $source_ids" in query
+        assert params["source_ids"] == ["r1", "r2"]
+
+    def test_targets_empty_sources_short_circuits(self, mock_driver, rel_type, tpo_type):
+        """An empty source list cannot match anything."""
+        driver, session = mock_driver
+
+        assert get_targets_with_incoming(driver, rel_type, tpo_type, source_ids=[]) == []
+        session.run.assert_not_called()
+
+
+class TestGenericRelationshipsToEntity:
+    """Tests for incoming relationship reads with top-K pushdown."""
+
+    def test_order_and_limit_pushed_down(self, mock_driver, rel_type):
+        """ORDER BY and LIMIT are part of the query, not applied client-side."""
+        driver, session = mock_driver
+        mock_result = MagicMock()
+        mock_result.__iter__.return_value = iter([])
+        session.run.return_value = mock_result
+
+        get_relationships_to_entity(driver, rel_type, "t1", order_by_source="exposure", limit=10)
+
+        query, params = session.run.call_args[0]
+        assert "ORDER BY a.exposure DESC" in query
+        assert query.index("ORDER BY") < query.index("LIMIT $limit")
+        assert params == {"entity_id": "t1", "limit": 10}
+
+    def test_no_pushdown_by_default(self, mock_driver, rel_type):
+        """Without options the query is unordered and unbounded."""
+        driver, session = mock_driver
+        mock_result = MagicMock()
+        mock_result.__iter__.return_value = iter([])
+        session.run.return_value = mock_result
+
+        get_relationships_to_entity(driver, rel_type, "t1")
+
+        query, params = session.run.call_args[0]
+        assert "ORDER BY" not in query and "LIMIT" not in query
+        assert params == {"entity_id": "t1"}
+
+    def test_rejects_unsafe_order_property(self, mock_driver, rel_type):
+        """The order property is interpolated, so it must be an identifier."""
+        driver, session = mock_driver
+
+        with pytest.raises(ValueError):
+            get_relationships_to_entity(driver, rel_type, "t1", order_by_source="x DESC; MATCH (n)")
+        session.run.assert_not_called()
@@ -0,0 +1,47 @@
+"""
+Tests for schema-derived index management.
+"""
+
+import pytest
+from unittest.mock import MagicMock
+from database.queries.indexes import get_index_statements, ensure_indexes
+
+
+pytestmark = pytest.mark.usefixtures("default_registry")
+
+
+class TestIndexes:
+    """Tests for index DDL generation and creation."""
+
+    def test_statements_cover_kernel_and_context_labels(self):
+        """Every node label and relationship type gets an id index."""
+        statements = dict(get_index_statements())
+
+        assert "FOR (n:Risk) ON (n.id)" in statements["rim_risk_id"]
+        assert "FOR (n:Mitigation) ON (n.id)" in statements["rim_mitigation_id"]
+        assert "FOR (n:ContextNode) ON (n.node_type)" in statements["rim_contextnode_node_type"]
+        assert "FOR ()-[r:INFLUENCES]-() ON (r.id)" in statements["rim_influences_id"]
+        assert all("IF NOT EXISTS" in s for s in statements.values())
+
+    def test_statements_are_unique(self):
+        """Shared labels (ContextNode) only produce one index each."""
+        names = [name for name, _ in get_index_statements()]
+        assert len(names) == len(set(names))
+
+    def test_ensure_indexes_continues_after_failure(self):
+        """A failing statement does not stop the remaining ones."""
+        conn = MagicMock()
+        conn.execute_query.side_effect = [Exception("no privilege")] + [[]] * 100
+
+        failures = ensure_indexes(conn)
+
+        first_name = get_index_statements()[0][0]
+        assert conn.execute_query.call_count == len(get_index_statements())
+        assert failures == {first_name: "no privilege"}
+
+    def test_ensure_indexes_reports_nothing_when_all_succeed(self):
+        """No failures are reported when every statement runs."""
+        conn = MagicMock()
+        conn.execute_query.return_value = []
+
+        assert ensure_indexes(conn) == {}
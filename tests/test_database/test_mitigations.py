@@ -0,0 +1,25 @@
+"""
+Tests for mitigation queries.
+"""
+
+from unittest.mock import MagicMock
+from database.queries.mitigations import get_all_mitigations
+
+
+class TestGetAllMitigations:
+    """Tests for the filtered mitigation listing."""
+
+    def test_filtered_and_unfiltered_share_query_text(self):
+        """Filters only change parameters, never the Cypher text."""
+        conn = MagicMock()
+        conn.execute_read.return_value = []
+
+        get_all_mitigations(conn)
+        get_all_mitigations(conn, type_filter=["Dedicated"], status_filter=[])
+
+        (q1,), p1 = conn.execute_read.call_args_list[0]
+        (q2,), p2 = conn.execute_read.call_args_list[1]
+        assert q1 == q2
+        assert "$types IS NULL OR m.type IN $types" in q1
+        assert p1 == {"types": None, "statuses": None}
+        assert p2 == {"types": ["Dedicated"], "statuses": None}
@@ -6,11 +6,16 @@ Tests the ExposureCalculator service and related data classes.
 
 import pytest
 from datetime import datetime
+from unittest.mock import patch
 from services.exposure_calculator import (
     ExposureCalculator,
     RiskExposureResult,
     GlobalExposureResult,
+    calculate_risk_exposures,
+    calculate_exposure,
+    clear_exposure_cache,
 )
+from models.risk import Risk
 
 
 class TestRiskExposureResult:
@@ -68,6 +73,20 @@ class TestRiskExposureResult:
         assert "tail_risk_indicator" in data
         assert "risk_quadrant" in data
 
+    def test_no_instance_dict(self):
+        """Test results use __slots__ where the interpreter supports it."""
+        import sys
+        if sys.version_info < (3, 10):
+            pytest.skip("dataclass slots need Python 3.10+")
+        result = RiskExposureResult(
+            risk_id="r", risk_name="R", level="Business", likelihood=1.0, severity=1.0,
+            base_exposure=1.0, mitigation_factor=1.0, mitigated_exposure=1.0,
+            mitigation_count=0, influence_limitation=0.0, effective_mitigation_factor=1.0,
+            upstream_risk_count=0, final_exposure=1.0,
+        )
+        
+        assert not hasattr(result, "__dict__")
+
 
 class TestGlobalExposureResult:
     """Tests for GlobalExposureResult dataclass."""
@@ -120,6 +139,45 @@ class TestGlobalExposureResult:
         assert data["residual_risk_percentage"] == 45.5
         assert "calculated_at" in data
     
+    def test_summary_dict_omits_risk_results(self, sample_risk_network):
+        """Test summary_dict is to_dict without the per-risk details."""
+        result = ExposureCalculator(
+            risks=sample_risk_network["risks"],
+            influences=sample_risk_network["influences"],
+            mitigations=sample_risk_network["mitigations"],
+            mitigates_relationships=sample_risk_network["mitigates_relationships"]
+        ).calculate_all()
+        
+        full = result.to_dict()
+        summary = result.summary_dict()
+        
+        assert "risk_results" not in summary
+        assert {k: v for k, v in full.items() if k != "risk_results"} == summary
+        assert full["risk_results"] == [r.to_dict() for r in result.risk_results]
+        assert result.to_dict()["risk_results"] is full["risk_results"]
+    
+    def test_calculated_at_defaults_to_now(self):
+        """Test the timestamp is taken at creation and serialized as ISO."""
+        before = datetime.now()
+        result = GlobalExposureResult(
+            residual_risk_percentage=0.0,
+            weighted_risk_score=0.0,
+            max_single_exposure=0.0,
+            max_exposure_risk_id="",
+            max_exposure_risk_name="",
+            total_base_exposure=0.0,
+            total_final_exposure=0.0,
+            total_risks=0,
+            risks_with_data=0,
+            strategic_exposure=0.0,
+            operational_exposure=0.0,
+            mitigated_risks_count=0,
+            unmitigated_risks_count=0,
+        )
+        
+        stamp = datetime.fromisoformat(result.to_dict()["calculated_at"])
+        assert before.replace(microsecond=0) <= stamp <= datetime.now()
+    
     def test_get_health_status_excellent(self):
         """Test health status for low risk score."""
         result = GlobalExposureResult(
@@ -299,6 +357,112 @@ class TestExposureCalculatorCalculations:
         assert results.total_risks == 0
         assert results.residual_risk_percentage == 0.0
 
+    def test_calculation_order_is_topological(self):
+        """Test upstream risks come first and cycle members are appended last."""
+        risks = [{"id": rid, "name": rid} for rid in ("d", "c", "b", "a", "x", "y")]
+        influences = [
+            {"source_id": "a", "target_id": "b"},
+            {"source_id": "a", "target_id": "c"},
+            {"source_id": "b", "target_id": "d"},
+            {"source_id": "c", "target_id": "d"},
+            {"source_id": "x", "target_id": "y"},
+            {"source_id": "y", "target_id": "x"},
+        ]
+        calc = ExposureCalculator(risks, influences, [], [])
+        
+        order = calc._get_calculation_order()
+        
+        assert sorted(order) == sorted(calc.risks)
+        assert order.index("a") < order.index("b") < order.index("d")
+        assert order.index("c") < order.index("d")
+        assert order[-2:] == ["x", "y"]
+
+    def test_ready_risks_are_ordered_like_risks(self):
+        """Test risks released together keep risk order, whatever the edge order."""
+        risks = [
+            {"id": rid, "name": rid.upper(), "probability": 5, "severity": 4}
+            for rid in ("a", "b", "c", "d")
+        ]
+        influences = [
+            {"source_id": "a", "target_id": "d", "strength": "Weak"},
+            {"source_id": "a", "target_id": "c", "strength": "Weak"},
+            {"source_id": "a", "target_id": "b", "strength": "Weak"},
+        ]
+        
+        result = ExposureCalculator(risks, influences, [], []).calculate_all()
+        
+        assert [r.risk_id for r in result.risk_results] == ["a", "b", "c", "d"]
+        # Equal exposures everywhere: the first risk in that order is the max
+        assert result.max_exposure_risk_id == "a"
+
+    def test_calculate_all_matches_scalar_path(self):
+        """Test the array pass equals calculate_risk_exposure run risk by risk."""
+        import random
+        rng = random.Random(7)
+        risks = [
+            {"id": f"r{i}", "name": f"Risk {i}", "level": rng.choice(["Strategic", "Operational"]),
+             "probability": rng.choice([0, None, 1, 3.5, 7, 10]),
+             "severity": rng.choice([0, 2, 5.5, 9])}
+            for i in range(60)
+        ]
+        influences = [
+            {"source_id": f"r{rng.randrange(60)}", "target_id": f"r{rng.randrange(60)}",
+             "strength": rng.choice(["Critical", "Strong", "Moderate", "Weak", "Odd"])}
+            for _ in range(150)
+        ] + [{"source_id": "ghost", "target_id": "r1", "strength": "Strong"}]
+        mitigates = [
+            {"risk_id": f"r{rng.randrange(60)}", "mitigation_id": "m1",
+             "effectiveness": rng.choice(["Critical", "High", "Medium", "Low"])}
+            for _ in range(40)
+        ]
+        calc = ExposureCalculator(risks, influences, [{"id": "m1"}], mitigates)
+        
+        expected = {}
+        for rid in calc._get_calculation_order():
+            result = calc.calculate_risk_exposure(rid, expected)
+            if result:
+                expected[rid] = result
+        
+        calc.calculate_all()
+        
+        assert list(calc.risk_results) == list(expected)
+        for rid, result in expected.items():
+            assert calc.risk_results[rid] == result
+
+    def test_numba_kernel_matches_numpy_pass(self):
+        """Test the Numba propagation kernel reproduces the NumPy pass exactly."""
+        pytest.importorskip("numba")
+        import random
+        import numpy as np
+        from services.exposure_calculator import _propagate_exposures
+        rng = random.Random(11)
+        risks = [
+            {"id": f"r{i}", "name": f"Risk {i}",
+             "probability": rng.choice([0, 2, 6.5]), "severity": rng.choice([1, 4, 8])}
+            for i in range(80)
+        ]
+        influences = [
+            {"source_id": f"r{rng.randrange(80)}", "target_id": f"r{rng.randrange(80)}",
+             "strength": rng.choice(["Critical", "Weak"])}
+            for _ in range(200)
+        ]
+        mitigates = [
+            {"risk_id": f"r{rng.randrange(80)}", "effectiveness": "High"} for _ in range(30)
+        ]
+        calc = ExposureCalculator(risks, influences, [], mitigates)
+        layers = calc._get_calculation_layers()
+        base = np.array([(r["probability"] * r["severity"]) for r in risks], dtype=np.float64)
+        has_data = base != 0
+        mit = np.array([calc.mit_factor[r["id"]] for r in risks])
+        args = (layers, base, has_data, mit, calc.edge_source_idx,
+                calc.edge_target_idx, calc.edge_strength, calc.edge_ptr)
+        
+        with_numpy = _propagate_exposures(*args, use_numba=False)
+        with_numba = _propagate_exposures(*args, use_numba=True)
+        
+        for a, b in zip(with_numpy, with_numba):
+            assert np.array_equal(a, b)
+
 
 class TestExposureCalculatorIntegration:
     """Integration tests for full exposure calculation."""
@@ -349,3 +513,125 @@ class TestExposureCalculatorIntegration:
         results = calc.calculate_all()
         
         assert 0 <= results.weighted_risk_score <= 100
+
+    def test_level_breakdown(self):
+        """Test strategic/operational sums ignore other levels."""
+        risks = [
+            {"id": "s", "name": "S", "level": "Strategic", "probability": 2, "severity": 3},
+            {"id": "o", "name": "O", "level": "Operational", "probability": 4, "severity": 5},
+            {"id": "b", "name": "B", "level": "Business", "probability": 1, "severity": 1},
+        ]
+        results = ExposureCalculator(risks, [], [], []).calculate_all()
+        
+        assert results.strategic_exposure == 6.0
+        assert results.operational_exposure == 20.0
+        assert results.total_final_exposure == 27.0
+
+    def test_global_metrics_match_per_result_sums(self, sample_risk_network):
+        """Test aggregated metrics equal sums over the individual results."""
+        results = ExposureCalculator(
+            risks=sample_risk_network["risks"],
+            influences=sample_risk_network["influences"],
+            mitigations=sample_risk_network["mitigations"],
+            mitigates_relationships=sample_risk_network["mitigates_relationships"]
+        ).calculate_all()
+        rows = results.risk_results
+        
+        weighted = sum(r.final_exposure * r.severity ** 2 for r in rows)
+        max_weighted = sum(100.0 * r.severity ** 2 for r in rows)
+        assert results.total_base_exposure == pytest.approx(sum(r.base_exposure for r in rows))
+        assert results.total_final_exposure == pytest.approx(sum(r.final_exposure for r in rows))
+        assert results.weighted_risk_score == pytest.approx(weighted / max_weighted * 100)
+        assert results.mitigated_risks_count == sum(1 for r in rows if r.mitigation_count)
+
+    def test_max_exposure_keeps_first_of_ties(self):
+        """Test the max-exposure risk is the first one reaching the maximum."""
+        risks = [
+            {"id": "a", "name": "A", "probability": 2, "severity": 3},
+            {"id": "b", "name": "B", "probability": 3, "severity": 4},
+            {"id": "c", "name": "C", "probability": 4, "severity": 3},
+        ]
+        results = ExposureCalculator(risks, [], [], []).calculate_all()
+        
+        assert results.max_single_exposure == 12.0
+        assert results.max_exposure_risk_id == "b"
+
+
+class TestCalculateExposureCache:
+    """Tests for memoized calculate_exposure calls."""
+    
+    def setup_method(self):
+        clear_exposure_cache()
+    
+    def test_identical_inputs_reuse_result(self, sample_risk_network):
+        """Test a repeated call with equal data returns the cached result."""
+        args = (
+            sample_risk_network["risks"], sample_risk_network["influences"],
+            sample_risk_network["mitigations"], sample_risk_network["mitigates_relationships"],
+        )
+        
+        first = calculate_exposure(*args, cached=True)
+        
+        with patch.object(ExposureCalculator, "calculate_all") as calculate_all:
+            second = calculate_exposure(*args, cached=True)
+        
+        calculate_all.assert_not_called()
+        assert second is not first
+        summary = lambda res: {k: v for k, v in res.summary_dict().items() if k != "calculated_at"}
+        assert summary(second) == summary(first)
+        assert second.to_dict()["risk_results"] == first.to_dict()["risk_results"]
+    
+    def test_cache_hits_are_independent_and_restamped(self, sample_risk_network):
+        """Test each cached call gets its own objects and calculation time."""
+        args = (
+            sample_risk_network["risks"], sample_risk_network["influences"],
+            sample_risk_network["mitigations"], sample_risk_network["mitigates_relationships"],
+        )
+        first = calculate_exposure(*args, cached=True)
+        first_dict = first.to_dict()
+        first_dict["risk_results"][0]["final_exposure"] = -1
+        first.risk_results[0].trace.append("edited")
+        
+        with patch("services.exposure_calculator.time.time_ns", return_value=first.calculated_at_ns + 10**9):
+            second = calculate_exposure(*args, cached=True)
+        
+        assert second.calculated_at_ns == first.calculated_at_ns + 10**9
+        assert second.to_dict()["calculated_at"] != first_dict["calculated_at"]
+        assert second.to_dict()["risk_results"][0]["final_exposure"] != -1
+        assert "edited" not in second.risk_results[0].trace
+    
+    def test_changed_input_recalculates(self, sample_risk_network):
+        """Test a changed score misses the cache."""
+        risks = [dict(r) for r in sample_risk_network["risks"]]
+        first = calculate_exposure(risks, [], [], [], cached=True)
+        risks[0]["severity"] = 1
+        
+        second = calculate_exposure(risks, [], [], [], cached=True)
+        
+        assert second is not first
+        assert second.total_base_exposure != first.total_base_exposure
+
+
+class TestBatchRiskExposures:
+    """Tests for the vectorized Risk exposure helper."""
+    
+    def test_matches_per_risk_calculation(self):
+        """Test batch results equal Risk.calculate_exposure per instance."""
+        risks = [
+            Risk(id="1", name="A", level="Business", probability=2.5, severity=4.0),
+            Risk(id="2", name="B", level="Business", probability=None, severity=4.0),
+            Risk(id="3", name="C", level="Operational", probability=0.0, severity=7.0),
+        ]
+        expected = [
+            Risk(id=r.id, name=r.name, level=r.level,
+                 probability=r.probability, severity=r.severity).calculate_exposure()
+            for r in risks
+        ]
+        
+        assert calculate_risk_exposures(risks) == expected == [10.0, None, 0.0]
+        assert risks[0].exposure == 10.0
+        assert risks[1].exposure is None
+    
+    def test_empty_batch(self):
+        """Test an empty batch returns an empty list."""
+        assert calculate_risk_exposures([]) == []
@@ -126,6 +126,160 @@ class TestExportService:
         # Must succeed even without context params
         assert result is not None
 
+    def test_export_engine_selection(self):
+        """fast=True streams through xlsxwriter; fast=False keeps openpyxl."""
+        import pandas as pd
+        from services.export_service import _open_excel_writer
+
+        with _open_excel_writer(io.BytesIO(), fast=True) as writer:
+            assert writer.engine == "xlsxwriter"
+            pd.DataFrame([{"a": 1}]).to_excel(writer, sheet_name="S", index=False)
+        with _open_excel_writer(io.BytesIO(), fast=False) as writer:
+            assert writer.engine == "openpyxl"
+            pd.DataFrame([{"a": 1}]).to_excel(writer, sheet_name="S", index=False)
+
+    def test_fast_writer_matches_pandas_output(self):
+        """The record-based writer produces the same cells as the DataFrame path."""
+        pytest.importorskip("rustpy_xlsxwriter")
+        import openpyxl
+        from services.export_service import export_to_excel_bytes
+
+        data = dict(
+            risks=[
+                {"id": "r1", "name": "A", "level": "Business", "categories": ["x"],
+                 "all_props": {}, "ext_cost": None, "subtype": "S", "exposure": 2.5},
+                {"id": "r2", "name": "B", "level": "Operational", "categories": [],
+                 "all_props": {}, "ext_cost": None, "ext_owner": "O", "exposure": None},
+            ],
+            influences=[{"source_id": "r1", "target_id": "r2", "strength": "Strong"}],
+            mitigations=[], mitigates_relationships=[],
+            context_nodes_data={"scenario": [{"id": "s1", "name": "S1", "notes": None}]},
+            context_edges_data={"depends_on": [
+                {"id": "e1", "weight": 1, "target_name": "T", "source_name": "S"}
+            ]},
+        )
+
+        def cells(blob):
+            wb = openpyxl.load_workbook(io.BytesIO(blob))
+            return {ws.title: [[c.value for c in row] for row in ws.iter_rows()] for ws in wb}
+
+        fast = cells(export_to_excel_bytes(**data, fast=True))
+        slow = cells(export_to_excel_bytes(**data, fast=False))
+        assert fast == slow
+        assert fast["Risks"][0] == ["id", "name", "level", "categories", "exposure", "subtype", "ext_owner"]
+
+    def test_fast_writer_ignores_file_extension(self, tmp_path):
+        """export_to_excel writes xlsx whatever the target path's extension."""
+        pytest.importorskip("rustpy_xlsxwriter")
+        import openpyxl
+        from services.export_service import export_to_excel
+
+        target = tmp_path / "export.csv"
+        assert export_to_excel(
+            str(target),
+            risks=[{"id": "r1", "name": "Risk A", "level": "Business"}],
+            influences=[], mitigations=[], mitigates_relationships=[],
+        )
+        # openpyxl refuses a .csv path, so read the bytes; they must be a zip (xlsx)
+        wb = openpyxl.load_workbook(io.BytesIO(target.read_bytes()))
+        assert wb["Risks"]["B2"].value == "Risk A"
+
+    def test_streaming_writers_match_write_only_openpyxl(self):
+        """xlsxwriter rows and the openpyxl write-only workbook hold the same cells."""
+        import datetime
+        import openpyxl
+        from services.export_service import export_to_excel_bytes
+
+        data = dict(
+            risks=[{"id": "r1", "name": "A", "categories": ["x", "y"], "score": float("nan"),
+                    "created_at": datetime.datetime(2024, 1, 2, 3, 4, 5), "exposure": 1.5}],
+            influences=[], mitigations=[], mitigates_relationships=[],
+        )
+
+        def cells(blob):
+            wb = openpyxl.load_workbook(io.BytesIO(blob))
+            return {ws.title: [[c.value for c in row] for row in ws.iter_rows()] for ws in wb}
+
+        with patch.dict("sys.modules", {"rustpy_xlsxwriter": None}):
+            streamed = cells(export_to_excel_bytes(**data, fast=True))
+        write_only = cells(export_to_excel_bytes(**data, fast=False))
+        assert streamed == write_only
+        assert write_only["Risks"][1][2] == "['x', 'y']"
+        assert write_only["Risks"][1][3] is None
+
+    def test_export_falls_back_without_xlsxwriter(self):
+        """Missing optional writers degrade to openpyxl instead of failing."""
+        import openpyxl
+        from services.export_service import export_to_excel_bytes
+
+        with patch.dict("sys.modules", {"xlsxwriter": None, "rustpy_xlsxwriter": None}):
+            result = export_to_excel_bytes(
+                risks=[{"id": "r1", "name": "Risk A", "level": "Business"}],
+                influences=[], mitigations=[], mitigates_relationships=[],
+            )
+        wb = openpyxl.load_workbook(io.BytesIO(result))
+        assert wb["Risks"]["B2"].value == "Risk A"
+
+    def test_export_to_csv_zip_one_member_per_sheet(self):
+        """Each sheet becomes a CSV member with the Excel columns."""
+        import csv
+        import zipfile
+        from services.export_service import export_to_csv_zip
+
+        buf = io.BytesIO()
+        assert export_to_csv_zip(
+            buf,
+            risks=[{"id": "r1", "name": "Risk, A", "categories": ["x"], "all_props": {}}],
+            influences=[], mitigations=[], mitigates_relationships=[],
+            context_nodes_data={"scenario": [{"id": "s1", "name": "S1"}]},
+        )
+        with zipfile.ZipFile(buf) as archive:
+            assert sorted(archive.namelist()) == ["CN_scenario.csv", "Risks.csv"]
+            rows = list(csv.reader(io.TextIOWrapper(archive.open("Risks.csv"), encoding="utf-8")))
+        assert rows == [["id", "name", "categories"], ["r1", "Risk, A", "['x']"]]
+
+    def test_export_to_parquet_keeps_native_types(self, tmp_path):
+        """Parquet files keep lists and numbers; mixed columns fall back to strings."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        from services.export_service import export_to_parquet
+
+        assert export_to_parquet(
+            str(tmp_path / "out"),
+            risks=[
+                {"id": "r1", "categories": ["x", "y"], "exposure": 2.5, "ext_code": 7},
+                {"id": "r2", "categories": [], "exposure": None, "ext_code": "B"},
+            ],
+            influences=[{"source_id": "r1", "target_id": "r2"}],
+            mitigations=[], mitigates_relationships=[],
+        )
+        assert sorted(p.name for p in (tmp_path / "out").iterdir()) == [
+            "Influences.parquet", "Risks.parquet"
+        ]
+        table = pq.read_table(tmp_path / "out" / "Risks.parquet").to_pydict()
+        assert table["categories"] == [["x", "y"], []]
+        assert table["exposure"] == [2.5, None]
+        assert table["ext_code"] == ["7", "B"]
+
+    def test_analysis_report_selects_unmitigated_columns(self, tmp_path):
+        """Only the key risk columns that exist reach the Unmitigated Risks sheet."""
+        import openpyxl
+        from services.export_service import export_analysis_report
+
+        path = tmp_path / "report.xlsx"
+        assert export_analysis_report(
+            str(path),
+            influence_analysis={"top_propagators": [{"name": "A", "score": 3}]},
+            mitigation_analysis={"unmitigated_risks": [
+                {"id": "r1", "name": "A", "level": "Business", "exposure": 4.0},
+                {"id": "r2", "name": "B", "level": "Operational"},
+            ]},
+            coverage_gaps={},
+        )
+        ws = openpyxl.load_workbook(path)["Unmitigated Risks"]
+        assert [[c.value for c in row] for row in ws.iter_rows()] == [
+            ["name", "level", "exposure"], ["A", "Business", 4], ["B", "Operational", None]
+        ]
+
 
 # ===========================================================================
 # 2. ImportResult – context counters
@@ -150,6 +304,49 @@ class TestImportResult:
         assert d["context_edges_created"] == 2
         assert d["context_edges_skipped"] == 0
 
+    def test_merge_adds_counters_and_appends_messages(self):
+        """merge() folds a partial result into the running one."""
+        from services.import_service import ImportResult
+
+        total = ImportResult(risks_created=1, warnings=["w1"])
+        partial = ImportResult(risks_created=2, mitigations_skipped=1, warnings=["w2"])
+        partial.log("l")
+        total.merge(partial)
+
+        assert (total.risks_created, total.mitigations_skipped) == (3, 1)
+        assert total.warnings == ["w1", "w2"]
+        assert [line.split(" ", 1)[1] for line in total.logs] == ["INFO: l"]
+
+    def test_logs_are_bounded_and_details_gated_by_verbose(self):
+        """Old lines fall off past the limit; debug() only logs when verbose."""
+        from services.import_service import ImportResult, IMPORT_LOG_LIMIT
+
+        r = ImportResult()
+        for i in range(IMPORT_LOG_LIMIT + 5):
+            r.log(f"line {i}")
+        r.debug("row %s", "hidden")
+        d = r.to_dict()
+        assert isinstance(d["logs"], list)
+        assert len(d["logs"]) == IMPORT_LOG_LIMIT
+        assert d["logs"][-1].endswith(f"INFO: line {IMPORT_LOG_LIMIT + 4}")
+
+        verbose = ImportResult(verbose=True)
+        verbose.debug("row %s", "shown")
+        assert verbose.logs[-1].endswith("DEBUG: row shown")
+
+    def test_to_dict_is_derived_from_fields(self):
+        """to_dict() lists every counter and message field, nothing internal."""
+        import sys
+        from dataclasses import fields
+        from services.import_service import ImportResult
+
+        r = ImportResult()
+        expected = [f.name for f in fields(ImportResult) if f.name != "verbose"]
+        assert list(r.to_dict()) == expected
+        assert expected[:2] == ["risks_created", "risks_skipped"]
+        if sys.version_info >= (3, 10):
+            assert not hasattr(r, "__dict__")
+
     def test_default_context_counters_are_zero(self):
         """ImportResult must default all context counters to 0."""
         from services.import_service import ImportResult
@@ -186,6 +383,7 @@ class TestImportContextNodes:
 
     def test_unknown_type_is_skipped_with_yaml_snippet(self, tmp_path):
         """CN_ sheet whose type is unknown → [SCHEMA] warning with YAML scaffold."""
+        import pandas as pd
         from services.import_service import ExcelImporter, ImportResult
 
         registry = _make_registry()  # no entity types registered
@@ -207,7 +405,8 @@ class TestImportContextNodes:
         )
 
         result = ImportResult()
-        importer._import_context_nodes(filepath, result)
+        with pd.ExcelFile(filepath) as xl:
+            importer._import_context_nodes(xl, result)
 
         # Should have appended a warning
         assert result.warnings
@@ -220,6 +419,7 @@ class TestImportContextNodes:
 
     def test_unknown_columns_emit_per_sheet_warning(self, tmp_path):
         """Extra columns on a known CN_ sheet emit a one-time [SCHEMA] warning."""
+        import pandas as pd
         from services.import_service import ExcelImporter, ImportResult
 
         registry = _make_registry(extra_entity_types={"scenario": ["name", "description"]})
@@ -242,7 +442,8 @@ class TestImportContextNodes:
         )
 
         result = ImportResult()
-        importer._import_context_nodes(filepath, result)
+        with pd.ExcelFile(filepath) as xl:
+            importer._import_context_nodes(xl, result)
 
         schema_warnings = [w for w in result.warnings if "[SCHEMA]" in w]
         assert schema_warnings
@@ -279,12 +480,51 @@ class TestImportContextNodes:
         p.write_bytes(buf.getvalue())
 
         result = ImportResult()
-        importer._import_context_nodes(str(p), result)
+        with pd.ExcelFile(str(p)) as xl:
+            importer._import_context_nodes(xl, result)
 
         assert result.context_nodes_created == 2
         assert result.context_nodes_skipped == 0
         assert create_fn.call_count == 2
 
+    def test_validation_errors_from_worker_phase_reach_result(self, tmp_path):
+        """Manager validation errors are raised into ImportResult.errors, not st.error."""
+        import functools
+        import pandas as pd
+        from database.manager import RiskGraphManager
+        from database.queries.generic_entity import EntityValidationError
+        from services.import_service import ExcelImporter
+
+        registry = _make_registry(extra_entity_types={"scenario": ["name"]})
+        manager = RiskGraphManager("bolt://unused", "user", "password")
+        manager._connection = MagicMock()
+        importer = ExcelImporter(
+            create_risk_fn=MagicMock(),
+            create_influence_fn=MagicMock(),
+            create_mitigation_fn=MagicMock(),
+            create_mitigates_fn=MagicMock(),
+            get_all_risks_fn=MagicMock(return_value=[]),
+            get_all_mitigations_fn=MagicMock(return_value=[]),
+            create_generic_entity_fn=functools.partial(
+                manager.create_entity, raise_validation_errors=True
+            ),
+            registry=registry,
+        )
+        path = tmp_path / "invalid.xlsx"
+        pd.DataFrame([{"name": "S1"}]).to_excel(path, sheet_name="CN_scenario", index=False)
+
+        with patch("core.get_registry", return_value=registry), \
+                patch("database.queries.generic_entity.create_entity",
+                      side_effect=EntityValidationError("owner is required")), \
+                patch("streamlit.error") as st_error:
+            result = importer.import_from_excel(str(path))
+            # Interactive callers still get the st.error report
+            assert manager.create_entity("scenario", {"name": "S2"}) is None
+
+        assert any("owner is required" in e for e in result.errors)
+        assert result.context_nodes_skipped == 1
+        st_error.assert_called_once_with("owner is required")
+
 
 # ===========================================================================
 # 4. backup_service – export shape + restore round-trip with mocks
@@ -346,3 +586,432 @@ class TestBackupService:
         dumped = json.dumps(data, default=str)
         loaded = json.loads(dumped)
         assert loaded["risks"][0]["name"] == "Risk A"
+
+
+# ===========================================================================
+# 5. ExcelImporter – core sheets end to end
+# ===========================================================================
+
+
+class TestExcelImporterCoreSheets:
+
+    def _write_workbook(self, tmp_path, sheets: dict) -> str:
+        """Write {sheet_name: rows} to a temporary .xlsx and return its path."""
+        import pandas as pd
+
+        p = tmp_path / "core.xlsx"
+        with pd.ExcelWriter(p, engine="openpyxl") as writer:
+            for sheet_name, rows in sheets.items():
+                pd.DataFrame(rows).to_excel(writer, sheet_name=sheet_name, index=False)
+        return str(p)
+
+    def _make_importer(self):
+        """Importer backed by in-memory lists standing in for the database."""
+        from services.import_service import ExcelImporter
+
+        risks, mitigations = [], []
+        influences, mitigates = [], []
+
+        def create_risk(name, **kwargs):
+            risks.append({"id": f"r{len(risks) + 1}", "name": name, **kwargs})
+            return risks[-1]["id"]
+
+        def create_mitigation(name, **kwargs):
+            mitigations.append({"id": f"m{len(mitigations) + 1}", "name": name, **kwargs})
+            return mitigations[-1]["id"]
+
+        def create_influence(**kwargs):
+            influences.append(kwargs)
+            return kwargs
+
+        def create_mitigates(**kwargs):
+            mitigates.append(kwargs)
+            return kwargs
+
+        importer = ExcelImporter(
+            create_risk_fn=create_risk,
+            create_influence_fn=create_influence,
+            create_mitigation_fn=create_mitigation,
+            create_mitigates_fn=create_mitigates,
+            get_all_risks_fn=MagicMock(side_effect=lambda: list(risks)),
+            get_all_mitigations_fn=MagicMock(side_effect=lambda: list(mitigations)),
+        )
+        store = {"risks": risks, "mitigations": mitigations,
+                 "influences": influences, "mitigates": mitigates}
+        return importer, store
+
+    def _core_sheets(self):
+        return {
+            "Risks": [
+                {"name": "R1", "level": "Business", "categories": "['Programme']",
+                 "probability": 4, "severity": 5},
+                {"name": "R2", "level": "Operational", "categories": "Technical, Safety",
+                 "status": "Bogus"},
+                {"name": None, "level": "Business"},
+                {"name": "R4", "level": "Unknown"},
+            ],
+            "Influences": [
+                {"source_name": "R2", "target_name": "R1", "strength": "Strong"},
+                {"source_name": "R2", "target_name": "Ghost"},
+            ],
+            "Mitigations": [
+                {"name": "M1", "type": "Dedicated", "status": "Implemented"},
+            ],
+            "Mitigates": [
+                {"mitigation_name": "M1", "risk_name": "R1", "effectiveness": "High"},
+            ],
+        }
+
+    def test_full_import_creates_core_entities(self, tmp_path):
+        """Valid rows are created; invalid rows are skipped with warnings."""
+        importer, store = self._make_importer()
+        result = importer.import_from_excel(self._write_workbook(tmp_path, self._core_sheets()))
+
+        assert not result.errors
+        assert (result.risks_created, result.risks_skipped) == (2, 2)
+        assert (result.influences_created, result.influences_skipped) == (1, 1)
+        assert (result.mitigations_created, result.mitigations_skipped) == (1, 0)
+        assert (result.mitigates_created, result.mitigates_skipped) == (1, 0)
+
+        r1, r2 = store["risks"]
+        assert r1["categories"] == ["Programme"]
+        assert (r1["probability"], r1["severity"]) == (4.0, 5.0)
+        assert r2["categories"] == ["Technical", "Safety"]
+        assert r2["status"] == "Active"
+        assert store["influences"][0]["source_id"] == "r2"
+        assert store["influences"][0]["target_id"] == "r1"
+        assert store["mitigates"][0]["mitigation_id"] == "m1"
+
+    def test_workbook_is_parsed_once(self, tmp_path):
+        """All sheets are read through a single ExcelFile handle."""
+        import pandas as pd
+
+        importer, _ = self._make_importer()
+        path = self._write_workbook(tmp_path, self._core_sheets())
+
+        with patch("pandas.ExcelFile", wraps=pd.ExcelFile) as excel_file:
+            result = importer.import_from_excel(path)
+
+        assert excel_file.call_count == 1
+        assert result.risks_created == 2
+
+    def test_invalid_rows_are_reported_without_creating(self, tmp_path):
+        """Rows failing required-field checks are warned about and never created."""
+        importer, store = self._make_importer()
+        path = self._write_workbook(tmp_path, {
+            "Risks": [
+                {"name": None, "level": "Business"},
+                {"name": "Bad", "level": "Unknown"},
+                {"name": "Good", "level": "Business", "origin": "Legacy"},
+            ],
+            "Mitigations": [{"name": None}, {"name": "M1", "type": "Nope"}],
+        })
+
+        result = importer.import_from_excel(path)
+
+        assert "Row 2: Missing risk name, skipped" in result.warnings
+        assert any(w.startswith("Row 3 (Bad): Invalid level 'Unknown'") for w in result.warnings)
+        assert "Mitigation Row 2: Missing name, skipped" in result.warnings
+        assert [r["name"] for r in store["risks"]] == ["Good"]
+        assert store["risks"][0]["origin"] == "Legacy"
+        assert store["mitigations"][0]["mitigation_type"] == "Dedicated"
+        assert (result.risks_skipped, result.mitigations_skipped) == (2, 1)
+
+    def test_rows_keep_native_types_and_odd_headers(self, tmp_path):
+        """Extension columns keep their scalar type; reserved headers don't break row access."""
+        importer, store = self._make_importer()
+        path = self._write_workbook(tmp_path, {
+            "Risks": [{"_element_id": "4:x:1", "name": "R1", "level": "Business",
+                       "ext_score": 7, "ext_flag": True, "ext_my note": "n"}],
+        })
+
+        result = importer.import_from_excel(path)
+
+        assert result.risks_created == 1
+        ext = store["risks"][0]["ext_fields"]
+        assert ext == {"ext_score": 7, "ext_flag": True, "ext_my note": "n"}
+        assert type(ext["ext_score"]) is int
+
+    def test_bulk_callbacks_batch_relationship_creates(self, tmp_path):
+        """With bulk callbacks, each relationship sheet is created in one call."""
+        importer, store = self._make_importer()
+        influence_batches, mitigates_batches = [], []
+
+        def create_influences_bulk(rows):
+            influence_batches.append(rows)
+            return [r for r in rows if r["target_id"] != "r2"]  # DB already had R1 → R2
+
+        def create_mitigates_bulk(rows):
+            mitigates_batches.append(rows)
+            return rows
+
+        importer.create_influence = MagicMock()
+        importer.create_mitigates = MagicMock()
+        importer.create_influences_bulk = create_influences_bulk
+        importer.create_mitigates_bulk = create_mitigates_bulk
+
+        sheets = self._core_sheets()
+        sheets["Influences"].append({"source_name": "R1", "target_name": "R2"})
+        result = importer.import_from_excel(self._write_workbook(tmp_path, sheets))
+
+        assert not result.errors
+        assert len(influence_batches) == 1 and len(influence_batches[0]) == 2
+        assert influence_batches[0][0]["strength"] == "Strong"
+        assert (result.influences_created, result.influences_skipped) == (1, 2)
+        assert len(mitigates_batches) == 1
+        assert (result.mitigates_created, result.mitigates_skipped) == (1, 0)
+        importer.create_influence.assert_not_called()
+        importer.create_mitigates.assert_not_called()
+
+    def test_name_maps_are_built_without_requerying(self, tmp_path):
+        """Existing rows are read once; created IDs feed relationship resolution."""
+        importer, store = self._make_importer()
+        store["risks"].append({"id": "r-old", "name": "Old"})
+        sheets = self._core_sheets()
+        sheets["Influences"].append({"source_name": "Old", "target_name": "R1"})
+
+        result = importer.import_from_excel(self._write_workbook(tmp_path, sheets))
+
+        assert importer.get_all_risks.call_count == 1
+        assert importer.get_all_mitigations.call_count == 1
+        assert result.influences_created == 2
+        assert {"source_id": "r-old", "target_id": "r2"}.items() <= store["influences"][1].items()
+
+    def test_created_context_nodes_resolve_context_edges(self, tmp_path):
+        """Context edges resolve nodes created in the same import, TPOs also by reference."""
+        importer, _ = self._make_importer()
+        importer.registry = _make_registry(
+            extra_entity_types={"tpo": ["name", "reference"], "scenario": ["name"]},
+            extra_rel_types={"impacts_tpo": []},
+        )
+        importer.create_generic_entity = MagicMock(
+            side_effect=lambda type_id, data: {"id": f"{type_id}-{data['name']}"}
+        )
+        importer.get_generic_entities = MagicMock(return_value=[])
+        importer.create_generic_relationship = MagicMock(return_value={"id": "e1"})
+
+        sheets = self._core_sheets()
+        sheets["CN_tpo"] = [{"name": "Keep schedule", "reference": "TPO-01"}]
+        sheets["CE_impacts_tpo"] = [{"source_name": "R1", "target_name": "TPO-01"}]
+        result = importer.import_from_excel(self._write_workbook(tmp_path, sheets))
+
+        assert result.context_edges_created == 1
+        importer.create_generic_relationship.assert_called_once_with(
+            "impacts_tpo", "r1", "tpo-Keep schedule", {}
+        )
+        # Only the type without a CN_ sheet is read back for edge resolution
+        read_types = [c.args[0] for c in importer.get_generic_entities.call_args_list]
+        assert read_types == ["tpo", "scenario"]
+
+    def test_core_sheets_read_text_columns_as_str(self, tmp_path):
+        """Numeric-looking names are imported as text and still link up."""
+        importer, store = self._make_importer()
+        path = self._write_workbook(tmp_path, {
+            "Risks": [
+                {"name": 2024, "level": "Business", "exposure": 12.5, "id": "stale"},
+                {"name": "R2", "level": "Operational", "exposure": None, "id": None},
+            ],
+            "Influences": [{"source_name": "R2", "target_name": 2024}],
+        })
+
+        result = importer.import_from_excel(path)
+
+        assert result.risks_created == 2
+        assert store["risks"][0]["name"] == "2024"
+        assert result.influences_created == 1
+        assert store["influences"][0]["target_id"] == "r1"
+
+    def test_read_engine_prefers_calamine_and_falls_back(self, tmp_path):
+        """calamine is used when installed; without it the default reader gives the same import."""
+        from services.import_service import _excel_read_engine
+
+        pytest.importorskip("python_calamine")
+        assert _excel_read_engine() == "calamine"
+        path = self._write_workbook(tmp_path, self._core_sheets())
+
+        importer, with_calamine = self._make_importer()
+        importer.import_from_excel(path)
+
+        with patch.dict("sys.modules", {"python_calamine": None}):
+            assert _excel_read_engine() is None
+            importer, with_default = self._make_importer()
+            importer.import_from_excel(path)
+
+        assert with_calamine == with_default
+
+    def test_independent_sheets_are_imported_concurrently(self, tmp_path):
+        """Risk and mitigation creation overlap instead of running back to back."""
+        import threading
+
+        importer, _ = self._make_importer()
+        risk_started, mitigation_started = threading.Event(), threading.Event()
+        create_risk, create_mitigation = importer.create_risk, importer.create_mitigation
+
+        def slow_create_risk(**kwargs):
+            risk_started.set()
+            assert mitigation_started.wait(timeout=5)
+            return create_risk(**kwargs)
+
+        def slow_create_mitigation(**kwargs):
+            mitigation_started.set()
+            assert risk_started.wait(timeout=5)
+            return create_mitigation(**kwargs)
+
+        importer.create_risk = slow_create_risk
+        importer.create_mitigation = slow_create_mitigation
+        result = importer.import_from_excel(self._write_workbook(tmp_path, self._core_sheets()))
+
+        assert not result.errors
+        assert (result.risks_created, result.mitigations_created) == (2, 1)
+        assert result.mitigates_created == 1
+
+    @pytest.mark.parametrize("raw, expected", [
+        ("['Programme', 'Supply Chain']", ["Programme", "Supply Chain"]),
+        ('["A", "B",]', ["A", "B"]),
+        ("['it\\'s']", ["it's"]),
+        ("[1, 2]", [1, 2]),
+        ("Technical, Safety", ["Technical", "Safety"]),
+        ("Programme", ["Programme"]),
+        ("[]", []),
+        ("[Programme, Safety]", ["Programme", "Safety"]),
+        ("['Programme'", ["Programme"]),
+    ])
+    def test_parse_categories_formats(self, raw, expected):
+        """List literals (fast path or literal_eval) and comma lists parse alike."""
+        importer, _ = self._make_importer()
+        parsed = importer._parse_categories(raw)
+        assert parsed == expected
+        parsed.append("mutated")
+        assert importer._parse_categories(raw) == expected
+
+    def test_activation_dates_are_passed_as_iso_strings(self, tmp_path):
+        """Real date cells become ISO strings; text dates pass through; blanks are None."""
+        import datetime as dt
+
+        importer, store = self._make_importer()
+        path = self._write_workbook(tmp_path, {
+            "Risks": [
+                {"name": "R1", "level": "Business", "activation_decision_date": dt.datetime(2025, 3, 4, 5, 6, 7)},
+                {"name": "R2", "level": "Business", "activation_decision_date": None},
+            ],
+            "Mitigations": [{"name": "M1"}],
+        })
+        importer.import_from_excel(path)
+
+        mixed = self._write_workbook(tmp_path, {
+            "Risks": [
+                {"name": "R3", "level": "Business", "activation_decision_date": dt.datetime(2025, 1, 2)},
+                {"name": "R4", "level": "Business", "activation_decision_date": "Q3 review"},
+            ],
+        })
+        importer.import_from_excel(mixed)
+
+        dates = [r["activation_decision_date"] for r in store["risks"]]
+        assert dates == ["2025-03-04T05:06:07", None, "2025-01-02T00:00:00", "Q3 review"]
+
+    def test_relationship_endpoints_prefer_exported_ids(self, tmp_path):
+        """Exported IDs win over names; unresolved endpoints are skipped with a warning."""
+        importer, store = self._make_importer()
+        result = importer.import_from_excel(self._write_workbook(tmp_path, {
+            "Risks": [
+                {"name": "R1", "level": "Business"},
+                {"name": "R2", "level": "Business"},
+            ],
+            "Influences": [
+                {"source_name": "R1", "target_name": "R2", "source_id": "ext-1", "target_id": None},
+                {"source_name": "Ghost", "target_name": "R2", "source_id": None, "target_id": None},
+            ],
+            "Mitigations": [{"name": "M1"}],
+            "Mitigates": [
+                {"mitigation_name": "M1", "risk_name": "R2", "mitigation_id": None, "risk_id": None},
+                {"mitigation_name": "M1", "risk_name": "Ghost", "mitigation_id": None, "risk_id": None},
+            ],
+        }))
+
+        assert [(i["source_id"], i["target_id"]) for i in store["influences"]] == [("ext-1", "r2")]
+        assert [(m["mitigation_id"], m["risk_id"]) for m in store["mitigates"]] == [("m1", "r2")]
+        assert "Influence Row 3: Risk not found, skipped" in result.warnings
+        assert "Mitigates Row 3: Entity not found, skipped" in result.warnings
+        assert (result.influences_skipped, result.mitigates_skipped) == (1, 1)
+
+    def test_missing_sheets_are_skipped_with_a_warning(self, tmp_path):
+        """Absent core sheets are logged once and never surface as errors."""
+        importer, store = self._make_importer()
+        result = importer.import_from_excel(self._write_workbook(tmp_path, {
+            "Risks": [{"name": "R1", "level": "Business"}],
+        }))
+
+        assert not result.errors
+        assert result.risks_created == 1
+        for sheet in ("Influences", "Mitigations", "Mitigates"):
+            assert any(f"WARNING: No '{sheet}' sheet found" in line for line in result.logs)
+
+    def test_existing_and_repeated_rows_are_counted_as_skipped(self, tmp_path):
+        """Rows already in the DB or repeated in the sheet are skipped, not created."""
+        importer, store = self._make_importer()
+        store["risks"].append({"id": "db1", "name": "R0"})
+        importer.get_all_influences = MagicMock(return_value=[{"source_id": "db1", "target_id": "r2"}])
+        result = importer.import_from_excel(self._write_workbook(tmp_path, {
+            "Risks": [
+                {"name": "R0", "level": "Business"},
+                {"name": "R1", "level": "Business"},
+                {"name": "R1", "level": "Business"},
+            ],
+            "Influences": [
+                {"source_name": "R0", "target_name": "R1"},
+                {"source_name": "R1", "target_name": "R0"},
+                {"source_name": "R1", "target_name": "R0"},
+            ],
+        }))
+
+        assert (result.risks_created, result.risks_skipped) == (1, 2)
+        assert (result.influences_created, result.influences_skipped) == (1, 2)
+        assert [(i["source_id"], i["target_id"]) for i in store["influences"]] == [("r2", "db1")]
+
+    @pytest.mark.parametrize("verbose", [False, True])
+    def test_per_row_created_lines_only_when_verbose(self, tmp_path, verbose):
+        """Default imports keep the summary but no per-row 'Created ...' lines."""
+        importer, _ = self._make_importer()
+        result = importer.import_from_excel(
+            self._write_workbook(tmp_path, self._core_sheets()), verbose=verbose
+        )
+
+        created_lines = [line for line in result.logs if "DEBUG: Created " in line]
+        assert len(created_lines) == (5 if verbose else 0)
+        assert any("Risks: 2 created, 2 skipped" in line for line in result.logs)
+
+    def test_optional_fields_are_normalized_per_column(self, tmp_path):
+        """Blanks become ''/None, bad numbers the default, severity falls back to impact."""
+        importer, store = self._make_importer()
+        importer.import_from_excel(self._write_workbook(tmp_path, {
+            "Risks": [
+                {"name": "R1", "level": "Business", "probability": "n/a", "severity": None,
+                 "impact": 3, "owner": None, "subtype": None},
+                {"name": "R2", "level": "Business", "probability": 2, "severity": 4,
+                 "impact": 1, "owner": "Ops", "subtype": "Cyber"},
+            ],
+            "Influences": [
+                {"source_name": "R1", "target_name": "R2", "confidence": None, "description": None},
+            ],
+        }))
+
+        r1, r2 = store["risks"]
+        assert (r1["probability"], r1["severity"], r1["owner"], r1["subtype"]) == (None, 3.0, "", None)
+        assert (r2["probability"], r2["severity"], r2["owner"], r2["subtype"]) == (2.0, 4.0, "Ops", "Cyber")
+        influence = store["influences"][0]
+        assert (influence["confidence"], influence["description"]) == (0.8, "")
+
+    def test_blank_categories_warn_once_per_row_and_default(self, tmp_path):
+        """Blank categories default to Programme with one batched warning per row."""
+        importer, store = self._make_importer()
+        result = importer.import_from_excel(self._write_workbook(tmp_path, {
+            "Risks": [
+                {"name": "R1", "level": "Business", "categories": None},
+                {"name": "R2", "level": "Business", "categories": "Safety"},
+            ],
+        }))
+
+        assert [r["categories"] for r in store["risks"]] == [["Programme"], ["Safety"]]
+        assert [w for w in result.warnings if "categories" in w] == [
+            "Row 2 (R1): Invalid categories, defaulting"
+        ]
@@ -12,6 +12,12 @@ from services.influence_analysis import (
     CriticalPath,
     Bottleneck,
     RiskCluster,
+    LEVEL_NONE,
+    LEVEL_OTHER,
+    LEVEL_BUSINESS,
+    LEVEL_STRATEGIC,
+    LEVEL_OPERATIONAL,
+    _top_rounded,
 )
 
 
@@ -130,6 +136,16 @@ class TestInfluenceAnalyzerInit:
         assert len(analyzer.risks) == 3
         assert len(analyzer.risk_dict) == 3
 
+    def test_risks_are_indexed_without_copying(self, sample_risk_network):
+        """risk_dict shares the input risk dictionaries."""
+        analyzer = InfluenceAnalyzer(
+            risks=sample_risk_network["risks"],
+            influences=sample_risk_network["influences"]
+        )
+
+        for risk in sample_risk_network["risks"]:
+            assert analyzer.risk_dict[risk["id"]] is risk
+
 
 class TestInfluenceAnalyzerAdjacency:
     """Tests for adjacency list building."""
@@ -154,6 +170,61 @@ class TestInfluenceAnalyzerAdjacency:
         # Incoming adjacency should be populated
         assert isinstance(analyzer.incoming, dict)
 
+    def test_csr_arrays_group_edges_by_node(self):
+        """CSR slices hold each node's edges in input order; unknown ids get trailing indices."""
+        analyzer = InfluenceAnalyzer(
+            risks=[
+                {"id": "a", "name": "A", "level": "Operational"},
+                {"id": "b", "name": "B", "level": "Business"},
+            ],
+            influences=[
+                {"source_id": "b", "target_id": "a", "strength": "Weak"},
+                {"source_id": "a", "target_id": "b", "strength": "Strong", "confidence": 0.5},
+                {"source_id": "a", "target_id": "x"},
+            ],
+        )
+
+        assert analyzer.node_ids == ["a", "b", "x"]
+        assert analyzer.n_risks == 2
+        assert analyzer.out_indptr.tolist() == [0, 2, 3, 3]
+        assert analyzer.out_nbr.tolist() == [1, 2, 0]
+        assert analyzer.out_score.tolist() == [1.5, 1.6, 0.8]
+        assert analyzer.in_indptr.tolist() == [0, 1, 2, 3]
+        assert analyzer.outgoing["a"] == [("b", 1.5, "INFLUENCES"), ("x", 1.6, "INFLUENCES")]
+        assert analyzer.incoming["x"] == [("a", 1.6, "INFLUENCES")]
+
+    @pytest.mark.parametrize("influence, expected", [
+        ({"strength": "Critical", "confidence": 1.0}, 4.0),
+        ({"strength": "Unheard-of", "confidence": 0.5}, 1.0),
+        ({"strength": None}, 1.6),
+        ({"strength": "Weak", "confidence": 0}, 0.8),
+        ({"confidence": None}, 1.6),
+    ])
+    def test_edge_scores_from_strength_and_confidence(self, influence, expected):
+        """Unknown strengths score 2; missing or falsy confidences count as 0.8."""
+        analyzer = InfluenceAnalyzer(
+            risks=[{"id": "a", "name": "A", "level": "Operational"}],
+            influences=[{"source_id": "a", "target_id": "b", **influence}],
+        )
+
+        assert analyzer.out_score.tolist() == [pytest.approx(expected)]
+
+    def test_level_codes_per_node(self):
+        """Known levels get their own code; other levels and non-risk nodes don't."""
+        analyzer = InfluenceAnalyzer(
+            risks=[
+                {"id": "b", "name": "B", "level": "Business"},
+                {"id": "s", "name": "S", "level": "Strategic"},
+                {"id": "o", "name": "O", "level": "Operational"},
+                {"id": "t", "name": "T", "level": "Tactical"},
+            ],
+            influences=[{"source_id": "o", "target_id": "x"}],
+        )
+
+        assert analyzer.level_code.tolist() == [
+            LEVEL_BUSINESS, LEVEL_STRATEGIC, LEVEL_OPERATIONAL, LEVEL_OTHER, LEVEL_NONE,
+        ]
+
 
 class TestInfluenceAnalyzerAnalyze:
     """Tests for the main analyze method."""
@@ -215,6 +286,45 @@ class TestInfluenceAnalyzerPropagators:
                 assert propagators[i]["score"] >= propagators[i + 1]["score"]
 
 
+    def test_propagator_counts_each_reached_risk_once(self):
+        """Cycles and diamonds don't double count reached risks."""
+        analyzer = InfluenceAnalyzer(
+            risks=[{"id": i, "name": i.upper(), "level": "Operational"} for i in "abcd"],
+            influences=[
+                {"source_id": "a", "target_id": "b"},
+                {"source_id": "a", "target_id": "c"},
+                {"source_id": "b", "target_id": "d"},
+                {"source_id": "c", "target_id": "d"},
+                {"source_id": "d", "target_id": "a"},
+            ],
+        )
+
+        reached = {p["id"]: p["risks_reached"] for p in analyzer.get_top_propagators(limit=4)}
+        assert reached == {"a": 3, "b": 3, "c": 3, "d": 3}
+
+
+    def test_numba_kernel_matches_python_bfs(self):
+        """The parallel Numba BFS kernel reproduces both Python BFS passes exactly."""
+        pytest.importorskip("numba")
+        import random
+        rng = random.Random(7)
+        risks = [
+            {"id": f"r{i}", "name": f"Risk {i}", "level": rng.choice(["Strategic", "Operational"])}
+            for i in range(60)
+        ]
+        influences = [
+            {"source_id": f"r{rng.randrange(62)}", "target_id": f"r{rng.randrange(62)}",
+             "strength": rng.choice(["Critical", "Weak"]), "confidence": rng.choice([0.5, 0.8])}
+            for _ in range(150)
+        ]
+        analyzer = InfluenceAnalyzer(risks, influences)
+
+        assert analyzer._propagation_scores(use_numba=True) == \
+            analyzer._propagation_scores(use_numba=False)
+        assert analyzer._convergence_scores(use_numba=True) == \
+            analyzer._convergence_scores(use_numba=False)
+
+
 class TestInfluenceAnalyzerConvergence:
     """Tests for convergence points calculation."""
     
@@ -245,6 +355,34 @@ class TestInfluenceAnalyzerCriticalPaths:
         assert isinstance(paths, list)
 
 
+    def test_critical_paths_are_rebuilt_in_strength_order(self):
+        """Returned paths list nodes and edges from the operational source onwards."""
+        analyzer = InfluenceAnalyzer(
+            risks=[
+                {"id": "op", "name": "Op", "level": "Operational"},
+                {"id": "mid", "name": "Mid", "level": "Operational"},
+                {"id": "biz", "name": "Biz", "level": "Business"},
+            ],
+            influences=[
+                {"source_id": "op", "target_id": "mid", "strength": "Critical", "confidence": 1.0},
+                {"source_id": "mid", "target_id": "biz", "strength": "Strong", "confidence": 1.0},
+                {"source_id": "op", "target_id": "biz", "strength": "Weak", "confidence": 1.0},
+            ],
+        )
+
+        paths = analyzer.get_critical_paths(limit=5)
+
+        assert [[n["id"] for n in p["path"]] for p in paths] == [
+            ["op", "mid", "biz"], ["mid", "biz"], ["op", "biz"]
+        ]
+        assert [p["strength"] for p in paths] == [0.75, 0.75, 0.25]
+        assert paths[0]["edges"] == [
+            {"type": "INFLUENCES", "score": 4.0},
+            {"type": "INFLUENCES", "score": 3.0},
+        ]
+        assert [p["length"] for p in paths] == [2, 1, 1]
+
+
 class TestInfluenceAnalyzerBottlenecks:
     """Tests for bottleneck calculation."""
     
@@ -256,9 +394,78 @@ class TestInfluenceAnalyzerBottlenecks:
         )
         
         bottlenecks = analyzer.get_bottlenecks(limit=5)
-        
+
         assert isinstance(bottlenecks, list)
 
+    def test_parallel_influences_count_one_path(self):
+        """Duplicate edges between the same pair don't add extra paths."""
+        levels = {"a": "Operational", "m": "Operational", "n": "Operational", "z": "Business"}
+        analyzer = InfluenceAnalyzer(
+            risks=[{"id": i, "name": i.upper(), "level": lvl} for i, lvl in levels.items()],
+            influences=[
+                {"source_id": "a", "target_id": "m"},
+                {"source_id": "a", "target_id": "m"},
+                {"source_id": "a", "target_id": "n"},
+                {"source_id": "m", "target_id": "n"},
+                {"source_id": "m", "target_id": "z"},
+                {"source_id": "n", "target_id": "z"},
+            ],
+        )
+
+        bottlenecks = analyzer.get_bottlenecks(limit=5)
+
+        assert [(b["id"], b["path_count"]) for b in bottlenecks] == [("n", 3), ("m", 2)]
+        assert {b["total_paths"] for b in bottlenecks} == {6}
+        assert bottlenecks[0]["percentage"] == 50.0
+
+    def test_dag_counts_match_path_enumeration(self):
+        """The DAG dynamic programme counts the same paths as the DFS."""
+        levels = ["Operational", "Strategic", "Operational", "Business", "Operational",
+                  "Business", "Strategic", "Business"]
+        risks = [{"id": f"r{i}", "name": f"R{i}", "level": lvl} for i, lvl in enumerate(levels)]
+        edges = [(0, 1), (0, 2), (1, 2), (1, 3), (2, 4), (2, 3), (4, 5), (3, 5),
+                 (4, 6), (6, 7), (0, 6), (1, 8)]
+        analyzer = InfluenceAnalyzer(
+            risks=risks,
+            influences=[{"source_id": f"r{a}", "target_id": f"r{b}"} for a, b in edges],
+        )
+
+        assert analyzer._is_acyclic()
+        assert analyzer._bottleneck_counts_dp() == analyzer._bottleneck_counts_dfs()
+
+    def test_only_nodes_leading_to_business_are_searched(self):
+        """The reverse reachability pass marks nodes upstream of a Business risk."""
+        levels = {"a": "Operational", "b": "Operational", "c": "Operational", "z": "Business"}
+        analyzer = InfluenceAnalyzer(
+            risks=[{"id": i, "name": i.upper(), "level": lvl} for i, lvl in levels.items()],
+            influences=[
+                {"source_id": "a", "target_id": "x"},
+                {"source_id": "x", "target_id": "z"},
+                {"source_id": "z", "target_id": "c"},
+                {"source_id": "b", "target_id": "c"},
+            ],
+        )
+
+        # node order: a, b, c, z, then the non-risk x
+        assert analyzer._reaches_business == [True, False, False, True, True]
+        assert analyzer._bottleneck_counts_dfs() == ([0, 0, 0, 0], 1)
+
+    def test_cycles_fall_back_to_path_enumeration(self):
+        """Paths around a cycle are only counted while they stay simple."""
+        levels = {"a": "Operational", "b": "Operational", "z": "Business"}
+        analyzer = InfluenceAnalyzer(
+            risks=[{"id": i, "name": i.upper(), "level": lvl} for i, lvl in levels.items()],
+            influences=[
+                {"source_id": "a", "target_id": "b"},
+                {"source_id": "b", "target_id": "a"},
+                {"source_id": "b", "target_id": "z"},
+            ],
+        )
+
+        assert not analyzer._is_acyclic()
+        # a->b->z, b->z
+        assert analyzer._bottleneck_counts() == ([0, 1, 0], 2)
+
 
 class TestInfluenceAnalyzerClusters:
     """Tests for risk cluster calculation."""
@@ -274,6 +481,65 @@ class TestInfluenceAnalyzerClusters:
         
         assert isinstance(clusters, list)
 
+    def test_clusters_are_connected_components(self):
+        """Influences join risks regardless of direction; edges to unknown ids are ignored."""
+        analyzer = InfluenceAnalyzer(
+            risks=[{"id": i, "name": i.upper(), "level": "Operational"} for i in "abcdef"],
+            influences=[
+                {"source_id": "e", "target_id": "f"},
+                {"source_id": "a", "target_id": "b"},
+                {"source_id": "c", "target_id": "b"},
+                {"source_id": "b", "target_id": "c"},
+                {"source_id": "d", "target_id": "x"},
+            ],
+        )
+
+        clusters = analyzer.get_risk_clusters(limit=5)
+
+        assert [(c["nodes"], c["internal_edges"]) for c in clusters] == [
+            (["a", "b", "c"], 3),
+            (["e", "f"], 1),
+        ]
+        assert clusters[0]["density"] == 0.5
+
+    def test_equal_clusters_keep_influence_order(self):
+        """Ties are listed by first appearance in influences, members in risks order."""
+        analyzer = InfluenceAnalyzer(
+            risks=[{"id": f"r{i}", "name": f"R{i}", "level": "Operational"} for i in range(1, 7)],
+            influences=[
+                {"source_id": "r6", "target_id": "r5"},
+                {"source_id": "r1", "target_id": "r2"},
+                {"source_id": "r4", "target_id": "r3"},
+            ],
+        )
+
+        clusters = analyzer.get_risk_clusters(limit=5)
+
+        assert [c["nodes"] for c in clusters] == [["r5", "r6"], ["r1", "r2"], ["r3", "r4"]]
+
+    def test_cluster_primary_category_and_levels(self):
+        """The most common category wins, ties going to the first seen."""
+        analyzer = InfluenceAnalyzer(
+            risks=[
+                {"id": "a", "name": "A", "level": "Strategic", "categories": ["Produit", "Programme"]},
+                {"id": "b", "name": "B", "level": "Operational", "categories": ["Programme"]},
+                {"id": "c", "name": "C", "level": "Operational", "categories": []},
+                {"id": "x", "name": "X", "level": "Operational", "categories": ["Industriel", "Produit"]},
+                {"id": "y", "name": "Y", "level": "Business"},
+            ],
+            influences=[
+                {"source_id": "a", "target_id": "b"},
+                {"source_id": "c", "target_id": "b"},
+                {"source_id": "x", "target_id": "y"},
+            ],
+        )
+
+        clusters = analyzer.get_risk_clusters(limit=5)
+
+        assert [c["primary_category"] for c in clusters] == ["Programme", "Industriel"]
+        assert clusters[0]["levels"] == {"Strategic": 1, "Operational": 2}
+        assert clusters[1]["levels"] == {"Strategic": 0, "Operational": 1}
+
 
 class TestInfluenceAnalyzerHelpers:
     """Tests for helper methods."""
@@ -305,3 +571,39 @@ class TestInfluenceAnalyzerHelpers:
         ids = analyzer.get_high_priority_ids()
         
         assert isinstance(ids, (list, set))
+    
+    @pytest.mark.parametrize("limit, expected", [
+        (0, []),
+        (1, [1]),
+        (2, [1, 0]),
+        (3, [1, 0, 3]),
+        (10, [1, 0, 3, 2]),
+    ])
+    def test_top_rounded_ranks_on_rounded_keys(self, limit, expected):
+        """Keys equal once rounded keep input order, like a stable sort on round()."""
+        raw = [0.96, 1.2, 0.2, 1.04]  # 1.0, 1.2, 0.2, 1.0
+
+        assert _top_rounded(limit, list(range(4)), raw.__getitem__, 1) == expected
+
+    def test_repeated_analyses_are_computed_once(self, sample_risk_network):
+        """analyze() then get_high_priority_ids() reuses cached results per limit."""
+        from unittest.mock import patch
+
+        analyzer = InfluenceAnalyzer(
+            risks=sample_risk_network["risks"],
+            influences=sample_risk_network["influences"]
+        )
+
+        with patch.object(
+            analyzer, "_propagation_scores", wraps=analyzer._propagation_scores
+        ) as propagation:
+            first = analyzer.analyze()
+            analyzer.analyze()
+            analyzer.get_high_priority_ids()
+            analyzer.get_high_priority_ids()
+
+        # One pass for limit=5 (analyze) and one for limit=10 (the *_ids helpers)
+        assert propagation.call_count == 2
+        # Callers get their own list, the cache is unaffected
+        first["top_propagators"].clear()
+        assert len(analyzer.get_top_propagators()) == len(sample_risk_network["risks"])
@@ -10,7 +10,11 @@ from services.mitigation_analysis import (
     CoverageStats,
     RiskMitigationSummary,
     analyze_mitigation_coverage,
+    STATUS_OTHER,
+    STATUS_IMPLEMENTED,
+    STATUS_PROPOSED,
 )
+from config.settings import EFFECTIVENESS_VALUES
 
 
 class TestCoverageStats:
@@ -128,6 +132,27 @@ class TestMitigationAnalyzerMappings:
         assert mit_risks[0]["risk_id"] == "strat-001"
 
 
+    def test_relationship_status_codes(self):
+        """Statuses come from the mitigation; unknown mitigations and statuses are STATUS_OTHER."""
+        analyzer = MitigationAnalyzer(
+            risks=[{"id": "r", "name": "R", "level": "Operational"}],
+            mitigations=[
+                {"id": "m1", "status": "Implemented"},
+                {"id": "m2", "status": "In Progress"},
+                {"id": "m3", "status": "Deferred"},
+            ],
+            mitigates_relationships=[
+                {"risk_id": "r", "mitigation_id": mit_id} for mit_id in ("m1", "m2", "m3", "m4")
+            ],
+        )
+
+        assert analyzer.rel_status.tolist() == [
+            STATUS_IMPLEMENTED, STATUS_PROPOSED, STATUS_OTHER, STATUS_OTHER,
+        ]
+        assert analyzer.rel_is_implemented.tolist() == [True, False, False, False]
+        assert analyzer.risk_to_mitigations["r"][3]["status"] == "Unknown"
+
+
 class TestMitigationAnalyzerAnalyze:
     """Tests for the main analyze method."""
     
@@ -176,6 +201,70 @@ class TestMitigationAnalyzerAnalyze:
         assert stats["unmitigated_risks"] == 1
 
 
+    def test_analyze_totals_and_exposure_order(self):
+        """Per-risk totals come from the relationships; buckets list highest exposure first."""
+        analyzer = MitigationAnalyzer(
+            risks=[
+                {"id": "a", "name": "A", "level": "Operational", "exposure": 2},
+                {"id": "b", "name": "B", "level": "Operational", "exposure": 9},
+                {"id": "c", "name": "C", "level": "Strategic", "exposure": None},
+                {"id": "d", "name": "D", "level": "Operational", "exposure": 9},
+                {"id": "e", "name": "E", "level": "Strategic", "exposure": 5},
+            ],
+            mitigations=[
+                {"id": "m1", "status": "Implemented"},
+                {"id": "m2", "status": "In Progress"},
+                {"id": "m3", "status": "Proposed"},
+            ],
+            mitigates_relationships=[
+                {"risk_id": "e", "mitigation_id": "m1", "effectiveness": "High"},
+                {"risk_id": "e", "mitigation_id": "m2", "effectiveness": "Bogus"},
+                {"risk_id": "e", "mitigation_id": "m3"},
+                {"risk_id": "a", "mitigation_id": "m2", "effectiveness": "Low"},
+                {"risk_id": "zz", "mitigation_id": "m1", "effectiveness": "Critical"},
+            ],
+        )
+
+        result = analyzer.analyze()
+        summary = {s["id"]: s for s in result["risk_mitigation_summary"]}
+
+        assert [s["id"] for s in result["risk_mitigation_summary"]] == ["a", "b", "c", "d", "e"]
+        # Unknown effectiveness labels score 2, missing ones count as Medium
+        expected_score = EFFECTIVENESS_VALUES["High"] + 2 + EFFECTIVENESS_VALUES["Medium"]
+        assert (summary["e"]["mitigation_count"], summary["e"]["mitigation_score"]) == (3, expected_score)
+        assert (summary["e"]["implemented_count"], summary["e"]["proposed_count"]) == (1, 2)
+        assert summary["e"]["coverage_status"] == "well_covered"
+        assert summary["a"]["coverage_status"] == "proposed_only"
+        assert [s["id"] for s in result["unmitigated_risks"]] == ["b", "d", "c"]
+        assert [s["id"] for s in result["partially_mitigated_risks"]] == ["a"]
+
+
+    def test_analyze_is_computed_once(self, sample_risk_network):
+        """Repeated analyze() and get_coverage_gaps() calls reuse one result."""
+        from unittest.mock import patch
+
+        analyzer = MitigationAnalyzer(
+            risks=sample_risk_network["risks"],
+            mitigations=sample_risk_network["mitigations"],
+            mitigates_relationships=sample_risk_network["mitigates_relationships"]
+        )
+
+        with patch.object(
+            analyzer, "_compute_all_derived", wraps=analyzer._compute_all_derived
+        ) as build:
+            first = analyzer.analyze()
+            second = analyzer.analyze()
+            gaps = analyzer.get_coverage_gaps()
+
+        # One pass builds both analyze() and get_coverage_gaps()
+        assert build.call_count == 1
+        assert second == first
+        assert gaps == analyzer.get_coverage_gaps()
+        # Callers get their own top-level dict, the cache is unaffected
+        first.clear()
+        assert "coverage_stats" in analyzer.analyze()
+
+
 class TestMitigationAnalyzerRiskDetails:
     """Tests for get_risk_details method."""
     
@@ -207,6 +296,65 @@ class TestMitigationAnalyzerRiskDetails:
         
         assert details is None
 
+    def test_risk_details_influence_info(self, sample_risk_network):
+        """The first influence record per id is reported."""
+        analyzer = MitigationAnalyzer(
+            risks=sample_risk_network["risks"],
+            mitigations=sample_risk_network["mitigations"],
+            mitigates_relationships=sample_risk_network["mitigates_relationships"],
+            influence_analysis={
+                "top_propagators": [
+                    {"id": "op-001", "score": 10, "tpos_reached": 2},
+                    {"id": "op-001", "score": 3, "tpos_reached": 1},
+                ],
+                "convergence_points": [
+                    {"id": "op-001", "score": 5, "source_count": 4, "node_type": "TPO"},
+                ],
+                "bottlenecks": [{"id": "strat-001", "percentage": 50}],
+            }
+        )
+
+        info = analyzer.get_risk_details("op-001")["influence_info"]
+
+        assert info == {
+            "is_top_propagator": True,
+            "propagation_score": 10,
+            "tpos_reached": 2,
+            "is_convergence_point": True,
+            "convergence_score": 5,
+            "source_count": 4,
+        }
+        assert analyzer.convergence_ids == set()
+        assert analyzer.get_risk_details("strat-001")["influence_info"] == {
+            "is_bottleneck": True,
+            "path_percentage": 50,
+        }
+
+    def test_risk_details_and_gaps_share_relationship_totals(self):
+        """Effectiveness scores are counted once per relationship; gaps only sum implemented ones."""
+        analyzer = MitigationAnalyzer(
+            risks=[{"id": "s", "name": "S", "level": "Strategic", "exposure": 4}],
+            mitigations=[
+                {"id": "m1", "status": "Implemented"},
+                {"id": "m2", "status": "Proposed"},
+            ],
+            mitigates_relationships=[
+                {"risk_id": "s", "mitigation_id": "m1", "effectiveness": "Low"},
+                {"risk_id": "s", "mitigation_id": "m2", "effectiveness": "Critical"},
+            ],
+        )
+
+        details = analyzer.get_risk_details("s")
+        gaps = analyzer.get_coverage_gaps()
+
+        assert details["total_effectiveness_score"] == (
+            EFFECTIVENESS_VALUES["Low"] + EFFECTIVENESS_VALUES["Critical"]
+        )
+        assert details["implemented_count"] == 1
+        assert [g["id"] for g in gaps["strategic_gaps"]] == ["s"]
+        assert gaps["strategic_gaps"][0]["implemented_effectiveness"] == EFFECTIVENESS_VALUES["Low"]
+        assert "_eff_score" not in details["mitigations"][0]
+
 
 class TestMitigationAnalyzerMitigationDetails:
     """Tests for get_mitigation_details method."""
@@ -239,6 +387,21 @@ class TestMitigationAnalyzerMitigationDetails:
         
         assert details is None
 
+    def test_mitigation_details_leave_inputs_untouched(self, sample_risk_network):
+        """Inputs are indexed without copies and never mutated."""
+        analyzer = MitigationAnalyzer(
+            risks=sample_risk_network["risks"],
+            mitigations=sample_risk_network["mitigations"],
+            mitigates_relationships=sample_risk_network["mitigates_relationships"]
+        )
+        risk = next(r for r in sample_risk_network["risks"] if r["id"] == "strat-001")
+
+        details = analyzer.get_mitigation_details("mit-001")
+
+        assert analyzer.risk_dict["strat-001"] is risk
+        assert "effectiveness" in details["risks"][0]
+        assert "effectiveness" not in risk
+
 
 class TestMitigationAnalyzerCoverageGaps:
     """Tests for get_coverage_gaps method."""
@@ -281,6 +444,20 @@ class TestMitigationAnalyzerCoverageGaps:
         # or if it doesn't meet threshold criteria, at least the test should pass
         assert isinstance(all_gap_ids, set)
 
+    def test_coverage_gaps_sorted_by_exposure(self):
+        """Gap lists are ordered by descending exposure, ties keep input order."""
+        risks = [
+            {"id": "R1", "name": "A", "level": "Operational", "exposure": 4.0},
+            {"id": "R2", "name": "B", "level": "Operational", "exposure": 9.0},
+            {"id": "R3", "name": "C", "level": "Operational", "exposure": 9.0},
+            {"id": "R4", "name": "D", "level": "Operational", "exposure": 1.0},
+        ]
+        analyzer = MitigationAnalyzer(risks=risks, mitigations=[], mitigates_relationships=[])
+        
+        critical = analyzer.get_coverage_gaps()["critical_unmitigated"]
+        
+        assert [g["id"] for g in critical] == ["R2", "R3"]
+
 
 class TestMitigationAnalyzerCoverageStatus:
     """Tests for _get_coverage_status method."""
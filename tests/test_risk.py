@@ -61,6 +61,17 @@ class TestRiskPostInit:
         risk = Risk(id="test-001", name="Test Risk", level="Business", origin="Legacy")
         assert risk.origin == RiskOrigin.LEGACY
     
+    def test_enum_conversion_returns_members(self):
+        """Test that converted values are the enum members themselves."""
+        risk = Risk(id="test-001", name="Test Risk", level="Operational", status=RiskStatus.CLOSED)
+        assert risk.level is RiskLevel.OPERATIONAL
+        assert risk.status is RiskStatus.CLOSED
+    
+    def test_unknown_level_raises(self):
+        """Test that an unknown level string still raises ValueError."""
+        with pytest.raises(ValueError):
+            Risk(id="test-001", name="Test Risk", level="Strategic")
+    
     def test_exposure_calculation(self):
         """Test that exposure is auto-calculated if not provided."""
         risk = Risk(
@@ -181,6 +192,18 @@ class TestRiskMethods:
         assert result["status"] == "Active"
         assert result["categories"] == sample_risk_data["categories"]
     
+    def test_to_dict_key_order_and_enum_strings(self):
+        """Test to_dict keeps field order and serializes every enum as str."""
+        risk = Risk(id="1", name="R", level="Operational", status="Closed", origin="Legacy")
+        
+        result = risk.to_dict()
+        
+        assert list(result)[:6] == ["id", "name", "level", "origin", "categories", "status"]
+        assert result["level"] == "Operational"
+        assert result["origin"] == "Legacy"
+        assert result["status"] == "Closed"
+        assert type(result["level"]) is str
+    
     def test_from_dict(self, sample_risk_data):
         """Test from_dict deserialization."""
         risk = Risk.from_dict(sample_risk_data)
@@ -207,6 +230,24 @@ class TestRiskMethods:
         
         assert risk.id == sample_risk_data["id"]
         assert risk.name == sample_risk_data["name"]
+    
+    def test_from_neo4j_record_fast_matches_regular_path(self, sample_risk_data):
+        """Test the fast record path builds the same Risk as the regular one."""
+        fast = Risk.from_neo4j_record_fast(sample_risk_data)
+        
+        assert fast == Risk.from_neo4j_record(sample_risk_data)
+        assert fast.level is RiskLevel.BUSINESS
+    
+    def test_from_neo4j_record_fast_computes_exposure(self):
+        """Test the fast record path fills exposure and rejects unknown enums."""
+        risk = Risk.from_neo4j_record_fast(
+            {"id": "r1", "name": "R", "level": "Operational", "probability": 2.0, "severity": 3.0}
+        )
+        
+        assert risk.exposure == 6.0
+        assert risk.level is RiskLevel.OPERATIONAL
+        with pytest.raises(ValueError):
+            Risk.from_neo4j_record_fast({"id": "r2", "level": "Strategic"})
 
 
 class TestRiskRoundTrip: